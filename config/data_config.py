@@ -35,6 +35,7 @@ DATA_DIR = "data"
 RAW_DATA_DIR = f"{DATA_DIR}/raw"
 PROCESSED_DATA_DIR = f"{DATA_DIR}/processed"
 TICK_DATA_DIR = f"{DATA_DIR}/tick_data"
+KLINE_CACHE_DIR = f"{RAW_DATA_DIR}/.cache"  # Closed kline batches (Parquet)
 
 # Data Collection Parameters
 DEFAULT_LOOKBACK_DAYS = 30  # How many days of historical data to fetch
@@ -43,6 +44,10 @@ MAX_ROWS_PER_REQUEST = 1000  # Binance limit
 # Data Processing Parameters
 OUTLIER_THRESHOLD = 5.0  # Standard deviations for outlier detection
 MIN_VOLUME_THRESHOLD = 0.0001  # Minimum volume to keep data point
+CSV_CHUNKSIZE = 200_000  # Rows per chunk when reading full CSV files
+FLOAT32_MAX_PRICE = 2 ** 17  # Keep float64 prices above this (float32 loses cents past 131072)
+DIRECT_IO_MIN_BYTES = 64 * 1024 * 1024  # Smallest frame saved with O_DIRECT
+DIRECT_IO_ALIGNMENT = 4096  # O_DIRECT buffer/length alignment (bytes)
 
 # Tick Data Generation Parameters
 TICK_GENERATION_METHOD = "poisson"  # Method to generate synthetic ticks
@@ -91,6 +96,7 @@ LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 # API Rate Limiting
 REQUEST_DELAY = 0.1  # Seconds between requests to avoid rate limits
 MAX_RETRIES = 3      # Number of retries for failed requests
+MAX_CONCURRENT_REQUESTS = 8  # Batches fetched in parallel (async fetcher)
 
 # Data Quality Checks
 CHECK_FOR_GAPS = True
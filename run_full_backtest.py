@@ -3,6 +3,7 @@ Full Backtest on ALL Real Binance Data
 Proves we're using real market data
 """
 
+import logging
 import sys
 from pathlib import Path
 import os
@@ -12,6 +13,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 from src.backtesting.backtester import Backtester
 from src.backtesting.report_generator import ReportGenerator
 from src.data.data_processor import DataProcessor
+from config.data_config import LOG_LEVEL, LOG_FORMAT
 
 
 def run_full_backtest():
@@ -24,16 +26,27 @@ def run_full_backtest():
     # Load data
     processor = DataProcessor()
     data_dir = Path("data/raw")
-    csv_files = list(data_dir.glob("*.csv"))
+    data_files = [*data_dir.glob("*.csv"), *data_dir.glob("*.parquet")]
     
-    if not csv_files:
+    if not data_files:
         print("❌ No data files found!")
         return
     
-    latest_file = max(csv_files, key=os.path.getctime)
+    latest_file = max(data_files, key=os.path.getctime)
+    
+    # Ask user how much data to use
+    print(f"\n💡 Options:")
+    print(f"   1. Quick test: 1,000 rows (~16 hours)")
+    print(f"   2. Medium test: 5,000 rows (~3.5 days)")
+    print(f"   3. Full backtest: ALL rows (~7 days)")
+    
+    choice = input("\nEnter choice (1/2/3) [default=2]: ").strip() or "2"
+    
+    # Only read the rows that will be used
+    nrows = {"1": 1000, "2": 5000}.get(choice)
     
     print(f"\n📂 Loading REAL Binance data from: {latest_file.name}")
-    data = processor.load_data(str(latest_file))
+    data = processor.load_data_cached(str(latest_file), nrows=nrows)
     
     print(f"\n📊 Data Summary:")
     print(f"   Total rows: {len(data):,}")
@@ -49,19 +62,9 @@ def run_full_backtest():
     print(f"   - Contains actual Bitcoin prices")
     print(f"   - Real trading volume and activity")
     
-    # Ask user how much data to use
-    print(f"\n💡 Options:")
-    print(f"   1. Quick test: 1,000 rows (~16 hours)")
-    print(f"   2. Medium test: 5,000 rows (~3.5 days)")
-    print(f"   3. Full backtest: ALL {len(data):,} rows (~7 days)")
-    
-    choice = input("\nEnter choice (1/2/3) [default=2]: ").strip() or "2"
-    
     if choice == "1":
-        data = data.head(1000)
         print(f"\n⚡ Using 1,000 rows for quick test")
     elif choice == "2":
-        data = data.head(5000)
         print(f"\n⚡ Using 5,000 rows for medium test")
     else:
         print(f"\n🚀 Using ALL {len(data):,} rows - this will take a few minutes!")
@@ -119,5 +122,6 @@ def run_full_backtest():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=LOG_LEVEL, format=LOG_FORMAT)
     run_full_backtest()
     
\ No newline at end of file
@@ -6,18 +6,51 @@ Replays historical data and simulates strategy execution
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+import contextlib
+import logging
+import os
 import sys
+import time
 from pathlib import Path
 
-# Add project root to path
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+# Optional: numba JIT for numeric kernels
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """Fallback no-op decorator when numba is not installed"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# Add project root to path only when run as a script; package imports
+# already resolve, and re-inserting it can import modules twice
+if not __package__:
+    project_root = Path(__file__).parent.parent.parent
+    sys.path.insert(0, str(project_root))
 
 from src.orderbook.orderbook import OrderBook
 from src.orderbook.matching_engine import MatchingEngine
 from src.strategies.market_maker import MarketMakerStrategy
 
+logger = logging.getLogger(__name__)
+
+# Price grid of the replay order book (ticks per unit of price, 100 = cents)
+PRICE_SCALE = 100
+
+
+@njit(cache=True)
+def _mark_to_market(cash, inventory, price, initial_cash, initial_inventory,
+                    portfolio_out, pnl_out):
+    """Compute portfolio value and total PnL for every bar"""
+    for i in range(len(price)):
+        portfolio_out[i] = cash[i] + inventory[i] * price[i]
+        pnl_out[i] = portfolio_out[i] - (initial_cash + initial_inventory * price[i])
+
 
 class Backtester:
     """
@@ -28,7 +61,8 @@ class Backtester:
     def __init__(self, 
                  data: pd.DataFrame,
                  initial_cash: float = 100000.0,
-                 transaction_fee_bps: float = 0.0):
+                 transaction_fee_bps: float = 0.0,
+                 seed: Optional[int] = None):
         """
         Initialize backtester
         
@@ -36,10 +70,12 @@ class Backtester:
             data: Historical OHLCV data
             initial_cash: Starting cash balance
             transaction_fee_bps: Transaction fees in basis points
+            seed: Seed for the simulated taker order flow (optional)
         """
         self.data = data.copy()
         self.initial_cash = initial_cash
         self.transaction_fee_bps = transaction_fee_bps
+        self.rng = np.random.default_rng(seed)
         
         # Prepare data
         self._prepare_data()
@@ -48,30 +84,64 @@ class Backtester:
         self.current_idx = 0
         self.is_running = False
         
-        # Results storage
-        self.equity_curve = []
+        # Results storage (equity curve as one preallocated array per column)
+        n = len(self.data)
+        self.eq_ts = self._cols['timestamp']
+        self.eq_portfolio = np.empty(n, dtype=np.float64)
+        self.eq_cash = np.empty(n, dtype=np.float64)
+        self.eq_inventory = np.empty(n, dtype=np.float64)
+        self.eq_pnl = np.empty(n, dtype=np.float64)
+        self.eq_price = np.empty(n, dtype=np.float64)
         self.trades = []
         self.positions = []
         
-        print(f"✅ Backtester initialized")
-        print(f"   Data points: {len(self.data)}")
-        print(f"   Date range: {self.data['timestamp'].min()} to {self.data['timestamp'].max()}")
-        print(f"   Initial cash: ${initial_cash:,.2f}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Backtester initialized: %d rows from %s to %s, cash=%.2f",
+                         len(self.data), self.data['timestamp'].min(),
+                         self.data['timestamp'].max(), initial_cash)
     
     def _prepare_data(self):
         """Prepare data for backtesting"""
         # Ensure timestamp column
         if 'open_time' in self.data.columns and 'timestamp' not in self.data.columns:
-            self.data['timestamp'] = pd.to_datetime(self.data['open_time'])
+            open_time = self.data['open_time']
+            if not pd.api.types.is_datetime64_any_dtype(open_time):
+                open_time = pd.to_datetime(open_time)
+            self.data['timestamp'] = open_time
         
-        # Sort by time
-        self.data = self.data.sort_values('timestamp').reset_index(drop=True)
+        # Sort by time (klines are usually already in order)
+        if not self.data['timestamp'].is_monotonic_increasing:
+            self.data = self.data.sort_values('timestamp').reset_index(drop=True)
+        elif not self.data.index.equals(pd.RangeIndex(len(self.data))):
+            self.data = self.data.reset_index(drop=True)
+        
+        # Prices stay float64 (orders and PnL are priced from them); float32
+        # input, e.g. from optimize_dtypes, is snapped back onto the cent grid
+        for col in ['open', 'high', 'low', 'close']:
+            prices = self.data[col]
+            if prices.dtype == np.float32:
+                self.data[col] = np.rint(prices.to_numpy(dtype=np.float64) * PRICE_SCALE) / PRICE_SCALE
+            else:
+                self.data[col] = prices.astype(np.float64, copy=False)
         
         # Add mid price if not present
         if 'mid_price' not in self.data.columns:
-            self.data['mid_price'] = (self.data['high'] + self.data['low']) / 2
+            mid_price = np.add(self.data['high'].to_numpy(), self.data['low'].to_numpy())
+            mid_price *= 0.5
+            self.data['mid_price'] = mid_price
+        else:
+            self.data['mid_price'] = self.data['mid_price'].astype(np.float64, copy=False)
+        
+        # Volume is never priced from, so float32 is enough
+        self.data['volume'] = self.data['volume'].astype(np.float32, copy=False)
         
-        print(f"✅ Data prepared for backtesting")
+        # Cache columns as NumPy arrays for the replay loop
+        self._cols = {
+            col: self.data[col].to_numpy()
+            for col in ['timestamp', 'open', 'high', 'low', 'close', 'volume', 'mid_price']
+        }
+        
+        logger.debug("Data prepared for backtesting")
     
     def run_backtest(self, 
                      strategy_params: Dict,
@@ -94,18 +164,20 @@ class Backtester:
         print(f"Data points: {len(self.data)}")
         
         # Create order book and engine
-        orderbook = OrderBook("BTCUSDT")
+        orderbook = OrderBook("BTCUSDT", price_scale=PRICE_SCALE)
         engine = MatchingEngine(orderbook, latency_ms=1.0)
         
         # Initialize order book with first prices
-        first_row = self.data.iloc[0]
-        initial_price = first_row['close']
+        initial_price = float(self._cols['close'][0])
         
         # Add initial liquidity
-        for i in range(5):
-            offset = (i + 1) * 20
-            engine.submit_limit_order("BUY", initial_price - offset, 1.0, f"INIT_BID_{i}")
-            engine.submit_limit_order("SELL", initial_price + offset, 1.0, f"INIT_ASK_{i}")
+        offsets = np.arange(1, 6) * 20
+        engine.submit_limit_orders_batch(
+            sides=["BUY"] * 5 + ["SELL"] * 5,
+            prices=np.concatenate([initial_price - offsets, initial_price + offsets]),
+            quantities=[1.0] * 10,
+            trader_ids=[f"INIT_BID_{i}" for i in range(5)] + [f"INIT_ASK_{i}" for i in range(5)]
+        )
         
         # Create strategy
         strategy = MarketMakerStrategy(
@@ -114,6 +186,8 @@ class Backtester:
             base_spread_bps=strategy_params.get('base_spread_bps', 10.0),
             order_size=strategy_params.get('order_size', 0.1),
             max_inventory=strategy_params.get('max_inventory', 5.0),
+            requote_threshold=strategy_params.get('requote_threshold', 0.0),
+            min_requote_ms=strategy_params.get('min_requote_ms', 0.0),
             initial_cash=self.initial_cash
         )
         
@@ -121,79 +195,122 @@ class Backtester:
         
         # Run backtest
         print("\n🚀 Running backtest...")
-        start_time = datetime.now()
-        
-        for idx, row in self.data.iterrows():
-            # Create market state
-            market_state = {
-                'timestamp': row['timestamp'],
-                'open': row['open'],
-                'high': row['high'],
-                'low': row['low'],
-                'close': row['close'],
-                'volume': row['volume'],
-                'mid_price': row['mid_price'],
-                'best_bid': row['close'] - 5,  # Approximate
-                'best_ask': row['close'] + 5,
-                'spread': 10.0
-            }
+        start_time = time.perf_counter()
+        
+        # Python floats keep strategy cash/PnL arithmetic in float64
+        closes = self._cols['close'].tolist()
+        mid_array = self._cols['mid_price']
+        mid_prices = mid_array.tolist()
+        
+        # Bar times in ns: the strategy's requote throttle runs on market time
+        bar_ts = (pd.to_datetime(self.data['timestamp'], utc=True).dt.tz_localize(None)
+                  .to_numpy(dtype='datetime64[ns]').view(np.int64).tolist())
+        
+        # Bars without a usable mid price are not quoted (as in on_tick)
+        quotable = (np.isfinite(mid_array) & (mid_array != 0)).tolist()
+        
+        n = len(self.data)
+        
+        # Pre-sample the taker order flow (one event slot every 10 bars)
+        n_events = (n + 9) // 10
+        taker_trigger = self.rng.random(n_events) < 0.3
+        taker_is_buy = self.rng.random(n_events) < 0.5
+        taker_qty = self.rng.uniform(0.05, 0.15, n_events)
+        
+        # Inventory only changes on taker event bars, so quotes between
+        # events depend on mid price alone and are computed per segment
+        event_bars = np.flatnonzero(taker_trigger) * 10
+        segment_ends = np.union1d(event_bars, [n - 1]).tolist()
+        segment_idx = 0
+        segment_start = 0
+        segment_end = -1
+        
+        # Next bar index at which to report progress
+        next_progress_idx = progress_interval
+        
+        pnl_tracker = strategy.pnl_tracker
+        eq_cash = self.eq_cash
+        eq_inventory = self.eq_inventory
+        
+        for idx in range(n):
+            current_price = closes[idx]
+            
+            # Quote the next segment in one vectorized call
+            if idx > segment_end:
+                segment_start = idx
+                segment_end = segment_ends[segment_idx]
+                segment_idx += 1
+                bid_prices, ask_prices, bid_size, ask_size = strategy.quote_batch(
+                    mid_array[segment_start:segment_end + 1]
+                )
+                bid_prices = bid_prices.tolist()
+                ask_prices = ask_prices.tolist()
             
-            # Update strategy
-            strategy.on_tick(market_state)
+            # Update strategy quotes
+            if quotable[idx]:
+                offset = idx - segment_start
+                strategy.apply_quotes(bid_prices[offset], ask_prices[offset],
+                                      bid_size, ask_size, mid_prices[idx], bar_ts[idx])
             
             # Simulate some random market orders hitting our quotes
             if idx % 10 == 0:  # Every 10 bars
                 # Random chance of aggressive order
-                if np.random.random() < 0.3:
-                    is_buy = np.random.random() < 0.5
-                    qty = np.random.uniform(0.05, 0.15)
+                event = idx // 10
+                if taker_trigger[event]:
+                    is_buy = taker_is_buy[event]
+                    qty = taker_qty[event]
                     
-                    if is_buy and orderbook.best_ask:
-                        price = orderbook.best_ask * 1.001
-                        engine.submit_limit_order("BUY", price, qty, "TAKER")
-                    elif not is_buy and orderbook.best_bid:
-                        price = orderbook.best_bid * 0.999
-                        engine.submit_limit_order("SELL", price, qty, "TAKER")
+                    if is_buy:
+                        best_ask = orderbook.best_ask
+                        if best_ask:
+                            engine.submit_limit_order("BUY", best_ask * 1.001, qty, "TAKER")
+                    else:
+                        best_bid = orderbook.best_bid
+                        if best_bid:
+                            engine.submit_limit_order("SELL", best_bid * 0.999, qty, "TAKER")
                     
-                    # Process any trades
-                    for trade in orderbook.trades[-5:]:
-                        if trade.get('buyer') == 'MarketMaker' or trade.get('seller') == 'MarketMaker':
-                            strategy.on_trade(trade)
+                    # Process trades since the last check
+                    strategy.process_new_trades()
             
-            # Record equity
-            current_price = row['close']
-            pnl_snapshot = strategy.pnl_tracker.calculate_pnl(current_price)
-            
-            self.equity_curve.append({
-                'timestamp': row['timestamp'],
-                'portfolio_value': pnl_snapshot['portfolio_value'],
-                'cash': pnl_snapshot['cash'],
-                'inventory': pnl_snapshot['inventory'],
-                'total_pnl': pnl_snapshot['total_pnl'],
-                'price': current_price
-            })
+            # Record positions (marked to market after the loop)
+            eq_cash[idx] = pnl_tracker.cash
+            eq_inventory[idx] = pnl_tracker.inventory
             
             # Progress update
-            if idx % progress_interval == 0 and idx > 0:
-                progress = (idx / len(self.data)) * 100
-                elapsed = (datetime.now() - start_time).total_seconds()
+            if idx == next_progress_idx:
+                next_progress_idx += progress_interval
+                progress = (idx / n) * 100
+                elapsed = time.perf_counter() - start_time
                 print(f"  Progress: {progress:.1f}% | "
                       f"Time: {elapsed:.1f}s | "
                       f"Trades: {strategy.trades_executed} | "
-                      f"PnL: ${pnl_snapshot['total_pnl']:.2f}")
+                      f"PnL: ${pnl_tracker.cash + pnl_tracker.inventory * current_price - self.initial_cash:.2f}")
         
         strategy.stop()
         
+        # Mark positions to market
+        self.eq_price[:] = closes
+        _mark_to_market(self.eq_cash, self.eq_inventory, self.eq_price,
+                        pnl_tracker.initial_cash, pnl_tracker.initial_inventory,
+                        self.eq_portfolio, self.eq_pnl)
+        
         # Final results
-        elapsed_time = (datetime.now() - start_time).total_seconds()
+        elapsed_time = time.perf_counter() - start_time
         print(f"\n✅ Backtest completed in {elapsed_time:.1f}s")
         
-        final_price = self.data.iloc[-1]['close']
+        final_price = closes[-1]
         final_stats = strategy.get_comprehensive_statistics(final_price)
         
         results = {
             'strategy_stats': final_stats,
-            'equity_curve': pd.DataFrame(self.equity_curve),
+            'equity_curve': pd.DataFrame({
+                'timestamp': self.eq_ts,
+                'portfolio_value': self.eq_portfolio,
+                'cash': self.eq_cash,
+                'inventory': self.eq_inventory,
+                'total_pnl': self.eq_pnl,
+                'price': self.eq_price
+            }),
             'trades': strategy.pnl_tracker.trades,
             'execution_time': elapsed_time,
             'data_points': len(self.data),
@@ -236,6 +353,63 @@ class Backtester:
         print("="*70)
 
 
+# Per-process data for parameter sweeps (loaded once per worker)
+_worker_data = None
+
+
+def _init_sweep_worker(data_path: str):
+    """Load backtest data once in each sweep worker process"""
+    global _worker_data
+    from src.data.data_processor import DataProcessor
+    
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        _worker_data = DataProcessor().load_data_cached(data_path)
+
+
+def _run_sweep_task(params: Dict, initial_cash: float, seed: Optional[int]) -> Dict:
+    """Run a single backtest of a parameter sweep inside a worker"""
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        backtester = Backtester(data=_worker_data, initial_cash=initial_cash, seed=seed)
+        results = backtester.run_backtest(params, progress_interval=len(_worker_data) + 1)
+    
+    results['strategy_params'] = params
+    return results
+
+
+def run_param_grid(data_path: str,
+                   param_list: List[Dict],
+                   n_workers: Optional[int] = None,
+                   initial_cash: float = 100000.0,
+                   seed: Optional[int] = None) -> List[Dict]:
+    """
+    Run one backtest per parameter set in parallel worker processes
+    
+    Args:
+        data_path: Path to the historical data file (loaded once per worker)
+        param_list: List of strategy parameter dicts
+        n_workers: Number of worker processes (defaults to CPU count)
+        initial_cash: Starting cash balance for every run
+        seed: Seed for the simulated taker order flow (same for every run)
+        
+    Returns:
+        list: Backtest results, in the same order as param_list
+    """
+    print(f"\n🚀 Running {len(param_list)} backtests on {n_workers or os.cpu_count()} workers...")
+    
+    with ProcessPoolExecutor(max_workers=n_workers,
+                             initializer=_init_sweep_worker,
+                             initargs=(data_path,)) as executor:
+        futures = [executor.submit(_run_sweep_task, params, initial_cash, seed)
+                   for params in param_list]
+        results = [future.result() for future in futures]
+    
+    print(f"✅ Parameter sweep completed")
+    for result in results:
+        print(f"  {result['strategy_params']} -> {result['total_return_pct']:+.2f}%")
+    
+    return results
+
+
 def test_backtester():
     """Test the backtester with sample data"""
     print("="*70)
@@ -252,16 +426,16 @@ def test_backtester():
     from pathlib import Path
     
     data_dir = Path("data/raw")
-    csv_files = list(data_dir.glob("*.csv"))
+    data_files = [*data_dir.glob("*.csv"), *data_dir.glob("*.parquet")]
     
-    if not csv_files:
+    if not data_files:
         print("❌ No data files found! Run data_fetcher.py first.")
         return
     
-    latest_file = max(csv_files, key=os.path.getctime)
+    latest_file = max(data_files, key=os.path.getctime)
     print(f"\n📂 Loading data from: {latest_file.name}")
     
-    data = processor.load_data(str(latest_file))
+    data = processor.load_data_cached(str(latest_file))
     
     # Use first 1000 rows for quick test
     print(f"\n⚡ Using first 1000 rows for quick test...")
@@ -6,6 +6,134 @@ Calculates comprehensive performance metrics for backtesting
 import pandas as pd
 import numpy as np
 from typing import Dict, List
+from dataclasses import dataclass, asdict
+from pathlib import Path
+import logging
+import sys
+
+# Add project root to path only when run as a script (numba's on-disk cache
+# re-imports this module by its package name, so it must resolve then too);
+# package imports already resolve, and re-inserting it can import modules twice
+if not __package__:
+    project_root = Path(__file__).parent.parent.parent
+    sys.path.insert(0, str(project_root))
+
+logger = logging.getLogger(__name__)
+
+# Optional: route remaining pandas reductions through bottleneck/numexpr
+try:
+    import bottleneck  # noqa: F401
+    pd.set_option('compute.use_bottleneck', True)
+except ImportError:
+    pass
+
+try:
+    import numexpr  # noqa: F401
+    pd.set_option('compute.use_numexpr', True)
+except ImportError:
+    pass
+
+# Optional: numba JIT for the trade pairing loop
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _pair_pnl_py(is_buy, is_sell, price, quantity):
+    """
+    Pair each sell with the most recent unpaired buy
+    
+    Returns:
+        tuple: (winning_trades, losing_trades, total_wins, total_losses)
+    """
+    winning_trades = 0
+    losing_trades = 0
+    total_wins = 0.0
+    total_losses = 0.0
+    
+    buy_price = 0.0
+    has_buy = False
+    
+    for i in range(len(price)):
+        if is_buy[i]:
+            buy_price = price[i]
+            has_buy = True
+        elif is_sell[i] and has_buy:
+            pnl = (price[i] - buy_price) * quantity[i]
+            
+            if pnl > 0:
+                winning_trades += 1
+                total_wins += pnl
+            else:
+                losing_trades += 1
+                total_losses += abs(pnl)
+            
+            has_buy = False
+    
+    return winning_trades, losing_trades, total_wins, total_losses
+
+
+_pair_pnl = njit(cache=True)(_pair_pnl_py) if NUMBA_AVAILABLE else None
+
+
+def _return_moments_py(returns):
+    """
+    Mean and variance of all returns and of negative returns in one pass
+    Uses Welford's update for numerical stability
+    
+    Returns:
+        tuple: (count, mean, std, downside_count, downside_std), std with ddof=1
+    """
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    neg_n = 0
+    neg_mean = 0.0
+    neg_m2 = 0.0
+    
+    for r in returns:
+        n += 1
+        delta = r - mean
+        mean += delta / n
+        m2 += delta * (r - mean)
+        
+        if r < 0:
+            neg_n += 1
+            neg_delta = r - neg_mean
+            neg_mean += neg_delta / neg_n
+            neg_m2 += neg_delta * (r - neg_mean)
+    
+    std = np.sqrt(m2 / (n - 1)) if n > 1 else 0.0
+    downside_std = np.sqrt(neg_m2 / (neg_n - 1)) if neg_n > 1 else 0.0
+    
+    return n, mean, std, neg_n, downside_std
+
+
+_return_moments = njit(cache=True)(_return_moments_py) if NUMBA_AVAILABLE else None
+
+
+@dataclass(frozen=True, slots=True)
+class Metrics:
+    """Complete set of performance metrics for one backtest"""
+    total_return_pct: float
+    cagr_pct: float
+    sharpe_ratio: float
+    sortino_ratio: float
+    max_drawdown_pct: float
+    max_drawdown_duration_days: float
+    volatility_pct: float
+    win_rate_pct: float
+    profit_factor: float
+    avg_win: float
+    avg_loss: float
+    winning_trades: int
+    losing_trades: int
+    
+    def to_dict(self) -> Dict:
+        """Metrics as a plain dict (e.g. for CSV export)"""
+        return asdict(self)
 
 
 class PerformanceAnalyzer:
@@ -14,7 +142,8 @@ class PerformanceAnalyzer:
     Calculates: Sharpe ratio, max drawdown, win rate, etc.
     """
     
-    def __init__(self, equity_curve: pd.DataFrame, trades: List[Dict], risk_free_rate: float = 0.02):
+    def __init__(self, equity_curve: pd.DataFrame, trades: List[Dict], risk_free_rate: float = 0.02,
+                 precomputed_returns: np.ndarray = None):
         """
         Initialize performance analyzer
         
@@ -22,26 +151,87 @@ class PerformanceAnalyzer:
             equity_curve: DataFrame with portfolio values over time
             trades: List of executed trades
             risk_free_rate: Annual risk-free rate (default 2%)
+            precomputed_returns: Period returns already aligned with equity_curve
+                (first entry NaN); skips recomputing them when given
         """
         self.equity_curve = equity_curve.copy()
         self.trades = trades
         self.risk_free_rate = risk_free_rate
         
-        # Calculate returns
-        self.equity_curve['returns'] = self.equity_curve['portfolio_value'].pct_change()
-        self.equity_curve['cumulative_returns'] = (1 + self.equity_curve['returns']).cumprod() - 1
+        # Cache NumPy arrays of the hot columns (contiguous even if the
+        # DataFrame was built from a row-major 2D array)
+        self._pv = np.ascontiguousarray(self.equity_curve['portfolio_value'].to_numpy(dtype=np.float64))
+        self._ts = self.equity_curve['timestamp'].to_numpy() if 'timestamp' in self.equity_curve.columns else None
         
-        print(f"✅ PerformanceAnalyzer initialized")
-        print(f"   Equity curve length: {len(equity_curve)}")
-        print(f"   Total trades: {len(trades)}")
+        if precomputed_returns is not None:
+            returns = np.asarray(precomputed_returns, dtype=np.float64)
+            self.equity_curve['returns'] = returns
+        else:
+            # Calculate returns (first period has none)
+            returns = np.empty_like(self._pv)
+            returns[:1] = np.nan
+            np.divide(np.diff(self._pv), self._pv[:-1], out=returns[1:])
+            
+            self.equity_curve['returns'] = returns
+            
+            # Log returns are additive, so cumulative growth is a plain cumsum
+            self.equity_curve['log_returns'] = np.log1p(returns)
+            self.equity_curve['cumulative_log_returns'] = self.equity_curve['log_returns'].cumsum()
+        
+        # Ratio and volatility stats are computed on log returns
+        self._ret = np.log1p(returns[1:][~np.isnan(returns[1:])])
+        
+        # Convert the trade dicts once; win rate and trade plots index into this
+        self._trade_arr = np.fromiter(
+            ((t['side'] == 'BUY', t['side'] == 'SELL', t['price'], t['quantity']) for t in trades),
+            dtype=[('is_buy', '?'), ('is_sell', '?'), ('price', 'f8'), ('quantity', 'f8')],
+            count=len(trades)
+        )
+        
+        # Memoized intermediate results (returns stats, drawdown, metrics)
+        self._cached = {}
+        
+        logger.debug("PerformanceAnalyzer initialized (equity curve length: %d, total trades: %d)",
+                     len(equity_curve), len(trades))
+    
+    def _returns_stats(self) -> Dict:
+        """
+        Summary statistics of log returns shared by the ratio methods
+        
+        Returns:
+            dict: count, mean, std and downside std of log returns (computed once)
+        """
+        if 'returns_stats' not in self._cached:
+            returns = self._ret
+            
+            if _return_moments is not None:
+                # Single fused pass over the returns
+                count, mean, std, downside_count, downside_std = _return_moments(returns)
+            else:
+                downside_returns = returns[returns < 0]
+                count = len(returns)
+                mean = returns.mean() if count > 0 else 0.0
+                std = returns.std(ddof=1) if count > 1 else 0.0
+                downside_count = len(downside_returns)
+                downside_std = downside_returns.std(ddof=1) if downside_count > 1 else 0.0
+            
+            self._cached['returns_stats'] = {
+                'count': count,
+                'mean': mean,
+                'std': std,
+                'downside_count': downside_count,
+                'downside_std': downside_std
+            }
+        
+        return self._cached['returns_stats']
     
     def calculate_total_return(self) -> float:
         """Calculate total return percentage"""
-        if len(self.equity_curve) == 0:
+        if len(self._pv) == 0:
             return 0.0
         
-        initial_value = self.equity_curve['portfolio_value'].iloc[0]
-        final_value = self.equity_curve['portfolio_value'].iloc[-1]
+        initial_value = self._pv[0]
+        final_value = self._pv[-1]
         
         return ((final_value - initial_value) / initial_value) * 100
     
@@ -55,17 +245,16 @@ class PerformanceAnalyzer:
         Returns:
             float: CAGR percentage
         """
-        if len(self.equity_curve) == 0:
+        if len(self._pv) == 0:
             return 0.0
         
-        initial_value = self.equity_curve['portfolio_value'].iloc[0]
-        final_value = self.equity_curve['portfolio_value'].iloc[-1]
+        initial_value = self._pv[0]
+        final_value = self._pv[-1]
         
         if years is None:
             # Calculate years from timestamps
-            start_date = self.equity_curve['timestamp'].iloc[0]
-            end_date = self.equity_curve['timestamp'].iloc[-1]
-            years = (end_date - start_date).total_seconds() / (365.25 * 24 * 3600)
+            elapsed_seconds = (self._ts[-1] - self._ts[0]) / np.timedelta64(1, 's')
+            years = elapsed_seconds / (365.25 * 24 * 3600)
         
         if years <= 0:
             return 0.0
@@ -83,13 +272,13 @@ class PerformanceAnalyzer:
         Returns:
             float: Sharpe ratio
         """
-        returns = self.equity_curve['returns'].dropna()
+        stats = self._returns_stats()
         
-        if len(returns) == 0 or returns.std() == 0:
+        if stats['std'] == 0:
             return 0.0
         
-        excess_returns = returns - (self.risk_free_rate / periods_per_year)
-        sharpe = np.sqrt(periods_per_year) * (excess_returns.mean() / returns.std())
+        excess_mean = stats['mean'] - (self.risk_free_rate / periods_per_year)
+        sharpe = np.sqrt(periods_per_year) * (excess_mean / stats['std'])
         
         return sharpe
     
@@ -103,21 +292,30 @@ class PerformanceAnalyzer:
         Returns:
             float: Sortino ratio
         """
-        returns = self.equity_curve['returns'].dropna()
+        stats = self._returns_stats()
         
-        if len(returns) == 0:
+        # Downside deviation needs at least two negative returns
+        if stats['downside_std'] == 0:
             return 0.0
         
-        # Calculate downside deviation
-        downside_returns = returns[returns < 0]
+        excess_mean = stats['mean'] - (self.risk_free_rate / periods_per_year)
+        sortino = np.sqrt(periods_per_year) * (excess_mean / stats['downside_std'])
         
-        if len(downside_returns) == 0 or downside_returns.std() == 0:
-            return 0.0
+        return sortino
+    
+    def calculate_drawdown_series(self) -> np.ndarray:
+        """
+        Calculate drawdown from the running peak at every point
         
-        excess_returns = returns - (self.risk_free_rate / periods_per_year)
-        sortino = np.sqrt(periods_per_year) * (excess_returns.mean() / downside_returns.std())
+        Returns:
+            np.ndarray: Drawdown percentage (computed once and cached)
+        """
+        if 'drawdown' not in self._cached:
+            running_max = np.maximum.accumulate(self._pv)
+            self._cached['running_max'] = running_max
+            self._cached['drawdown'] = (self._pv - running_max) / running_max * 100
         
-        return sortino
+        return self._cached['drawdown']
     
     def calculate_max_drawdown(self) -> Dict:
         """
@@ -126,36 +324,41 @@ class PerformanceAnalyzer:
         Returns:
             dict: Max drawdown info (percentage, duration, etc.)
         """
-        portfolio_values = self.equity_curve['portfolio_value']
-        
-        # Calculate running maximum
-        running_max = portfolio_values.expanding().max()
+        if 'max_drawdown' in self._cached:
+            return self._cached['max_drawdown']
         
-        # Calculate drawdown
-        drawdown = (portfolio_values - running_max) / running_max * 100
+        portfolio_values = self._pv
+        drawdown = self.calculate_drawdown_series()
         
         # Find maximum drawdown
-        max_dd = drawdown.min()
-        max_dd_idx = drawdown.idxmin()
+        max_dd_idx = int(np.nanargmin(drawdown))
+        max_dd = drawdown[max_dd_idx]
         
-        # Find when drawdown started (last peak before max dd)
-        peak_idx = portfolio_values[:max_dd_idx].idxmax()
+        # Find when drawdown started: the running max is non-decreasing, so
+        # the first time it reaches its value at the trough is the peak
+        running_max = self._cached['running_max']
+        peak_idx = int(np.searchsorted(running_max[:max_dd_idx + 1], running_max[max_dd_idx]))
         
         # Calculate drawdown duration
         if 'timestamp' in self.equity_curve.columns:
-            dd_duration = self.equity_curve['timestamp'].iloc[max_dd_idx] - self.equity_curve['timestamp'].iloc[peak_idx]
-            dd_duration_days = dd_duration.total_seconds() / (24 * 3600)
+            peak_date = self.equity_curve['timestamp'].iloc[peak_idx]
+            trough_date = self.equity_curve['timestamp'].iloc[max_dd_idx]
+            dd_duration_days = (trough_date - peak_date).total_seconds() / (24 * 3600)
         else:
+            peak_date = peak_idx
+            trough_date = max_dd_idx
             dd_duration_days = max_dd_idx - peak_idx
         
-        return {
+        self._cached['max_drawdown'] = {
             'max_drawdown_pct': max_dd,
-            'peak_value': portfolio_values.iloc[peak_idx],
-            'trough_value': portfolio_values.iloc[max_dd_idx],
-            'peak_date': self.equity_curve['timestamp'].iloc[peak_idx] if 'timestamp' in self.equity_curve.columns else peak_idx,
-            'trough_date': self.equity_curve['timestamp'].iloc[max_dd_idx] if 'timestamp' in self.equity_curve.columns else max_dd_idx,
+            'peak_value': portfolio_values[peak_idx],
+            'trough_value': portfolio_values[max_dd_idx],
+            'peak_date': peak_date,
+            'trough_date': trough_date,
             'duration_days': dd_duration_days
         }
+        
+        return self._cached['max_drawdown']
     
     def calculate_win_rate(self) -> Dict:
         """
@@ -164,36 +367,34 @@ class PerformanceAnalyzer:
         Returns:
             dict: Win rate statistics
         """
-        if len(self.trades) < 2:
+        trades = self._trade_arr
+        
+        if len(trades) < 2:
             return {
                 'win_rate_pct': 0.0,
                 'avg_win': 0.0,
                 'avg_loss': 0.0,
-                'profit_factor': 0.0
+                'profit_factor': 0.0,
+                'winning_trades': 0,
+                'losing_trades': 0
             }
         
-        # Pair up buys and sells
-        winning_trades = 0
-        losing_trades = 0
-        total_wins = 0.0
-        total_losses = 0.0
-        
-        buy_price = None
-        
-        for trade in self.trades:
-            if trade['side'] == 'BUY':
-                buy_price = trade['price']
-            elif trade['side'] == 'SELL' and buy_price is not None:
-                pnl = (trade['price'] - buy_price) * trade['quantity']
-                
-                if pnl > 0:
-                    winning_trades += 1
-                    total_wins += pnl
-                else:
-                    losing_trades += 1
-                    total_losses += abs(pnl)
-                
-                buy_price = None
+        if _pair_pnl is not None:
+            winning_trades, losing_trades, total_wins, total_losses = _pair_pnl(
+                trades['is_buy'], trades['is_sell'], trades['price'], trades['quantity']
+            )
+        else:
+            # A sell closes a round trip only when the trade right before it is a buy
+            paired = trades['is_sell'][1:] & trades['is_buy'][:-1]
+            sell_idx = np.flatnonzero(paired) + 1
+            
+            pnl = (trades['price'][sell_idx] - trades['price'][sell_idx - 1]) * trades['quantity'][sell_idx]
+            wins = pnl > 0
+            
+            winning_trades = int(wins.sum())
+            losing_trades = int(len(pnl) - winning_trades)
+            total_wins = float(pnl[wins].sum())
+            total_losses = float(-pnl[~wins].sum())
         
         total_trades = winning_trades + losing_trades
         
@@ -222,25 +423,28 @@ class PerformanceAnalyzer:
         Returns:
             float: Volatility (percentage)
         """
-        returns = self.equity_curve['returns'].dropna()
+        stats = self._returns_stats()
         
-        if len(returns) == 0:
+        if stats['count'] < 2:
             return 0.0
         
-        volatility = returns.std() * 100
+        volatility = stats['std'] * 100
         
         if annualize:
             volatility *= np.sqrt(periods_per_year)
         
         return volatility
     
-    def get_comprehensive_metrics(self) -> Dict:
+    def get_comprehensive_metrics(self) -> Metrics:
         """
         Calculate all performance metrics
         
         Returns:
-            dict: Complete performance metrics
+            Metrics: Complete performance metrics (computed once)
         """
+        if 'metrics' in self._cached:
+            return self._cached['metrics']
+        
         total_return = self.calculate_total_return()
         cagr = self.calculate_cagr()
         sharpe = self.calculate_sharpe_ratio()
@@ -249,21 +453,23 @@ class PerformanceAnalyzer:
         win_rate_stats = self.calculate_win_rate()
         volatility = self.calculate_volatility()
         
-        return {
-            'total_return_pct': total_return,
-            'cagr_pct': cagr,
-            'sharpe_ratio': sharpe,
-            'sortino_ratio': sortino,
-            'max_drawdown_pct': max_dd['max_drawdown_pct'],
-            'max_drawdown_duration_days': max_dd['duration_days'],
-            'volatility_pct': volatility,
-            'win_rate_pct': win_rate_stats['win_rate_pct'],
-            'profit_factor': win_rate_stats['profit_factor'],
-            'avg_win': win_rate_stats['avg_win'],
-            'avg_loss': win_rate_stats['avg_loss'],
-            'winning_trades': win_rate_stats['winning_trades'],
-            'losing_trades': win_rate_stats['losing_trades']
-        }
+        self._cached['metrics'] = Metrics(
+            total_return_pct=total_return,
+            cagr_pct=cagr,
+            sharpe_ratio=sharpe,
+            sortino_ratio=sortino,
+            max_drawdown_pct=max_dd['max_drawdown_pct'],
+            max_drawdown_duration_days=max_dd['duration_days'],
+            volatility_pct=volatility,
+            win_rate_pct=win_rate_stats['win_rate_pct'],
+            profit_factor=win_rate_stats['profit_factor'],
+            avg_win=win_rate_stats['avg_win'],
+            avg_loss=win_rate_stats['avg_loss'],
+            winning_trades=win_rate_stats['winning_trades'],
+            losing_trades=win_rate_stats['losing_trades']
+        )
+        
+        return self._cached['metrics']
     
     def print_metrics(self):
         """Print all performance metrics"""
@@ -274,43 +480,43 @@ class PerformanceAnalyzer:
         print("="*70)
         
         print(f"\n📊 Returns:")
-        print(f"  Total Return: {metrics['total_return_pct']:+.2f}%")
-        print(f"  CAGR: {metrics['cagr_pct']:+.2f}%")
-        print(f"  Volatility: {metrics['volatility_pct']:.2f}%")
+        print(f"  Total Return: {metrics.total_return_pct:+.2f}%")
+        print(f"  CAGR: {metrics.cagr_pct:+.2f}%")
+        print(f"  Volatility: {metrics.volatility_pct:.2f}%")
         
         print(f"\n📈 Risk-Adjusted Returns:")
-        print(f"  Sharpe Ratio: {metrics['sharpe_ratio']:.3f}")
-        print(f"  Sortino Ratio: {metrics['sortino_ratio']:.3f}")
+        print(f"  Sharpe Ratio: {metrics.sharpe_ratio:.3f}")
+        print(f"  Sortino Ratio: {metrics.sortino_ratio:.3f}")
         
         print(f"\n📉 Drawdown:")
-        print(f"  Max Drawdown: {metrics['max_drawdown_pct']:.2f}%")
-        print(f"  Drawdown Duration: {metrics['max_drawdown_duration_days']:.1f} days")
+        print(f"  Max Drawdown: {metrics.max_drawdown_pct:.2f}%")
+        print(f"  Drawdown Duration: {metrics.max_drawdown_duration_days:.1f} days")
         
         print(f"\n🎯 Trade Statistics:")
-        print(f"  Win Rate: {metrics['win_rate_pct']:.1f}%")
-        print(f"  Winning Trades: {metrics['winning_trades']}")
-        print(f"  Losing Trades: {metrics['losing_trades']}")
-        print(f"  Avg Win: ${metrics['avg_win']:.2f}")
-        print(f"  Avg Loss: ${metrics['avg_loss']:.2f}")
-        print(f"  Profit Factor: {metrics['profit_factor']:.2f}")
+        print(f"  Win Rate: {metrics.win_rate_pct:.1f}%")
+        print(f"  Winning Trades: {metrics.winning_trades}")
+        print(f"  Losing Trades: {metrics.losing_trades}")
+        print(f"  Avg Win: ${metrics.avg_win:.2f}")
+        print(f"  Avg Loss: ${metrics.avg_loss:.2f}")
+        print(f"  Profit Factor: {metrics.profit_factor:.2f}")
         
         print("="*70)
         
         # Interpretation
         print(f"\n💡 Interpretation:")
-        if metrics['sharpe_ratio'] > 2:
+        if metrics.sharpe_ratio > 2:
             print("  ✅ Excellent Sharpe ratio (>2.0)")
-        elif metrics['sharpe_ratio'] > 1:
+        elif metrics.sharpe_ratio > 1:
             print("  ✅ Good Sharpe ratio (>1.0)")
         else:
             print("  ⚠️  Low Sharpe ratio (<1.0)")
         
-        if metrics['max_drawdown_pct'] > -20:
+        if metrics.max_drawdown_pct > -20:
             print("  ✅ Low maximum drawdown (<20%)")
         else:
             print("  ⚠️  High maximum drawdown (>20%)")
         
-        if metrics['win_rate_pct'] > 50:
+        if metrics.win_rate_pct > 50:
             print("  ✅ Positive win rate (>50%)")
         else:
             print("  ℹ️  Market makers often have <50% win rate but positive expectancy")
@@ -326,8 +532,8 @@ if __name__ == "__main__":
     dates = pd.date_range('2024-01-01', periods=100, freq='1h')
     
     # Simulate returns with some volatility
-    np.random.seed(42)
-    returns = np.random.normal(0.001, 0.02, 100)
+    rng = np.random.default_rng(42)
+    returns = rng.normal(0.001, 0.02, 100)
     portfolio_values = 100000 * (1 + returns).cumprod()
     
     equity_curve = pd.DataFrame({
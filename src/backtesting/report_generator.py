@@ -5,18 +5,282 @@ Creates comprehensive backtest reports with visualizations
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+import logging
+import os
 import sys
 
-# Add project root to path
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+# Optional: pyarrow's C++ CSV writer for large equity curves
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Add project root to path only when run as a script; package imports
+# already resolve, and re-inserting it can import modules twice
+if not __package__:
+    project_root = Path(__file__).parent.parent.parent
+    sys.path.insert(0, str(project_root))
 
 from src.backtesting.performance_analyzer import PerformanceAnalyzer
 
+logger = logging.getLogger(__name__)
+
+# Below this many equity-curve rows generate_report() renders in-process;
+# pool start-up and the matplotlib import in each worker cost more than
+# the plotting saves
+PARALLEL_PLOT_MIN_ROWS = 200_000
+
+
+def _decimate(x: np.ndarray, y: np.ndarray, n_buckets: int = 2000):
+    """
+    Reduce a line to at most two points per bucket for plotting
+    
+    Each bucket keeps its min and max (in time order) so spikes and
+    drawdowns survive, while the vertex count stays O(pixels).
+    
+    Args:
+        x: X values (e.g. timestamps)
+        y: Y values
+        n_buckets: Number of buckets
+        
+    Returns:
+        Tuple of decimated (x, y) arrays
+    """
+    n = len(y)
+    if n <= 2 * n_buckets:
+        return x, y
+    
+    bucket_size = n // n_buckets
+    blocks = y[:bucket_size * n_buckets].reshape(n_buckets, bucket_size)
+    offsets = np.arange(n_buckets) * bucket_size
+    i_min = offsets + blocks.argmin(axis=1)
+    i_max = offsets + blocks.argmax(axis=1)
+    
+    # Interleave in time order, and always keep the final point
+    idx = np.empty(2 * n_buckets + 1, dtype=np.int64)
+    idx[0:-1:2] = np.minimum(i_min, i_max)
+    idx[1:-1:2] = np.maximum(i_min, i_max)
+    idx[-1] = n - 1
+    
+    return x[idx], y[idx]
+
+
+@lru_cache(maxsize=None)
+def _pyplot():
+    """
+    Import and style matplotlib on first use
+    
+    matplotlib and seaborn are slow to import, so metrics-only users of
+    ReportGenerator never pay for them.
+    
+    Returns:
+        module: matplotlib.pyplot
+    """
+    import matplotlib
+    matplotlib.use('Agg')  # Reports are only saved to disk, no GUI backend needed
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    
+    # Set plotting style
+    sns.set_style("darkgrid")
+    plt.rcParams['figure.figsize'] = (12, 8)
+    
+    return plt
+
+
+def _plot_equity_curve(value_ts: np.ndarray, portfolio_value: np.ndarray,
+                       drawdown_ts: np.ndarray, drawdown: np.ndarray,
+                       initial_cash: float, save_path: str = None, dpi: int = 150):
+    """
+    Plot portfolio equity curve and drawdown
+    
+    Args:
+        value_ts: Timestamps of the (decimated) portfolio values
+        portfolio_value: Portfolio values
+        drawdown_ts: Timestamps of the (decimated) drawdown
+        drawdown: Drawdown in percent
+        initial_cash: Starting capital, drawn as a reference line
+        save_path: Path to save plot (optional)
+        dpi: Resolution of the saved image
+    """
+    plt = _pyplot()
+    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(14, 10))
+    
+    # Plot equity curve
+    ax1.plot(value_ts, 
+            portfolio_value,
+            linewidth=2, color='#2E86AB', label='Portfolio Value',
+            rasterized=True)
+    
+    ax1.axhline(y=initial_cash, 
+               color='gray', linestyle='--', alpha=0.5, label='Initial Capital')
+    
+    ax1.set_title('Portfolio Equity Curve', fontsize=16, fontweight='bold')
+    ax1.set_xlabel('Time', fontsize=12)
+    ax1.set_ylabel('Portfolio Value ($)', fontsize=12)
+    ax1.legend(fontsize=10)
+    ax1.grid(True, alpha=0.3)
+    
+    # Format y-axis as currency
+    ax1.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'${x:,.0f}'))
+    
+    # Plot drawdown
+    ax2.fill_between(drawdown_ts, drawdown, 0, 
+                    color='#A23B72', alpha=0.5, label='Drawdown',
+                    rasterized=True)
+    ax2.plot(drawdown_ts, drawdown, 
+            color='#A23B72', linewidth=1, rasterized=True)
+    
+    ax2.set_title('Drawdown Over Time', fontsize=16, fontweight='bold')
+    ax2.set_xlabel('Time', fontsize=12)
+    ax2.set_ylabel('Drawdown (%)', fontsize=12)
+    ax2.legend(fontsize=10)
+    ax2.grid(True, alpha=0.3)
+    
+    plt.tight_layout()
+    
+    if save_path:
+        plt.savefig(save_path, dpi=dpi, bbox_inches='tight')
+        print(f"  💾 Saved equity curve to: {save_path}")
+    
+    return fig
+
+
+def _plot_returns_distribution(returns: np.ndarray, save_path: str = None,
+                               dpi: int = 150, show_qq: bool = True):
+    """
+    Plot returns distribution
+    
+    Args:
+        returns: Per-bar returns in percent, without NaNs
+        save_path: Path to save plot (optional)
+        dpi: Resolution of the saved image
+        show_qq: Add a Q-Q normality plot (needs scipy)
+    """
+    plt = _pyplot()
+    fig, axes = plt.subplots(1, 2 if show_qq else 1, figsize=(14 if show_qq else 7, 6), squeeze=False)
+    ax1 = axes[0, 0]
+    
+    mean_return = returns.mean()
+    returns = returns.astype(np.float32, copy=False)
+    
+    # Histogram
+    ax1.hist(returns, bins=50, color='#18A558', alpha=0.7, edgecolor='black')
+    ax1.axvline(mean_return, color='red', linestyle='--', 
+               linewidth=2, label=f'Mean: {mean_return:.3f}%')
+    ax1.axvline(0, color='gray', linestyle='-', linewidth=1, alpha=0.5)
+    
+    ax1.set_title('Returns Distribution', fontsize=16, fontweight='bold')
+    ax1.set_xlabel('Returns (%)', fontsize=12)
+    ax1.set_ylabel('Frequency', fontsize=12)
+    ax1.legend(fontsize=10)
+    ax1.grid(True, alpha=0.3)
+    
+    # Q-Q plot (check normality)
+    if show_qq:
+        from scipy import stats
+        ax2 = axes[0, 1]
+        stats.probplot(returns, dist="norm", plot=ax2)
+        ax2.set_title('Q-Q Plot (Normality Check)', fontsize=16, fontweight='bold')
+        ax2.grid(True, alpha=0.3)
+    
+    plt.tight_layout()
+    
+    if save_path:
+        plt.savefig(save_path, dpi=dpi, bbox_inches='tight')
+        print(f"  💾 Saved returns distribution to: {save_path}")
+    
+    return fig
+
+
+def _plot_trade_analysis(trade_arr: np.ndarray, save_path: str = None, dpi: int = 150):
+    """
+    Plot trade analysis
+    
+    Args:
+        trade_arr: Structured trade array (is_buy, price, quantity fields)
+        save_path: Path to save plot (optional)
+        dpi: Resolution of the saved image
+    """
+    if not len(trade_arr):
+        print("  ⚠️ No trades to plot")
+        return None
+    
+    plt = _pyplot()
+    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(14, 10))
+    
+    is_buy = trade_arr['is_buy']
+    quantities = trade_arr['quantity']
+    
+    # Trade PnL
+    buy_trades = trade_arr[is_buy]
+    sell_trades = trade_arr[~is_buy]
+    
+    ax1.scatter(range(len(buy_trades)), buy_trades['price'], 
+               color='green', marker='^', s=100, alpha=0.6, label='Buy')
+    ax1.scatter(range(len(sell_trades)), sell_trades['price'], 
+               color='red', marker='v', s=100, alpha=0.6, label='Sell')
+    
+    ax1.set_title('Trade Execution Prices', fontsize=14, fontweight='bold')
+    ax1.set_xlabel('Trade Number', fontsize=11)
+    ax1.set_ylabel('Price ($)', fontsize=11)
+    ax1.legend()
+    ax1.grid(True, alpha=0.3)
+    
+    # Inventory over time
+    cumulative_inventory = np.cumsum(np.where(is_buy, quantities, -quantities))
+    
+    ax2.plot(cumulative_inventory, color='#F18F01', linewidth=2)
+    ax2.axhline(y=0, color='gray', linestyle='--', alpha=0.5)
+    ax2.set_title('Inventory Over Time', fontsize=14, fontweight='bold')
+    ax2.set_xlabel('Trade Number', fontsize=11)
+    ax2.set_ylabel('Inventory (BTC)', fontsize=11)
+    ax2.grid(True, alpha=0.3)
+    
+    # Trade size distribution
+    ax3.hist(quantities, bins=30, color='#6A4C93', alpha=0.7, edgecolor='black')
+    ax3.set_title('Trade Size Distribution', fontsize=14, fontweight='bold')
+    ax3.set_xlabel('Quantity (BTC)', fontsize=11)
+    ax3.set_ylabel('Frequency', fontsize=11)
+    ax3.grid(True, alpha=0.3)
+    
+    # Cumulative trades
+    ax4.plot(range(len(buy_trades)), np.arange(len(buy_trades)), 
+            color='green', label='Buys', linewidth=2)
+    ax4.plot(range(len(sell_trades)), np.arange(len(sell_trades)), 
+            color='red', label='Sells', linewidth=2)
+    ax4.set_title('Cumulative Trades', fontsize=14, fontweight='bold')
+    ax4.set_xlabel('Time', fontsize=11)
+    ax4.set_ylabel('Cumulative Count', fontsize=11)
+    ax4.legend()
+    ax4.grid(True, alpha=0.3)
+    
+    plt.tight_layout()
+    
+    if save_path:
+        plt.savefig(save_path, dpi=dpi, bbox_inches='tight')
+        print(f"  💾 Saved trade analysis to: {save_path}")
+    
+    return fig
+
+
+def _render_plot(plot_func, args: tuple, save_path: str):
+    """
+    Render and save one report plot, then close its figure
+    
+    plot_func is one of the module-level plot functions and args are plain
+    arrays, so a worker process only receives the data it draws.
+    """
+    fig = plot_func(*args, save_path=save_path)
+    if fig is not None:
+        _pyplot().close(fig)
+
 
 class ReportGenerator:
     """
@@ -36,185 +300,88 @@ class ReportGenerator:
         self.trades = backtest_results['trades']
         self.stats = backtest_results['strategy_stats']
         
-        # Add returns column if missing
-        if 'returns' not in self.equity_curve.columns:
-            self.equity_curve['returns'] = self.equity_curve['portfolio_value'].pct_change()
-        
-        # Create analyzer
-        self.analyzer = PerformanceAnalyzer(self.equity_curve, self.trades)
-        
-        # Set plotting style
-        sns.set_style("darkgrid")
-        plt.rcParams['figure.figsize'] = (12, 8)
-        
-        print(f"✅ ReportGenerator initialized")
+        # Create analyzer (reusing a returns column if the curve already has one)
+        if 'returns' in self.equity_curve.columns:
+            self.analyzer = PerformanceAnalyzer(
+                self.equity_curve, self.trades,
+                precomputed_returns=self.equity_curve['returns'].to_numpy()
+            )
+        else:
+            self.analyzer = PerformanceAnalyzer(self.equity_curve, self.trades)
+            self.equity_curve['returns'] = self.analyzer.equity_curve['returns'].to_numpy()
+        
+        logger.debug("ReportGenerator initialized")
+    
+    def _equity_plot_args(self) -> tuple:
+        """Decimated equity and drawdown series for _plot_equity_curve()"""
+        # float32 is plenty for pixels
+        timestamps = self.equity_curve['timestamp'].to_numpy()
+        portfolio_value = self.equity_curve['portfolio_value'].to_numpy().astype(np.float32, copy=False)
+        drawdown = self.analyzer.calculate_drawdown_series().astype(np.float32, copy=False)
+        
+        value_ts, portfolio_value = _decimate(timestamps, portfolio_value)
+        drawdown_ts, drawdown = _decimate(timestamps, drawdown)
+        return value_ts, portfolio_value, drawdown_ts, drawdown, self.results['initial_cash']
     
-    def plot_equity_curve(self, save_path: str = None):
+    def _returns_pct(self) -> np.ndarray:
+        """Per-bar returns in percent, without NaNs"""
+        return (self.equity_curve['returns'].dropna() * 100).to_numpy()
+    
+    def plot_equity_curve(self, save_path: str = None, dpi: int = 150):
         """
         Plot portfolio equity curve
         
         Args:
             save_path: Path to save plot (optional)
+            dpi: Resolution of the saved image
         """
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(14, 10))
-        
-        # Plot equity curve
-        ax1.plot(self.equity_curve['timestamp'], 
-                self.equity_curve['portfolio_value'],
-                linewidth=2, color='#2E86AB', label='Portfolio Value')
-        
-        ax1.axhline(y=self.results['initial_cash'], 
-                   color='gray', linestyle='--', alpha=0.5, label='Initial Capital')
-        
-        ax1.set_title('Portfolio Equity Curve', fontsize=16, fontweight='bold')
-        ax1.set_xlabel('Time', fontsize=12)
-        ax1.set_ylabel('Portfolio Value ($)', fontsize=12)
-        ax1.legend(fontsize=10)
-        ax1.grid(True, alpha=0.3)
-        
-        # Format y-axis as currency
-        ax1.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'${x:,.0f}'))
-        
-        # Plot drawdown
-        portfolio_values = self.equity_curve['portfolio_value']
-        running_max = portfolio_values.expanding().max()
-        drawdown = (portfolio_values - running_max) / running_max * 100
-        
-        ax2.fill_between(self.equity_curve['timestamp'], drawdown, 0, 
-                        color='#A23B72', alpha=0.5, label='Drawdown')
-        ax2.plot(self.equity_curve['timestamp'], drawdown, 
-                color='#A23B72', linewidth=1)
-        
-        ax2.set_title('Drawdown Over Time', fontsize=16, fontweight='bold')
-        ax2.set_xlabel('Time', fontsize=12)
-        ax2.set_ylabel('Drawdown (%)', fontsize=12)
-        ax2.legend(fontsize=10)
-        ax2.grid(True, alpha=0.3)
-        
-        plt.tight_layout()
-        
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-            print(f"  💾 Saved equity curve to: {save_path}")
-        
-        return fig
+        return _plot_equity_curve(*self._equity_plot_args(), save_path=save_path, dpi=dpi)
     
-    def plot_returns_distribution(self, save_path: str = None):
+    def plot_returns_distribution(self, save_path: str = None, dpi: int = 150, show_qq: bool = True):
         """
         Plot returns distribution
         
         Args:
             save_path: Path to save plot (optional)
+            dpi: Resolution of the saved image
+            show_qq: Add a Q-Q normality plot (needs scipy)
         """
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
-        
-        returns = self.equity_curve['returns'].dropna() * 100
-        
-        # Histogram
-        ax1.hist(returns, bins=50, color='#18A558', alpha=0.7, edgecolor='black')
-        ax1.axvline(returns.mean(), color='red', linestyle='--', 
-                   linewidth=2, label=f'Mean: {returns.mean():.3f}%')
-        ax1.axvline(0, color='gray', linestyle='-', linewidth=1, alpha=0.5)
-        
-        ax1.set_title('Returns Distribution', fontsize=16, fontweight='bold')
-        ax1.set_xlabel('Returns (%)', fontsize=12)
-        ax1.set_ylabel('Frequency', fontsize=12)
-        ax1.legend(fontsize=10)
-        ax1.grid(True, alpha=0.3)
-        
-        # Q-Q plot (check normality)
-        from scipy import stats
-        stats.probplot(returns, dist="norm", plot=ax2)
-        ax2.set_title('Q-Q Plot (Normality Check)', fontsize=16, fontweight='bold')
-        ax2.grid(True, alpha=0.3)
-        
-        plt.tight_layout()
-        
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-            print(f"  💾 Saved returns distribution to: {save_path}")
-        
-        return fig
+        return _plot_returns_distribution(self._returns_pct(), save_path=save_path,
+                                          dpi=dpi, show_qq=show_qq)
     
-    def plot_trade_analysis(self, save_path: str = None):
+    def plot_trade_analysis(self, save_path: str = None, dpi: int = 150):
         """
         Plot trade analysis
         
         Args:
             save_path: Path to save plot (optional)
+            dpi: Resolution of the saved image
         """
-        if not self.trades:
-            print("  ⚠️ No trades to plot")
-            return None
-        
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(14, 10))
-        
-        trades_df = pd.DataFrame(self.trades)
-        
-        # Trade PnL
-        buy_trades = trades_df[trades_df['side'] == 'BUY']
-        sell_trades = trades_df[trades_df['side'] == 'SELL']
-        
-        ax1.scatter(range(len(buy_trades)), buy_trades['price'], 
-                   color='green', marker='^', s=100, alpha=0.6, label='Buy')
-        ax1.scatter(range(len(sell_trades)), sell_trades['price'], 
-                   color='red', marker='v', s=100, alpha=0.6, label='Sell')
-        
-        ax1.set_title('Trade Execution Prices', fontsize=14, fontweight='bold')
-        ax1.set_xlabel('Trade Number', fontsize=11)
-        ax1.set_ylabel('Price ($)', fontsize=11)
-        ax1.legend()
-        ax1.grid(True, alpha=0.3)
-        
-        # Inventory over time
-        cumulative_inventory = []
-        inventory = 0
-        for trade in self.trades:
-            if trade['side'] == 'BUY':
-                inventory += trade['quantity']
-            else:
-                inventory -= trade['quantity']
-            cumulative_inventory.append(inventory)
-        
-        ax2.plot(cumulative_inventory, color='#F18F01', linewidth=2)
-        ax2.axhline(y=0, color='gray', linestyle='--', alpha=0.5)
-        ax2.set_title('Inventory Over Time', fontsize=14, fontweight='bold')
-        ax2.set_xlabel('Trade Number', fontsize=11)
-        ax2.set_ylabel('Inventory (BTC)', fontsize=11)
-        ax2.grid(True, alpha=0.3)
-        
-        # Trade size distribution
-        ax3.hist(trades_df['quantity'], bins=30, color='#6A4C93', alpha=0.7, edgecolor='black')
-        ax3.set_title('Trade Size Distribution', fontsize=14, fontweight='bold')
-        ax3.set_xlabel('Quantity (BTC)', fontsize=11)
-        ax3.set_ylabel('Frequency', fontsize=11)
-        ax3.grid(True, alpha=0.3)
-        
-        # Cumulative trades
-        ax4.plot(range(len(buy_trades)), np.arange(len(buy_trades)), 
-                color='green', label='Buys', linewidth=2)
-        ax4.plot(range(len(sell_trades)), np.arange(len(sell_trades)), 
-                color='red', label='Sells', linewidth=2)
-        ax4.set_title('Cumulative Trades', fontsize=14, fontweight='bold')
-        ax4.set_xlabel('Time', fontsize=11)
-        ax4.set_ylabel('Cumulative Count', fontsize=11)
-        ax4.legend()
-        ax4.grid(True, alpha=0.3)
-        
-        plt.tight_layout()
-        
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
-            print(f"  💾 Saved trade analysis to: {save_path}")
+        # Reuse the analyzer's trade array instead of rebuilding a DataFrame
+        return _plot_trade_analysis(self.analyzer._trade_arr, save_path=save_path, dpi=dpi)
+    
+    def _write_csv(self, df: pd.DataFrame, path: Path):
+        """
+        Write a DataFrame to CSV (pyarrow writer if available)
         
-        return fig
+        Args:
+            df: DataFrame to write
+            path: Output file path
+        """
+        if PYARROW_AVAILABLE:
+            pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), str(path))
+        else:
+            df.to_csv(path, index=False, chunksize=65536)
     
-    def generate_report(self, output_dir: str = "results/backtest_reports"):
+    def generate_report(self, output_dir: str = "results/backtest_reports", n_workers: int = None):
         """
         Generate complete backtest report with all visualizations
         
         Args:
             output_dir: Directory to save report files
+            n_workers: Processes used to render the plots (defaults to one per
+                plot, capped at the CPU count, or in-process for equity curves
+                shorter than PARALLEL_PLOT_MIN_ROWS; 1 renders in-process)
         """
         print("\n" + "="*70)
         print("GENERATING BACKTEST REPORT")
@@ -230,14 +397,33 @@ class ReportGenerator:
         # Generate plots
         print("\n📊 Creating visualizations...")
         
-        equity_path = output_path / f"equity_curve_{timestamp}.png"
-        self.plot_equity_curve(str(equity_path))
-        
-        returns_path = output_path / f"returns_dist_{timestamp}.png"
-        self.plot_returns_distribution(str(returns_path))
-        
-        trades_path = output_path / f"trade_analysis_{timestamp}.png"
-        self.plot_trade_analysis(str(trades_path))
+        # Only the arrays each plot draws are handed to its renderer
+        plots = [
+            (_plot_equity_curve, self._equity_plot_args(),
+             output_path / f"equity_curve_{timestamp}.png"),
+            (_plot_returns_distribution, (self._returns_pct(),),
+             output_path / f"returns_dist_{timestamp}.png"),
+            (_plot_trade_analysis, (self.analyzer._trade_arr,),
+             output_path / f"trade_analysis_{timestamp}.png"),
+        ]
+        
+        # The plots are independent, so render and encode them in parallel;
+        # short backtests render faster than workers can import matplotlib
+        if n_workers is None:
+            if len(self.equity_curve) < PARALLEL_PLOT_MIN_ROWS:
+                n_workers = 1
+            else:
+                n_workers = min(len(plots), os.cpu_count() or 1)
+        
+        if n_workers > 1:
+            with ProcessPoolExecutor(max_workers=min(n_workers, len(plots))) as executor:
+                futures = [executor.submit(_render_plot, plot_func, args, str(path))
+                           for plot_func, args, path in plots]
+                for future in futures:
+                    future.result()
+        else:
+            for plot_func, args, path in plots:
+                _render_plot(plot_func, args, str(path))
         
         # Print comprehensive metrics
         print("\n📈 Performance Metrics:")
@@ -245,14 +431,14 @@ class ReportGenerator:
         
         # Save metrics to CSV
         metrics = self.analyzer.get_comprehensive_metrics()
-        metrics_df = pd.DataFrame([metrics])
+        metrics_df = pd.DataFrame([metrics.to_dict()])
         metrics_path = output_path / f"metrics_{timestamp}.csv"
         metrics_df.to_csv(metrics_path, index=False)
         print(f"\n  💾 Saved metrics to: {metrics_path}")
         
         # Save equity curve
         equity_path_csv = output_path / f"equity_curve_{timestamp}.csv"
-        self.equity_curve.to_csv(equity_path_csv, index=False)
+        self._write_csv(self.equity_curve, equity_path_csv)
         print(f"  💾 Saved equity curve data to: {equity_path_csv}")
         
         print("\n" + "="*70)
@@ -282,14 +468,14 @@ def test_report_generator():
     # Load data
     processor = DataProcessor()
     data_dir = Path("data/raw")
-    csv_files = list(data_dir.glob("*.csv"))
+    data_files = [*data_dir.glob("*.csv"), *data_dir.glob("*.parquet")]
     
-    if not csv_files:
+    if not data_files:
         print("❌ No data files found!")
         return
     
-    latest_file = max(csv_files, key=os.path.getctime)
-    data = processor.load_data(str(latest_file))
+    latest_file = max(data_files, key=os.path.getctime)
+    data = processor.load_data_cached(str(latest_file))
     
     # Use first 1000 rows
     data = data.head(1000)
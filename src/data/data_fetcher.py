@@ -4,19 +4,160 @@ Downloads historical market data from Binance API
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
+import asyncio
+import logging
 import time
 import os
 import sys
 from pathlib import Path
 
-# Add project root to path
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+# Optional: aiohttp for fetching historical batches concurrently
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+# Optional: pyarrow backs the on-disk kline cache and the CSV writer
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Add project root to path only when run as a script; package imports
+# already resolve, and re-inserting it can import modules twice
+if not __package__:
+    project_root = Path(__file__).parent.parent.parent
+    sys.path.insert(0, str(project_root))
 
 from config.data_config import *
+from src.data.data_processor import optimize_dtypes
+
+logger = logging.getLogger(__name__)
+
+
+# Milliseconds per unit of a Binance interval string (e.g. '15m', '4h')
+INTERVAL_UNIT_MS = {
+    "s": 1000,
+    "m": 60 * 1000,
+    "h": 60 * 60 * 1000,
+    "d": 24 * 60 * 60 * 1000,
+    "w": 7 * 24 * 60 * 60 * 1000,
+}
+
+
+def interval_to_ms(interval):
+    """
+    Convert a Binance interval string to milliseconds
+    
+    Args:
+        interval: Time interval (e.g., '1m', '5m', '1h')
+        
+    Returns:
+        int: Interval length in milliseconds
+    """
+    return int(interval[:-1]) * INTERVAL_UNIT_MS[interval[-1]]
+
+
+class KlineFileCache:
+    """
+    On-disk cache of raw kline batches, one Parquet file per request window
+    
+    Closed klines never change, so a window that ended well before now can
+    be served from disk on every later run. Batches read or written in this
+    process are also kept in memory.
+    """
+    
+    COLUMNS = [
+        'open_time', 'open', 'high', 'low', 'close', 'volume',
+        'close_time', 'quote_volume', 'trades', 'taker_buy_base',
+        'taker_buy_quote', 'ignore'
+    ]
+    
+    def __init__(self, symbol, interval, cache_dir=KLINE_CACHE_DIR):
+        """
+        Initialize kline cache
+        
+        Args:
+            symbol: Trading pair (e.g., 'BTCUSDT')
+            interval: Time interval (e.g., '1m', '5m', '1h')
+            cache_dir: Root directory for cached batches
+        """
+        self.interval_ms = interval_to_ms(interval)
+        self.directory = os.path.join(cache_dir, f"{symbol}_{interval}")
+        self.enabled = PYARROW_AVAILABLE
+        self._memory = {}
+        
+        if self.enabled:
+            os.makedirs(self.directory, exist_ok=True)
+    
+    def is_cacheable(self, start_time, end_time):
+        """
+        Whether a window is closed and safe to cache
+        
+        The last two intervals are excluded so the still-forming candle
+        is never stored.
+        """
+        if start_time is None or end_time is None:
+            return False
+        now_ms = int(time.time() * 1000)
+        return end_time < now_ms - 2 * self.interval_ms
+    
+    def _path(self, start_time, end_time, limit):
+        return os.path.join(self.directory, f"{int(start_time)}_{int(end_time)}_{limit}.parquet")
+    
+    def get(self, start_time, end_time, limit):
+        """
+        Look up a cached batch
+        
+        Returns:
+            list: Raw kline data, or None on a miss
+        """
+        if not self.enabled:
+            return None
+        
+        path = self._path(start_time, end_time, limit)
+        if path in self._memory:
+            return self._memory[path]
+        if not os.path.exists(path):
+            return None
+        
+        try:
+            df = pd.read_parquet(path, engine='pyarrow')
+        except Exception as e:
+            logger.warning("Could not read kline cache (%s), refetching", e)
+            return None
+        
+        data = [list(row) for row in df.itertuples(index=False, name=None)]
+        self._memory[path] = data
+        return data
+    
+    def put(self, start_time, end_time, limit, data):
+        """
+        Store a batch, writing to a temp file and renaming into place
+        """
+        if not self.enabled:
+            return
+        
+        path = self._path(start_time, end_time, limit)
+        self._memory[path] = data
+        
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            df = pd.DataFrame(data, columns=self.COLUMNS)
+            df.to_parquet(tmp_path, engine='pyarrow', compression='zstd', index=False)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning("Could not write kline cache: %s", e)
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
 
 
 class BinanceDataFetcher:
@@ -38,12 +179,26 @@ class BinanceDataFetcher:
         self.base_url = BINANCE_BASE_URL + BINANCE_API_VERSION
         self.session = requests.Session()
         
+        # Keep-alive connection pool, retrying rate limits and server errors
+        retry = Retry(
+            total=MAX_RETRIES,
+            backoff_factor=0.2,
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=True
+        )
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({"Accept-Encoding": "gzip"})
+        
         # Create data directories if they don't exist
         os.makedirs(RAW_DATA_DIR, exist_ok=True)
         os.makedirs(PROCESSED_DATA_DIR, exist_ok=True)
         os.makedirs(TICK_DATA_DIR, exist_ok=True)
         
-        print(f"✅ BinanceDataFetcher initialized for {symbol} at {interval} interval")
+        self.cache = KlineFileCache(symbol, interval)
+        
+        logger.debug("BinanceDataFetcher initialized for %s at %s interval", symbol, interval)
     
     def fetch_klines(self, start_time=None, end_time=None, limit=MAX_ROWS_PER_REQUEST):
         """
@@ -57,6 +212,13 @@ class BinanceDataFetcher:
         Returns:
             list: Raw kline data from API
         """
+        cacheable = self.cache.is_cacheable(start_time, end_time)
+        if cacheable:
+            cached = self.cache.get(start_time, end_time, limit)
+            if cached is not None:
+                logger.debug("Loaded %d candles from cache", len(cached))
+                return cached
+        
         endpoint = f"{self.base_url}/klines"
         
         params = {
@@ -75,13 +237,80 @@ class BinanceDataFetcher:
             response.raise_for_status()
             
             data = response.json()
-            print(f"✅ Fetched {len(data)} candles")
+            logger.debug("Fetched %d candles", len(data))
+            
+            if cacheable and data:
+                self.cache.put(start_time, end_time, limit, data)
             return data
             
         except requests.exceptions.RequestException as e:
-            print(f"❌ Error fetching data: {e}")
+            logger.error("Error fetching data: %s", e)
             return None
     
+    async def _fetch_klines_async(self, session, semaphore, start_time, end_time):
+        """
+        Fetch one batch of klines without blocking the event loop
+        
+        Retries with exponential backoff when Binance rate limits (429/418).
+        
+        Args:
+            session: Shared aiohttp.ClientSession
+            semaphore: Limits the number of requests in flight
+            start_time: Start timestamp in milliseconds
+            end_time: End timestamp in milliseconds
+            
+        Returns:
+            list: Raw kline data from API (None on failure)
+        """
+        endpoint = f"{self.base_url}/klines"
+        
+        params = {
+            "symbol": self.symbol,
+            "interval": self.interval,
+            "limit": MAX_ROWS_PER_REQUEST,
+            "startTime": int(start_time),
+            "endTime": int(end_time)
+        }
+        
+        async with semaphore:
+            for attempt in range(MAX_RETRIES + 1):
+                try:
+                    async with session.get(endpoint, params=params) as response:
+                        if response.status in (418, 429) and attempt < MAX_RETRIES:
+                            retry_after = response.headers.get("Retry-After")
+                            delay = float(retry_after) if retry_after else REQUEST_DELAY * 2 ** attempt
+                            await asyncio.sleep(delay)
+                            continue
+                        
+                        response.raise_for_status()
+                        return await response.json()
+                    
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    logger.error("Error fetching data: %s", e)
+                    return None
+        
+        return None
+    
+    async def _fetch_batches_async(self, windows):
+        """
+        Fetch all (start, end) windows concurrently over one session
+        
+        Args:
+            windows: List of (start_ms, end_ms) tuples
+            
+        Returns:
+            list: One kline batch (or None) per window, in window order
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        connector = aiohttp.TCPConnector(limit=16, ttl_dns_cache=300)
+        timeout = aiohttp.ClientTimeout(total=10)
+        
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            return await asyncio.gather(*[
+                self._fetch_klines_async(session, semaphore, start, end)
+                for start, end in windows
+            ])
+    
     def fetch_historical_data(self, days=DEFAULT_LOOKBACK_DAYS):
         """
         Fetch historical data for specified number of days
@@ -92,7 +321,7 @@ class BinanceDataFetcher:
         Returns:
             pd.DataFrame: Historical OHLCV data
         """
-        print(f"\n📊 Fetching {days} days of historical data for {self.symbol}...")
+        logger.info("Fetching %d days of historical data for %s", days, self.symbol)
         
         # Calculate time range
         end_time = datetime.now()
@@ -102,12 +331,109 @@ class BinanceDataFetcher:
         start_ms = int(start_time.timestamp() * 1000)
         end_ms = int(end_time.timestamp() * 1000)
         
-        all_data = []
+        if AIOHTTP_AVAILABLE and not self._in_event_loop():
+            all_data = self._fetch_historical_concurrent(start_ms, end_ms)
+        else:
+            all_data = self._fetch_historical_sequential(start_ms, end_ms)
+        
+        logger.info("Total candles fetched: %d", len(all_data))
+        
+        # Convert to DataFrame
+        if all_data:
+            df = self._parse_klines(all_data)
+            return df
+        else:
+            logger.error("No data fetched")
+            return None
+    
+    @staticmethod
+    def _in_event_loop():
+        """Whether an asyncio loop is already running (e.g. in Jupyter)"""
+        try:
+            asyncio.get_running_loop()
+            return True
+        except RuntimeError:
+            return False
+    
+    def _fetch_historical_concurrent(self, start_ms, end_ms):
+        """
+        Fetch [start_ms, end_ms] as fixed windows requested in parallel
+        
+        Each window spans MAX_ROWS_PER_REQUEST candles, so the windows are
+        known up front and do not depend on the previous response. Windows
+        are aligned to multiples of the batch length so that closed ones
+        map to the same cache entries from run to run.
+        
+        Args:
+            start_ms: Start timestamp in milliseconds
+            end_ms: End timestamp in milliseconds
+            
+        Returns:
+            list: Raw kline data in time order
+        """
+        batch_ms = MAX_ROWS_PER_REQUEST * interval_to_ms(self.interval)
+        aligned_start = start_ms - start_ms % batch_ms
+        windows = [(start, min(start + batch_ms - 1, end_ms))
+                   for start in range(aligned_start, end_ms, batch_ms)]
+        
+        batches = [self.cache.get(start, end, MAX_ROWS_PER_REQUEST)
+                   if self.cache.is_cacheable(start, end) else None
+                   for start, end in windows]
+        missing = [i for i, batch_data in enumerate(batches) if batch_data is None]
+        
+        logger.debug("%d batches cached, fetching %d concurrently",
+                     len(windows) - len(missing), len(missing))
+        if missing:
+            fetched = asyncio.run(self._fetch_batches_async([windows[i] for i in missing]))
+            for i, batch_data in zip(missing, fetched):
+                batches[i] = batch_data
+                start, end = windows[i]
+                if batch_data and self.cache.is_cacheable(start, end):
+                    self.cache.put(start, end, MAX_ROWS_PER_REQUEST, batch_data)
+        
+        received = []
+        for (start, _), batch_data in zip(windows, batches):
+            if batch_data is None:
+                logger.warning("No data returned for batch starting from %s",
+                               datetime.fromtimestamp(start / 1000))
+                continue
+            received.append(batch_data)
+        
+        # Drop candles from before the requested range (window alignment);
+        # only the first batch can contain them
+        if received:
+            first = next((i for i, kline in enumerate(received[0]) if kline[0] >= start_ms),
+                         len(received[0]))
+            received[0] = received[0][first:]
+        
+        # Copy the batches into one list allocated at its final size
+        all_data = [None] * sum(len(batch_data) for batch_data in received)
+        idx = 0
+        for batch_data in received:
+            all_data[idx:idx + len(batch_data)] = batch_data
+            idx += len(batch_data)
+        
+        return all_data
+    
+    def _fetch_historical_sequential(self, start_ms, end_ms):
+        """
+        Fetch [start_ms, end_ms] one batch at a time
+        
+        Args:
+            start_ms: Start timestamp in milliseconds
+            end_ms: End timestamp in milliseconds
+            
+        Returns:
+            list: Raw kline data in time order
+        """
+        # Preallocate for the expected candle count; trimmed at the end
+        all_data = [None] * ((end_ms - start_ms) // interval_to_ms(self.interval) + 10)
+        idx = 0
         current_start = start_ms
         
         # Fetch data in batches
         while current_start < end_ms:
-            print(f"  Fetching batch starting from {datetime.fromtimestamp(current_start/1000)}")
+            logger.debug("Fetching batch starting from %s", datetime.fromtimestamp(current_start / 1000))
             
             batch_data = self.fetch_klines(
                 start_time=current_start,
@@ -116,10 +442,11 @@ class BinanceDataFetcher:
             )
             
             if not batch_data:
-                print("  ⚠️ No data returned, stopping...")
+                logger.warning("No data returned, stopping")
                 break
             
-            all_data.extend(batch_data)
+            all_data[idx:idx + len(batch_data)] = batch_data
+            idx += len(batch_data)
             
             # Update start time for next batch
             current_start = batch_data[-1][6] + 1  # Close time of last candle + 1ms
@@ -131,57 +458,96 @@ class BinanceDataFetcher:
             if len(batch_data) < MAX_ROWS_PER_REQUEST:
                 break
         
-        print(f"\n✅ Total candles fetched: {len(all_data)}")
-        
-        # Convert to DataFrame
-        if all_data:
-            df = self._parse_klines(all_data)
-            return df
-        else:
-            print("❌ No data fetched!")
-            return None
+        del all_data[idx:]
+        return all_data
     
     def _parse_klines(self, klines_data):
         """
         Parse raw kline data into pandas DataFrame
         
+        With pyarrow, each raw column is converted straight to a typed
+        Arrow array and handed to pandas without an object block. The
+        NumPy fallback casts each column block once from the raw rows.
+        Binance returns klines in time order, so the data is only sorted
+        and deduplicated if an O(n) check finds it out of order.
+        
         Args:
             klines_data: Raw kline data from API
             
         Returns:
             pd.DataFrame: Parsed and formatted data
         """
-        columns = [
-            'open_time', 'open', 'high', 'low', 'close', 'volume',
-            'close_time', 'quote_volume', 'trades', 'taker_buy_base',
-            'taker_buy_quote', 'ignore'
-        ]
+        if PYARROW_AVAILABLE:
+            df = self._parse_klines_arrow(klines_data)
+        else:
+            df = self._parse_klines_numpy(klines_data)
+        
+        open_time = df['open_time'].to_numpy().view(np.int64)
+        if not np.all(np.diff(open_time) > 0):
+            df = (df.drop_duplicates(subset='open_time')
+                    .sort_values('open_time')
+                    .reset_index(drop=True))
         
-        df = pd.DataFrame(klines_data, columns=columns)
+        return optimize_dtypes(df)
+    
+    def _parse_klines_arrow(self, klines_data):
+        """Build the kline DataFrame from typed Arrow columns"""
+        raw_columns = list(zip(*klines_data))
+        
+        # Prices arrive as strings; the cast parses them in C++
+        # ('ignore' column (index 11) is dropped)
+        table = pa.table({
+            name: pa.array(raw_columns[index]).cast(arrow_type)
+            for name, index, arrow_type in [
+                ('open_time', 0, pa.int64()),
+                ('open', 1, pa.float64()),
+                ('high', 2, pa.float64()),
+                ('low', 3, pa.float64()),
+                ('close', 4, pa.float64()),
+                ('volume', 5, pa.float64()),
+                ('close_time', 6, pa.int64()),
+                ('quote_volume', 7, pa.float64()),
+                ('trades', 8, pa.int64()),
+                ('taker_buy_base', 9, pa.float64()),
+                ('taker_buy_quote', 10, pa.float64()),
+            ]
+        })
+        df = table.to_pandas(self_destruct=True)
         
-        # Convert timestamps to datetime
         df['open_time'] = pd.to_datetime(df['open_time'], unit='ms')
         df['close_time'] = pd.to_datetime(df['close_time'], unit='ms')
-        
-        # Convert price/volume columns to float
-        numeric_columns = ['open', 'high', 'low', 'close', 'volume', 
-                          'quote_volume', 'taker_buy_base', 'taker_buy_quote']
-        df[numeric_columns] = df[numeric_columns].astype(float)
-        
-        # Convert trades to int
-        df['trades'] = df['trades'].astype(int)
-        
-        # Drop the 'ignore' column
-        df = df.drop('ignore', axis=1)
-        
-        # Sort by time
-        df = df.sort_values('open_time').reset_index(drop=True)
-        
         return df
     
+    def _parse_klines_numpy(self, klines_data):
+        """Build the kline DataFrame from NumPy blocks cast once each"""
+        arr = np.array(klines_data, dtype=object)
+        
+        open_time = arr[:, 0].astype(np.int64)
+        close_time = arr[:, 6].astype(np.int64)
+        floats = arr[:, [1, 2, 3, 4, 5, 7, 9, 10]].astype(np.float64)
+        trades = arr[:, 8].astype(np.int64)
+        
+        # 'ignore' column (index 11) is dropped
+        return pd.DataFrame({
+            'open_time': pd.to_datetime(open_time, unit='ms'),
+            'open': floats[:, 0],
+            'high': floats[:, 1],
+            'low': floats[:, 2],
+            'close': floats[:, 3],
+            'volume': floats[:, 4],
+            'close_time': pd.to_datetime(close_time, unit='ms'),
+            'quote_volume': floats[:, 5],
+            'trades': trades,
+            'taker_buy_base': floats[:, 6],
+            'taker_buy_quote': floats[:, 7]
+        })
+    
     def save_data(self, df, filename=None):
         """
-        Save data to CSV file
+        Save data to a Parquet (default) or CSV file
+        
+        The format follows the filename suffix. Generated filenames use
+        zstd-compressed Parquet, falling back to CSV without pyarrow.
         
         Args:
             df: DataFrame to save
@@ -192,15 +558,19 @@ class BinanceDataFetcher:
         """
         if filename is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"{self.symbol}_{self.interval}_{timestamp}.csv"
+            extension = "parquet" if PYARROW_AVAILABLE else "csv"
+            filename = f"{self.symbol}_{self.interval}_{timestamp}.{extension}"
         
         filepath = os.path.join(RAW_DATA_DIR, filename)
-        df.to_csv(filepath, index=False)
+        if filepath.endswith('.parquet'):
+            df.to_parquet(filepath, engine='pyarrow', compression='zstd',
+                          compression_level=3, index=False)
+        elif PYARROW_AVAILABLE:
+            pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), filepath)
+        else:
+            df.to_csv(filepath, index=False)
         
-        print(f"\n💾 Data saved to: {filepath}")
-        print(f"   Rows: {len(df)}")
-        print(f"   Columns: {len(df.columns)}")
-        print(f"   Date range: {df['open_time'].min()} to {df['open_time'].max()}")
+        logger.info("Data saved to %s (%d rows, %d columns)", filepath, len(df), len(df.columns))
         
         return filepath
     
@@ -214,41 +584,55 @@ class BinanceDataFetcher:
         Returns:
             pd.DataFrame: Recent data
         """
-        print(f"\n📊 Fetching latest {limit} candles for {self.symbol}...")
+        logger.info("Fetching latest %d candles for %s", limit, self.symbol)
         
         klines = self.fetch_klines(limit=limit)
         
         if klines:
             df = self._parse_klines(klines)
-            print(f"✅ Fetched {len(df)} recent candles")
+            logger.info("Fetched %d recent candles", len(df))
             return df
         else:
             return None
     
-    def get_data_info(self, df):
+    def get_data_info(self, df, verbose=True):
         """
         Display information about the fetched data
         
         Args:
             df: DataFrame to analyze
+            verbose: Set False to skip the summary (and its reductions)
         """
+        if not verbose:
+            return
+        
+        stats = df.agg({
+            'open_time': ['min', 'max'],
+            'high': 'max',
+            'low': 'min',
+            'close': 'mean',
+            'volume': ['sum', 'mean'],
+            'trades': 'sum'
+        })
+        start, end = stats.at['min', 'open_time'], stats.at['max', 'open_time']
+        
         print("\n" + "="*70)
         print("DATA INFORMATION")
         print("="*70)
         print(f"Symbol: {self.symbol}")
         print(f"Interval: {self.interval}")
         print(f"Total Rows: {len(df)}")
-        print(f"Date Range: {df['open_time'].min()} to {df['open_time'].max()}")
-        print(f"Duration: {(df['open_time'].max() - df['open_time'].min()).days} days")
+        print(f"Date Range: {start} to {end}")
+        print(f"Duration: {(end - start).days} days")
         print(f"\nPrice Statistics:")
-        print(f"  High: ${df['high'].max():,.2f}")
-        print(f"  Low: ${df['low'].min():,.2f}")
-        print(f"  Mean: ${df['close'].mean():,.2f}")
+        print(f"  High: ${stats.at['max', 'high']:,.2f}")
+        print(f"  Low: ${stats.at['min', 'low']:,.2f}")
+        print(f"  Mean: ${stats.at['mean', 'close']:,.2f}")
         print(f"  Latest: ${df['close'].iloc[-1]:,.2f}")
         print(f"\nVolume Statistics:")
-        print(f"  Total Volume: {df['volume'].sum():,.2f}")
-        print(f"  Average Volume: {df['volume'].mean():,.2f}")
-        print(f"  Total Trades: {df['trades'].sum():,}")
+        print(f"  Total Volume: {stats.at['sum', 'volume']:,.2f}")
+        print(f"  Average Volume: {stats.at['mean', 'volume']:,.2f}")
+        print(f"  Total Trades: {int(stats.at['sum', 'trades']):,}")
         print("="*70)
 
 
@@ -256,6 +640,8 @@ def main():
     """
     Test the data fetcher
     """
+    logging.basicConfig(level=LOG_LEVEL, format=LOG_FORMAT)
+    
     print("="*70)
     print("BINANCE DATA FETCHER - TEST RUN")
     print("="*70)
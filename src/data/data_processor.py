@@ -6,16 +6,322 @@ Cleans, validates, and processes raw market data
 import pandas as pd
 import numpy as np
 from datetime import datetime
+import logging
+import mmap
 import os
 import sys
 from pathlib import Path
 
-# Add project root to path
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+# Add project root to path only when run as a script; package imports
+# already resolve, and re-inserting it can import modules twice
+if not __package__:
+    project_root = Path(__file__).parent.parent.parent
+    sys.path.insert(0, str(project_root))
 
 from config.data_config import *
 
+logger = logging.getLogger(__name__)
+
+# Optional: pyarrow provides the multithreaded CSV reader and Parquet cache
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Optional: numexpr fuses the elementwise price-range expressions
+try:
+    import numexpr as ne
+    NUMEXPR_AVAILABLE = True
+except ImportError:
+    NUMEXPR_AVAILABLE = False
+
+# Optional: numba JIT for the indicator, outlier and fill kernels
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+# Columns needed for backtesting
+BACKTEST_COLUMNS = ['open_time', 'open', 'high', 'low', 'close', 'volume']
+
+# Explicit CSV column types for the pyarrow reader (skips type inference)
+CSV_COLUMN_TYPES = {
+    'open_time': 'timestamp',
+    'close_time': 'timestamp',
+    'open': 'float64',
+    'high': 'float64',
+    'low': 'float64',
+    'close': 'float64',
+    'volume': 'float64',
+    'quote_volume': 'float64',
+    'trades': 'int64',
+    'taker_buy_base': 'float64',
+    'taker_buy_quote': 'float64',
+}
+
+# Price columns stored as float32 by optimize_dtypes while all are within
+# FLOAT32_MAX_PRICE (decided together so OHLC never mixes dtypes)
+FLOAT32_PRICE_COLUMNS = ['open', 'high', 'low', 'close']
+
+# Base-asset volume columns stored as float32 by optimize_dtypes (quote-asset
+# volumes run to millions of USDT per bar and stay float64)
+FLOAT32_VOLUME_COLUMNS = ['volume', 'taker_buy_base']
+
+
+def optimize_dtypes(df):
+    """
+    Downcast OHLCV columns to float32 and trade counts to int32
+    
+    Halves the memory read by every rolling/EWM pass. The price columns
+    share one dtype: if any of them reaches past FLOAT32_MAX_PRICE (2**17,
+    where the float32 spacing grows to 0.0156 and cents are lost) they all
+    keep float64, so a rounded close can never exceed an unrounded high.
+    Quote-asset volume columns always keep float64.
+    
+    Args:
+        df: DataFrame with OHLCV data (modified in place)
+        
+    Returns:
+        pd.DataFrame: The same DataFrame
+    """
+    price_cols = [col for col in FLOAT32_PRICE_COLUMNS if col in df.columns]
+    if price_cols and df[price_cols].abs().max().max() > FLOAT32_MAX_PRICE:
+        price_cols = []
+    float_cols = price_cols + [col for col in FLOAT32_VOLUME_COLUMNS if col in df.columns]
+    if float_cols:
+        df[float_cols] = df[float_cols].astype(np.float32)
+    if 'trades' in df.columns:
+        df['trades'] = df['trades'].astype(np.int32)
+    
+    return df
+
+
+def _indicators_py(close, volume):
+    """
+    Compute returns, SMAs, EMAs, rolling volatility and volume SMA in one pass
+    
+    Sliding sums give O(1) SMA updates; volatility uses a sliding-window
+    Welford update. Outputs match pandas pct_change, rolling(w).mean(),
+    ewm(span, adjust=False).mean() and rolling(w).std(). The compiled
+    kernel releases the GIL, so frames for several symbols can be
+    processed from a thread pool.
+    
+    Returns:
+        tuple: (returns, log_returns, sma_10, sma_50, sma_200, ema_10,
+                ema_50, volatility_10, volatility_50, volume_sma_10)
+    """
+    n = len(close)
+    returns = np.full(n, np.nan)
+    log_returns = np.full(n, np.nan)
+    sma_10 = np.full(n, np.nan)
+    sma_50 = np.full(n, np.nan)
+    sma_200 = np.full(n, np.nan)
+    ema_10 = np.full(n, np.nan)
+    ema_50 = np.full(n, np.nan)
+    volatility_10 = np.full(n, np.nan)
+    volatility_50 = np.full(n, np.nan)
+    volume_sma_10 = np.full(n, np.nan)
+    
+    alpha_10 = 2.0 / 11.0
+    alpha_50 = 2.0 / 51.0
+    
+    sum_10 = 0.0
+    sum_50 = 0.0
+    sum_200 = 0.0
+    volume_sum_10 = 0.0
+    ema_10_state = 0.0
+    ema_50_state = 0.0
+    mean_10 = 0.0
+    m2_10 = 0.0
+    mean_50 = 0.0
+    m2_50 = 0.0
+    
+    for i in range(n):
+        c = float(close[i])
+        
+        # Sliding sums for the simple moving averages
+        sum_10 += c
+        sum_50 += c
+        sum_200 += c
+        volume_sum_10 += float(volume[i])
+        if i >= 10:
+            sum_10 -= float(close[i - 10])
+            volume_sum_10 -= float(volume[i - 10])
+        if i >= 50:
+            sum_50 -= float(close[i - 50])
+        if i >= 200:
+            sum_200 -= float(close[i - 200])
+        
+        if i >= 9:
+            sma_10[i] = sum_10 / 10.0
+            volume_sma_10[i] = volume_sum_10 / 10.0
+        if i >= 49:
+            sma_50[i] = sum_50 / 50.0
+        if i >= 199:
+            sma_200[i] = sum_200 / 200.0
+        
+        # Exponential moving averages (adjust=False)
+        if i == 0:
+            ema_10_state = c
+            ema_50_state = c
+        else:
+            ema_10_state = alpha_10 * c + (1.0 - alpha_10) * ema_10_state
+            ema_50_state = alpha_50 * c + (1.0 - alpha_50) * ema_50_state
+        ema_10[i] = ema_10_state
+        ema_50[i] = ema_50_state
+        
+        if i == 0:
+            continue
+        
+        prev = float(close[i - 1])
+        r = c / prev - 1.0
+        returns[i] = r
+        log_returns[i] = np.log1p(r)
+        
+        # Rolling std of returns; returns[1..i] are defined, i values so far
+        if i <= 10:
+            delta = r - mean_10
+            mean_10 += delta / i
+            m2_10 += delta * (r - mean_10)
+        else:
+            old = returns[i - 10]
+            new_mean = mean_10 + (r - old) / 10.0
+            m2_10 += (r - old) * (r - new_mean + old - mean_10)
+            mean_10 = new_mean
+        if i >= 10:
+            volatility_10[i] = np.sqrt(max(m2_10, 0.0) / 9.0)
+        
+        if i <= 50:
+            delta = r - mean_50
+            mean_50 += delta / i
+            m2_50 += delta * (r - mean_50)
+        else:
+            old = returns[i - 50]
+            new_mean = mean_50 + (r - old) / 50.0
+            m2_50 += (r - old) * (r - new_mean + old - mean_50)
+            mean_50 = new_mean
+        if i >= 50:
+            volatility_50[i] = np.sqrt(max(m2_50, 0.0) / 49.0)
+    
+    return (returns, log_returns, sma_10, sma_50, sma_200, ema_10, ema_50,
+            volatility_10, volatility_50, volume_sma_10)
+
+
+_indicators = njit(cache=True, nogil=True, fastmath=True)(_indicators_py) if NUMBA_AVAILABLE else None
+
+def _zscore_mask_py(x, threshold):
+    """
+    Keep-mask for |z| < threshold, with mean/std from one Welford pass
+    
+    NaN values are skipped in the statistics and never kept, as with
+    the pandas z-score filter.
+    
+    Returns:
+        np.ndarray: Boolean mask, True for rows to keep
+    """
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    for i in range(len(x)):
+        value = float(x[i])
+        if np.isnan(value):
+            continue
+        n += 1
+        delta = value - mean
+        mean += delta / n
+        m2 += delta * (value - mean)
+    
+    limit = threshold * np.sqrt(m2 / (n - 1)) if n > 1 else np.nan
+    
+    mask = np.empty(len(x), dtype=np.bool_)
+    for i in range(len(x)):
+        mask[i] = abs(float(x[i]) - mean) < limit
+    return mask
+
+
+_zscore_mask = njit(cache=True, nogil=True)(_zscore_mask_py) if NUMBA_AVAILABLE else None
+
+def _ffill_bfill_py(arr):
+    """
+    Forward fill each column of a 2D float array in place, then back
+    fill the leading NaNs from the first valid value
+    """
+    n = arr.shape[0]
+    for c in prange(arr.shape[1]):
+        last = np.nan
+        first_valid = -1
+        for i in range(n):
+            if np.isnan(arr[i, c]):
+                arr[i, c] = last
+            else:
+                last = arr[i, c]
+                if first_valid < 0:
+                    first_valid = i
+        
+        for i in range(max(first_valid, 0)):
+            arr[i, c] = arr[first_valid, c]
+
+
+_ffill_bfill = njit(cache=True, nogil=True, parallel=True)(_ffill_bfill_py) if NUMBA_AVAILABLE else None
+
+def _validation_counts_py(prices, times, expected_ns):
+    """
+    Count validation failures in one traversal of the OHLCV rows
+    
+    Args:
+        prices: (n, 5) array of open, high, low, close, volume
+        times: Sorted open times as int64 nanoseconds
+        expected_ns: Expected spacing between bars in nanoseconds
+        
+    Returns:
+        tuple: (negatives per column, invalid high/low, open outside range,
+                close outside range, duplicate timestamps, time gaps)
+    """
+    negatives = np.zeros(prices.shape[1], dtype=np.int64)
+    invalid_high_low = 0
+    invalid_open = 0
+    invalid_close = 0
+    
+    for i in range(prices.shape[0]):
+        for c in range(prices.shape[1]):
+            if prices[i, c] < 0:
+                negatives[c] += 1
+        
+        o = prices[i, 0]
+        h = prices[i, 1]
+        l = prices[i, 2]
+        cl = prices[i, 3]
+        if h < l:
+            invalid_high_low += 1
+        if o > h or o < l:
+            invalid_open += 1
+        if cl > h or cl < l:
+            invalid_close += 1
+    
+    duplicates = 0
+    gaps = 0
+    for i in range(1, len(times)):
+        diff = times[i] - times[i - 1]
+        if diff == 0:
+            duplicates += 1
+        elif diff > expected_ns * 1.5:
+            gaps += 1
+    
+    return negatives, invalid_high_low, invalid_open, invalid_close, duplicates, gaps
+
+
+_validation_counts = njit(cache=True, nogil=True)(_validation_counts_py) if NUMBA_AVAILABLE else None
+
+# Output columns of _indicators, in return order
+INDICATOR_COLUMNS = ['returns', 'log_returns', 'sma_10', 'sma_50', 'sma_200',
+                     'ema_10', 'ema_50', 'volatility_10', 'volatility_50',
+                     'volume_sma_10']
+
 
 class DataProcessor:
     """
@@ -24,36 +330,138 @@ class DataProcessor:
     
     def __init__(self):
         """Initialize data processor"""
-        print("✅ DataProcessor initialized")
+        logger.debug("DataProcessor initialized")
     
-    def load_data(self, filepath):
+    def load_data(self, filepath, nrows=None, chunksize=None):
         """
-        Load data from CSV file
+        Load data from a CSV or Parquet file
         
         Args:
-            filepath: Path to CSV file
+            filepath: Path to CSV or Parquet file
+            nrows: Only read the first N rows (optional)
+            chunksize: Read the file in chunks of this many rows (optional)
             
         Returns:
             pd.DataFrame: Loaded data
         """
-        print(f"\n📂 Loading data from: {filepath}")
+        logger.info("Loading data from %s", filepath)
         
         try:
-            df = pd.read_csv(filepath)
+            if str(filepath).endswith('.parquet'):
+                # Typed columns, timestamps already parsed
+                df = pd.read_parquet(filepath, engine='pyarrow')
+                if nrows is not None:
+                    df = df.head(nrows)
+            elif nrows is None and PYARROW_AVAILABLE:
+                df = self._read_csv_pyarrow(filepath)
+            elif nrows is None and chunksize:
+                chunks = pd.read_csv(filepath, chunksize=chunksize)
+                df = pd.concat(chunks, ignore_index=True)
+            else:
+                df = pd.read_csv(filepath, nrows=nrows)
             
             # Parse datetime columns
-            if 'open_time' in df.columns:
-                df['open_time'] = pd.to_datetime(df['open_time'])
-            if 'close_time' in df.columns:
-                df['close_time'] = pd.to_datetime(df['close_time'])
+            for col in ['open_time', 'close_time']:
+                if col in df.columns and not pd.api.types.is_datetime64_any_dtype(df[col]):
+                    df[col] = pd.to_datetime(df[col])
+            
+            optimize_dtypes(df)
             
-            print(f"✅ Loaded {len(df)} rows")
+            logger.info("Loaded %d rows", len(df))
             return df
             
         except Exception as e:
-            print(f"❌ Error loading data: {e}")
+            logger.error("Error loading data: %s", e)
             return None
     
+    def _read_csv_pyarrow(self, filepath):
+        """
+        Read a whole CSV file with pyarrow's multithreaded reader
+        
+        Args:
+            filepath: Path to CSV file
+            
+        Returns:
+            pd.DataFrame: Loaded data (timestamps parsed, NumPy dtypes)
+        """
+        column_types = {
+            col: pa.timestamp('ns') if kind == 'timestamp' else pa.type_for_alias(kind)
+            for col, kind in CSV_COLUMN_TYPES.items()
+        }
+        convert_options = pa_csv.ConvertOptions(column_types=column_types)
+        
+        try:
+            table = pa_csv.read_csv(filepath, convert_options=convert_options)
+        except pa.ArrowInvalid:
+            # Values in an unexpected format; let pyarrow infer, pandas parse
+            table = pa_csv.read_csv(filepath)
+        
+        return table.to_pandas(self_destruct=True)
+    
+    def load_data_cached(self, filepath, columns=BACKTEST_COLUMNS, nrows=None):
+        """
+        Load data through a Parquet cache stored next to the CSV file
+        
+        The CSV is parsed once and written as a sibling .parquet file;
+        later calls read only the requested columns from the cache. A
+        .parquet path is its own cache and is read directly.
+        Falls back to load_data() if pyarrow is not installed.
+        
+        Args:
+            filepath: Path to CSV file
+            columns: Columns to load (None for all)
+            nrows: Only load the first N rows (optional)
+            
+        Returns:
+            pd.DataFrame: Loaded data
+        """
+        if not PYARROW_AVAILABLE:
+            return self.load_data(filepath, nrows=nrows, chunksize=CSV_CHUNKSIZE)
+        
+        cache_path = Path(filepath).with_suffix('.parquet')
+        
+        # Rebuild cache if missing or older than the CSV
+        if not cache_path.exists() or cache_path.stat().st_mtime < os.path.getmtime(filepath):
+            df = self.load_data(filepath, chunksize=CSV_CHUNKSIZE)
+            if df is None:
+                return None
+            
+            try:
+                df.to_parquet(cache_path, engine='pyarrow', compression='zstd', index=False)
+                logger.info("Cached data to %s", cache_path)
+            except Exception as e:
+                logger.warning("Could not write Parquet cache: %s", e)
+            
+            if columns is not None:
+                df = df[columns]
+            return df.head(nrows) if nrows is not None else df
+        
+        logger.info("Loading cached data from %s", cache_path)
+        
+        try:
+            if nrows is not None:
+                # Read only the leading row groups needed (a batch never
+                # spans row groups, so keep reading until nrows are in)
+                batches = []
+                n_read = 0
+                for batch in pq.ParquetFile(cache_path).iter_batches(batch_size=nrows, columns=columns):
+                    batches.append(batch)
+                    n_read += batch.num_rows
+                    if n_read >= nrows:
+                        break
+                if batches:
+                    df = pa.Table.from_batches(batches).slice(0, nrows).to_pandas()
+                else:
+                    df = pd.read_parquet(cache_path, engine='pyarrow', columns=columns)
+            else:
+                df = pd.read_parquet(cache_path, engine='pyarrow', columns=columns)
+            logger.info("Loaded %d rows", len(df))
+            return df
+            
+        except Exception as e:
+            logger.warning("Error reading cache (%s), falling back to CSV", e)
+            return self.load_data(filepath, nrows=nrows, chunksize=CSV_CHUNKSIZE)
+    
     def validate_data(self, df):
         """
         Validate data quality and structure
@@ -64,7 +472,7 @@ class DataProcessor:
         Returns:
             tuple: (is_valid, issues_list)
         """
-        print("\n🔍 Validating data...")
+        logger.debug("Validating data")
         
         issues = []
         
@@ -73,52 +481,58 @@ class DataProcessor:
         if missing.any():
             issues.append(f"Missing values found: {missing[missing > 0].to_dict()}")
         
+        numeric_cols = ['open', 'high', 'low', 'close', 'volume']
+        expected_diff = pd.Timedelta(minutes=1)  # For 1m data
+        
+        if _validation_counts is not None and all(col in df.columns for col in numeric_cols + ['open_time']):
+            # All row checks in one pass over the typed columns
+            prices = df[numeric_cols].to_numpy(dtype=np.float64)
+            times = np.sort(df['open_time'].to_numpy().astype('datetime64[ns]').view(np.int64))
+            negatives, invalid_high_low, invalid_open, invalid_close, duplicates, gaps = \
+                _validation_counts(prices, times, expected_diff.value)
+            negatives = dict(zip(numeric_cols, negatives))
+        else:
+            duplicates = df.duplicated(subset=['open_time']).sum() if 'open_time' in df.columns else 0
+            negatives = {col: (df[col] < 0).sum() for col in numeric_cols if col in df.columns}
+            
+            invalid_high_low = invalid_open = invalid_close = 0
+            if all(col in df.columns for col in ['high', 'low', 'open', 'close']):
+                invalid_high_low = (df['high'] < df['low']).sum()
+                invalid_open = ((df['open'] > df['high']) | (df['open'] < df['low'])).sum()
+                invalid_close = ((df['close'] > df['high']) | (df['close'] < df['low'])).sum()
+            
+            gaps = 0
+            if 'open_time' in df.columns:
+                time_diffs = df['open_time'].sort_values().diff()
+                gaps = (time_diffs > expected_diff * 1.5).sum()
+        
         # Check for duplicate timestamps
-        if CHECK_FOR_DUPLICATES:
-            duplicates = df.duplicated(subset=['open_time']).sum()
-            if duplicates > 0:
-                issues.append(f"Duplicate timestamps: {duplicates}")
+        if CHECK_FOR_DUPLICATES and duplicates > 0:
+            issues.append(f"Duplicate timestamps: {duplicates}")
         
         # Check for negative values
-        numeric_cols = ['open', 'high', 'low', 'close', 'volume']
-        for col in numeric_cols:
-            if col in df.columns:
-                negatives = (df[col] < 0).sum()
-                if negatives > 0:
-                    issues.append(f"Negative values in {col}: {negatives}")
+        for col, count in negatives.items():
+            if count > 0:
+                issues.append(f"Negative values in {col}: {count}")
         
         # Check price consistency (high >= low, etc.)
-        if all(col in df.columns for col in ['high', 'low', 'open', 'close']):
-            invalid_high_low = (df['high'] < df['low']).sum()
-            if invalid_high_low > 0:
-                issues.append(f"Invalid high/low: {invalid_high_low}")
-            
-            invalid_open = ((df['open'] > df['high']) | (df['open'] < df['low'])).sum()
-            if invalid_open > 0:
-                issues.append(f"Open outside high/low range: {invalid_open}")
-            
-            invalid_close = ((df['close'] > df['high']) | (df['close'] < df['low'])).sum()
-            if invalid_close > 0:
-                issues.append(f"Close outside high/low range: {invalid_close}")
+        if invalid_high_low > 0:
+            issues.append(f"Invalid high/low: {invalid_high_low}")
+        if invalid_open > 0:
+            issues.append(f"Open outside high/low range: {invalid_open}")
+        if invalid_close > 0:
+            issues.append(f"Close outside high/low range: {invalid_close}")
         
         # Check for gaps in time series
-        if CHECK_FOR_GAPS and 'open_time' in df.columns:
-            df_sorted = df.sort_values('open_time')
-            time_diffs = df_sorted['open_time'].diff()
-            expected_diff = pd.Timedelta(minutes=1)  # For 1m data
-            
-            gaps = (time_diffs > expected_diff * 1.5).sum()
-            if gaps > 0:
-                issues.append(f"Time gaps detected: {gaps}")
+        if CHECK_FOR_GAPS and gaps > 0:
+            issues.append(f"Time gaps detected: {gaps}")
         
         is_valid = len(issues) == 0
         
         if is_valid:
-            print("✅ Data validation passed!")
+            logger.info("Data validation passed")
         else:
-            print("⚠️ Data validation issues found:")
-            for issue in issues:
-                print(f"  - {issue}")
+            logger.warning("Data validation issues found: %s", "; ".join(issues))
         
         return is_valid, issues
     
@@ -137,22 +551,26 @@ class DataProcessor:
         if not CHECK_FOR_OUTLIERS:
             return df
         
-        print(f"\n🔍 Checking for outliers in {column} (threshold={threshold})...")
+        logger.debug("Checking for outliers in %s (threshold=%s)", column, threshold)
         
         initial_len = len(df)
         
-        # Calculate z-scores
-        z_scores = np.abs((df[column] - df[column].mean()) / df[column].std())
-        
-        # Filter outliers
-        df_clean = df[z_scores < threshold].copy()
+        if _zscore_mask is not None:
+            # Stats and mask in two passes over the raw column
+            df_clean = df.iloc[_zscore_mask(df[column].to_numpy(), threshold)]
+        else:
+            # Calculate z-scores
+            z_scores = np.abs((df[column] - df[column].mean()) / df[column].std())
+            
+            # Filter outliers
+            df_clean = df[z_scores < threshold].copy()
         
         removed = initial_len - len(df_clean)
         
         if removed > 0:
-            print(f"⚠️ Removed {removed} outliers ({removed/initial_len*100:.2f}%)")
+            logger.warning("Removed %d outliers (%.2f%%)", removed, removed / initial_len * 100)
         else:
-            print(f"✅ No outliers detected")
+            logger.info("No outliers detected")
         
         return df_clean
     
@@ -166,21 +584,37 @@ class DataProcessor:
         Returns:
             pd.DataFrame: Data with filled values
         """
-        print("\n🔧 Filling missing data...")
+        logger.debug("Filling missing data")
         
         initial_missing = df.isnull().sum().sum()
         
         if initial_missing == 0:
-            print("✅ No missing data to fill")
+            logger.info("No missing data to fill")
             return df
         
         # Forward fill then backward fill
-        df_filled = df.fillna(method='ffill').fillna(method='bfill')
+        if _ffill_bfill is not None:
+            df_filled = df.copy()
+            float_cols = df.select_dtypes(include='floating').columns
+            
+            # One in-place kernel call per float dtype (float32/float64)
+            for dtype in df[float_cols].dtypes.unique():
+                cols = float_cols[df[float_cols].dtypes == dtype]
+                arr = df[cols].to_numpy(copy=True)
+                _ffill_bfill(arr)
+                df_filled[cols] = arr
+            
+            # Timestamps and other columns keep the pandas path
+            other_cols = df.columns.difference(float_cols)
+            if df[other_cols].isnull().any().any():
+                df_filled[other_cols] = df[other_cols].ffill().bfill()
+        else:
+            df_filled = df.ffill().bfill()
         
         final_missing = df_filled.isnull().sum().sum()
         filled = initial_missing - final_missing
         
-        print(f"✅ Filled {filled} missing values")
+        logger.info("Filled %d missing values", filled)
         
         return df_filled
     
@@ -194,39 +628,66 @@ class DataProcessor:
         Returns:
             pd.DataFrame: Data with added indicators
         """
-        print("\n📊 Adding technical indicators...")
+        logger.debug("Adding technical indicators")
         
-        df = df.copy()
+        close = df['close']
+        volume = df['volume']
         
-        # Returns
-        df['returns'] = df['close'].pct_change()
-        df['log_returns'] = np.log(df['close'] / df['close'].shift(1))
-        
-        # Moving averages
-        df['sma_10'] = df['close'].rolling(window=10).mean()
-        df['sma_50'] = df['close'].rolling(window=50).mean()
-        df['sma_200'] = df['close'].rolling(window=200).mean()
-        
-        # Exponential moving averages
-        df['ema_10'] = df['close'].ewm(span=10, adjust=False).mean()
-        df['ema_50'] = df['close'].ewm(span=50, adjust=False).mean()
-        
-        # Volatility (rolling standard deviation)
-        df['volatility_10'] = df['returns'].rolling(window=10).std()
-        df['volatility_50'] = df['returns'].rolling(window=50).std()
-        
-        # Volume indicators
-        df['volume_sma_10'] = df['volume'].rolling(window=10).mean()
-        df['volume_ratio'] = df['volume'] / df['volume_sma_10']
+        if _indicators is not None:
+            # Returns, moving averages, EMAs, volatility and volume SMA in one pass
+            outputs = _indicators(np.ascontiguousarray(close.to_numpy()),
+                                  np.ascontiguousarray(volume.to_numpy()))
+            indicators = dict(zip(INDICATOR_COLUMNS, outputs))
+        else:
+            indicators = {}
+            
+            # Returns
+            returns = close.pct_change()
+            indicators['returns'] = returns
+            indicators['log_returns'] = np.log1p(returns.to_numpy())
+            
+            # Moving averages
+            indicators['sma_10'] = close.rolling(window=10).mean()
+            indicators['sma_50'] = close.rolling(window=50).mean()
+            indicators['sma_200'] = close.rolling(window=200).mean()
+            
+            # Exponential moving averages
+            indicators['ema_10'] = close.ewm(span=10, adjust=False).mean()
+            indicators['ema_50'] = close.ewm(span=50, adjust=False).mean()
+            
+            # Volatility (rolling standard deviation)
+            indicators['volatility_10'] = returns.rolling(window=10).std()
+            indicators['volatility_50'] = returns.rolling(window=50).std()
+            
+            # Volume indicators
+            indicators['volume_sma_10'] = volume.rolling(window=10).mean()
+        
+        indicators['volume_ratio'] = volume / indicators['volume_sma_10']
+        
+        # Price ranges and bid-ask spread proxy (high - low as % of close)
+        h = df['high'].to_numpy()
+        l = df['low'].to_numpy()
+        o = df['open'].to_numpy()
+        c = close.to_numpy()
+        if NUMEXPR_AVAILABLE:
+            indicators['high_low_range'] = ne.evaluate("h - l")
+            indicators['open_close_range'] = ne.evaluate("abs(o - c)")
+            indicators['spread_pct'] = ne.evaluate("(h - l) / c * 100")
+        else:
+            high_low = h - l
+            indicators['high_low_range'] = high_low
+            indicators['open_close_range'] = np.abs(o - c)
+            indicators['spread_pct'] = high_low / c * 100
         
-        # Price range
-        df['high_low_range'] = df['high'] - df['low']
-        df['open_close_range'] = abs(df['open'] - df['close'])
+        # Rolling/EWM results come back as float64; match float32 input
+        if close.dtype == np.float32:
+            indicators = {col: np.asarray(values, dtype=np.float32)
+                          for col, values in indicators.items()}
         
-        # Bid-ask spread proxy (high - low as percentage of close)
-        df['spread_pct'] = (df['high'] - df['low']) / df['close'] * 100
+        # New frame sharing the input blocks; no copy of the OHLCV data
+        df = pd.concat([df, pd.DataFrame(indicators, index=df.index)], axis=1, copy=False)
         
-        print(f"✅ Added {len([col for col in df.columns if col not in ['open', 'high', 'low', 'close', 'volume']])} indicators")
+        logger.info("Added %d indicators", len(indicators))
         
         return df
     
@@ -234,33 +695,44 @@ class DataProcessor:
         """
         Resample data to different time interval
         
+        Bars are bucketed by integer bin id (open time // interval, aligned
+        to the epoch) and each column is aggregated with one ufunc.reduceat
+        over the bin boundaries. Empty bins are omitted.
+        
         Args:
-            df: DataFrame with datetime index
+            df: DataFrame with an 'open_time' column
             target_interval: Target interval (e.g., '5m', '1h')
             
         Returns:
             pd.DataFrame: Resampled data
         """
-        print(f"\n🔄 Resampling data to {target_interval}...")
-        
-        df = df.copy()
-        df = df.set_index('open_time')
-        
-        # Resample OHLCV data
-        resampled = df.resample(target_interval).agg({
-            'open': 'first',
-            'high': 'max',
-            'low': 'min',
-            'close': 'last',
-            'volume': 'sum',
-            'trades': 'sum',
-            'quote_volume': 'sum',
+        logger.debug("Resampling data to %s", target_interval)
+        
+        if not df['open_time'].is_monotonic_increasing:
+            df = df.sort_values('open_time')
+        
+        bin_ns = pd.Timedelta(target_interval).value
+        times = df['open_time'].to_numpy().astype('datetime64[ns]').view(np.int64)
+        bin_id = times // bin_ns
+        
+        # First row of each bin, and the last row of each bin
+        starts = np.flatnonzero(np.diff(bin_id, prepend=bin_id[:1] - 1))
+        ends = np.flatnonzero(np.diff(bin_id, append=bin_id[-1:] + 1))
+        
+        resampled = pd.DataFrame({
+            'open_time': pd.to_datetime(bin_id[starts] * bin_ns, unit='ns'),
+            'open': df['open'].to_numpy()[starts],
+            'high': np.fmax.reduceat(df['high'].to_numpy(), starts),
+            'low': np.fmin.reduceat(df['low'].to_numpy(), starts),
+            'close': df['close'].to_numpy()[ends],
+            'volume': np.add.reduceat(df['volume'].to_numpy(), starts),
+            'trades': np.add.reduceat(df['trades'].to_numpy(), starts),
+            'quote_volume': np.add.reduceat(df['quote_volume'].to_numpy(), starts),
         })
         
-        resampled = resampled.dropna()
-        resampled = resampled.reset_index()
+        resampled = resampled.dropna().reset_index(drop=True)
         
-        print(f"✅ Resampled from {len(df)} to {len(resampled)} rows")
+        logger.info("Resampled from %d to %d rows", len(df), len(resampled))
         
         return resampled
     
@@ -268,6 +740,10 @@ class DataProcessor:
         """
         Complete processing pipeline
         
+        Data is validated once, on entry. The later steps only fill values,
+        drop rows or append indicator columns, none of which can introduce
+        negative prices or break the high/low ordering.
+        
         Args:
             df: Raw DataFrame
             add_indicators: Whether to add technical indicators
@@ -276,9 +752,7 @@ class DataProcessor:
         Returns:
             pd.DataFrame: Fully processed data
         """
-        print("\n" + "="*70)
-        print("DATA PROCESSING PIPELINE")
-        print("="*70)
+        logger.info("Running data processing pipeline")
         
         # Validate
         is_valid, issues = self.validate_data(df)
@@ -294,33 +768,94 @@ class DataProcessor:
         if add_indicators:
             df = self.add_technical_indicators(df)
         
-        # Final validation
-        is_valid, issues = self.validate_data(df)
-        
-        print("\n✅ Processing pipeline completed!")
-        print(f"   Final rows: {len(df)}")
-        print(f"   Final columns: {len(df.columns)}")
+        logger.info("Processing pipeline completed (%d rows, %d columns)", len(df), len(df.columns))
         
         return df
     
-    def save_processed_data(self, df, filename):
+    def save_processed_data(self, df, filename, direct_io=False):
         """
         Save processed data
         
+        Written as zstd-compressed Parquet when pyarrow is installed (a
+        .csv filename is given a .parquet suffix), otherwise as CSV.
+        
         Args:
             df: Processed DataFrame
             filename: Output filename
+            direct_io: Bypass the page cache (O_DIRECT) for frames of at
+                least DIRECT_IO_MIN_BYTES, where the platform supports it
             
         Returns:
             str: Path to saved file
         """
         filepath = os.path.join(PROCESSED_DATA_DIR, filename)
-        df.to_csv(filepath, index=False)
+        if PYARROW_AVAILABLE:
+            filepath = str(Path(filepath).with_suffix('.parquet'))
+            
+            written = False
+            if (direct_io and hasattr(os, 'O_DIRECT')
+                    and df.memory_usage(index=False).sum() >= DIRECT_IO_MIN_BYTES):
+                written = self._write_parquet_direct(df, filepath)
+            
+            if not written:
+                df.to_parquet(filepath, engine='pyarrow', compression='zstd',
+                              compression_level=3, index=False)
+        else:
+            df.to_csv(filepath, index=False)
         
-        print(f"\n💾 Processed data saved to: {filepath}")
+        logger.info("Processed data saved to %s", filepath)
         
         return filepath
     
+    def _write_parquet_direct(self, df, filepath):
+        """
+        Write a DataFrame as Parquet with O_DIRECT, bypassing the page cache
+        
+        The file is serialized in memory, copied into a page-aligned
+        anonymous mmap padded to DIRECT_IO_ALIGNMENT, written, then
+        truncated back to its real size.
+        
+        Args:
+            df: DataFrame to write
+            filepath: Output path
+            
+        Returns:
+            bool: False if the filesystem rejected O_DIRECT (nothing written)
+        """
+        sink = pa.BufferOutputStream()
+        pq.write_table(pa.Table.from_pandas(df, preserve_index=False), sink,
+                       compression='zstd', compression_level=3)
+        payload = sink.getvalue()
+        
+        size = payload.size
+        padded = -(-size // DIRECT_IO_ALIGNMENT) * DIRECT_IO_ALIGNMENT
+        
+        with mmap.mmap(-1, padded) as buffer:
+            buffer[:size] = memoryview(payload)
+            view = memoryview(buffer)
+            
+            try:
+                fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_DIRECT, 0o644)
+            except OSError as e:
+                logger.debug("O_DIRECT unavailable for %s (%s), using buffered write", filepath, e)
+                view.release()
+                return False
+            
+            try:
+                offset = 0
+                while offset < padded:
+                    offset += os.write(fd, view[offset:])
+                os.ftruncate(fd, size)
+                os.fsync(fd)
+            except OSError as e:
+                logger.debug("O_DIRECT write failed for %s (%s), using buffered write", filepath, e)
+                return False
+            finally:
+                os.close(fd)
+                view.release()
+        
+        return True
+    
     def get_data_summary(self, df):
         """
         Generate summary statistics
@@ -341,6 +876,8 @@ def main():
     """
     Test the data processor
     """
+    logging.basicConfig(level=LOG_LEVEL, format=LOG_FORMAT)
+    
     print("="*70)
     print("DATA PROCESSOR - TEST RUN")
     print("="*70)
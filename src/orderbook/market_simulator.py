@@ -3,21 +3,43 @@ Market Simulator Module
 Simulates realistic market activity using Poisson-based order flow
 """
 
+import logging
 import numpy as np
-import pandas as pd
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, TYPE_CHECKING
 from datetime import datetime, timedelta
 import sys
 from pathlib import Path
 
-# Add project root to path
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+# Add project root to path only when run as a script; package imports
+# already resolve, and re-inserting it can import modules twice
+if not __package__:
+    project_root = Path(__file__).parent.parent.parent
+    sys.path.insert(0, str(project_root))
 
 from src.orderbook.orderbook import OrderBook
 from src.orderbook.matching_engine import MatchingEngine
 from src.orderbook.order import create_limit_order
 
+# pandas is only needed to hand histories back as DataFrames; import it lazily
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+# Order history columns (structure of arrays) and their dtypes
+ORDER_HISTORY_DTYPES = {
+    'time': np.float64,
+    'is_buy': np.bool_,
+    'price': np.float64,
+    'quantity': np.float64,
+    'is_aggressive': np.bool_,
+    'filled': np.float64,
+}
+
+# Price history columns; a missing side of the book is stored as NaN
+PRICE_HISTORY_COLUMNS = ['time', 'mid_price', 'best_bid', 'best_ask', 'spread']
+
 
 class MarketSimulator:
     """
@@ -31,7 +53,9 @@ class MarketSimulator:
                  symbol: str = "BTCUSDT",
                  initial_price: float = 50000.0,
                  lambda_arrival: float = 1.0,  # orders per second
-                 spread_bps: float = 10.0):     # spread in basis points
+                 spread_bps: float = 10.0,      # spread in basis points
+                 tick_size: float = 0.01,       # minimum price increment
+                 seed: Optional[int] = None):
         """
         Initialize market simulator
         
@@ -40,11 +64,18 @@ class MarketSimulator:
             initial_price: Starting mid price
             lambda_arrival: Poisson lambda (orders per second)
             spread_bps: Initial spread in basis points (1 bps = 0.01%)
+            tick_size: Price grid that every simulated order is snapped to
+            seed: Random seed for reproducible order flow (optional)
         """
         self.symbol = symbol
         self.current_price = initial_price
         self.lambda_arrival = lambda_arrival
         self.spread_bps = spread_bps
+        self.tick_size = tick_size
+        self.rng = np.random.default_rng(seed)
+        
+        # Random draws for the steps being simulated (see _pregen_random)
+        self._random = None
         
         # Create order book and matching engine
         self.orderbook = OrderBook(symbol)
@@ -54,15 +85,16 @@ class MarketSimulator:
         self.trader_counter = 0
         self.simulation_time = 0.0  # seconds
         
-        # Order flow statistics
-        self.order_history = []
-        self.price_history = []
+        # Order flow statistics, one preallocated array per field
+        self._order_count = 0
+        self._price_count = 0
+        self._orders = {name: np.empty(1024, dtype=dtype)
+                        for name, dtype in ORDER_HISTORY_DTYPES.items()}
+        self._prices = {name: np.empty(1024, dtype=np.float64)
+                        for name in PRICE_HISTORY_COLUMNS}
         
-        print(f"✅ MarketSimulator initialized")
-        print(f"   Symbol: {symbol}")
-        print(f"   Initial Price: ${initial_price:,.2f}")
-        print(f"   Order Arrival Rate: {lambda_arrival} orders/sec")
-        print(f"   Initial Spread: {spread_bps} bps")
+        logger.debug("MarketSimulator initialized for %s: price=%.2f, arrival=%s/s, spread=%s bps",
+                     symbol, initial_price, lambda_arrival, spread_bps)
     
     def initialize_book(self, num_levels: int = 10, liquidity_per_level: float = 1.0):
         """
@@ -72,181 +104,350 @@ class MarketSimulator:
             num_levels: Number of price levels on each side
             liquidity_per_level: Quantity at each level
         """
-        print(f"\n📊 Initializing order book with {num_levels} levels...")
+        logger.debug("Initializing order book with %d levels", num_levels)
         
         spread = self.current_price * (self.spread_bps / 10000)
         bid_price = self.current_price - spread / 2
         ask_price = self.current_price + spread / 2
         
-        tick_size = spread / 2  # Price increment between levels
+        level_step = spread / 2  # Price increment between levels
         
-        # Add buy orders (market makers)
-        for i in range(num_levels):
-            price = bid_price - (i * tick_size)
-            quantity = liquidity_per_level * (1 + np.random.uniform(-0.2, 0.2))
-            self.engine.submit_limit_order("BUY", price, quantity, f"MM_BID_{i}")
+        bid_quantities = liquidity_per_level * (1 + self.rng.uniform(-0.2, 0.2, num_levels))
+        ask_quantities = liquidity_per_level * (1 + self.rng.uniform(-0.2, 0.2, num_levels))
         
-        # Add sell orders (market makers)
-        for i in range(num_levels):
-            price = ask_price + (i * tick_size)
-            quantity = liquidity_per_level * (1 + np.random.uniform(-0.2, 0.2))
-            self.engine.submit_limit_order("SELL", price, quantity, f"MM_ASK_{i}")
+        # Seed both sides (market makers); these never cross, so skip matching
+        offsets = np.arange(num_levels) * level_step
+        bid_prices = np.round((bid_price - offsets) / self.tick_size) * self.tick_size
+        ask_prices = np.round((ask_price + offsets) / self.tick_size) * self.tick_size
+        self.orderbook.bulk_add_resting("BUY", bid_prices, bid_quantities,
+                                        [f"MM_BID_{i}" for i in range(num_levels)])
+        self.orderbook.bulk_add_resting("SELL", ask_prices, ask_quantities,
+                                        [f"MM_ASK_{i}" for i in range(num_levels)])
         
-        print(f"✅ Order book initialized")
-        self.orderbook.print_book(levels=5)
+        if logger.isEnabledFor(logging.DEBUG):
+            self.orderbook.print_book(levels=5)
     
-    def generate_order(self) -> Dict:
+    def _reserve_history(self, orders: int, prices: int):
+        """
+        Make room for this many more order and price history rows
+        
+        Existing rows are kept. Capacity at least doubles on growth, so
+        step-by-step use (simulate_step without simulate) stays amortized O(1).
+        """
+        self._orders = self._grow(self._orders, self._order_count, self._order_count + orders)
+        self._prices = self._grow(self._prices, self._price_count, self._price_count + prices)
+    
+    @staticmethod
+    def _grow(columns: Dict[str, np.ndarray], n: int, capacity: int) -> Dict[str, np.ndarray]:
+        """Copy the first n rows of each column into arrays of >= capacity"""
+        current = len(columns['time'])
+        if capacity <= current:
+            return columns
+        
+        capacity = max(capacity, 2 * current)
+        grown = {}
+        for name, values in columns.items():
+            grown[name] = np.empty(capacity, dtype=values.dtype)
+            grown[name][:n] = values[:n]
+        return grown
+    
+    @property
+    def order_history(self) -> 'pd.DataFrame':
+        """Submitted orders, one row per order"""
+        import pandas as pd
+        
+        n = self._order_count
+        history = pd.DataFrame({name: values[:n] for name, values in self._orders.items()})
+        history.insert(1, 'side', np.where(history.pop('is_buy'), 'BUY', 'SELL'))
+        return history
+    
+    @property
+    def price_history(self) -> 'pd.DataFrame':
+        """Top of book sampled on simulate()'s regular grid"""
+        import pandas as pd
+        
+        n = self._price_count
+        return pd.DataFrame({name: values[:n] for name, values in self._prices.items()})
+    
+    def _pregen_random(self, n: int, dt: float = 0.1) -> Dict[str, np.ndarray]:
+        """
+        Draw every random decision for n simulation steps up front
+        
+        Args:
+            n: Number of steps
+            dt: Time step in seconds
+            
+        Returns:
+            dict: One array of length n per random decision
+        """
+        rng = self.rng
+        
+        # Poisson process: probability of an arrival within dt
+        arrival_probability = 1 - np.exp(-self.lambda_arrival * dt)
+        
+        # Order size (log-normal distribution), clipped to reasonable range
+        # and rounded to 4 decimals for the whole batch
+        base_size = 0.1
+        sizes = np.clip(rng.lognormal(mean=np.log(base_size), sigma=0.5, size=n), 0.01, 5.0)
+        sizes = np.round(sizes, 4)
+        
+        return {
+            'arrivals': rng.random(n) < arrival_probability,
+            'is_buy': rng.random(n) < 0.5,          # 50/50 buy/sell
+            'is_aggressive': rng.random(n) < 0.3,   # 30% aggressive
+            'sizes': sizes,
+            'cross_jitter': rng.uniform(0, 0.001, n),
+            'offsets': rng.integers(0, 5, n)
+        }
+    
+    def generate_order(self, i: Optional[int] = None) -> Dict:
         """
         Generate a random order based on realistic distributions
         
+        Args:
+            i: Step index into the pre-drawn random arrays (optional;
+               draws a fresh sample when omitted)
+        
         Returns:
             dict: Order parameters
         """
+        if i is None:
+            self._random = self._pregen_random(1)
+            i = 0
+        draws = self._random
+        
         # Determine order side (50/50 buy/sell)
-        side = "BUY" if np.random.random() < 0.5 else "SELL"
+        side = "BUY" if draws['is_buy'][i] else "SELL"
         
         # Determine if aggressive (market taker) or passive (market maker)
-        is_aggressive = np.random.random() < 0.3  # 30% aggressive
+        is_aggressive = bool(draws['is_aggressive'][i])
         
         # Get current best prices
-        best_bid = self.orderbook.best_bid or self.current_price
-        best_ask = self.orderbook.best_ask or self.current_price
+        best_bid, best_ask, _, _ = self.orderbook.tob_snapshot()
+        best_bid = best_bid or self.current_price
+        best_ask = best_ask or self.current_price
         mid_price = (best_bid + best_ask) / 2
         
-        # Generate order size (log-normal distribution)
-        base_size = 0.1
-        size = np.random.lognormal(mean=np.log(base_size), sigma=0.5)
-        size = max(0.01, min(size, 5.0))  # Clip to reasonable range
+        size = draws['sizes'][i]
         
         # Determine price based on aggressiveness
         if is_aggressive:
             # Aggressive orders: cross the spread
             if side == "BUY":
-                price = best_ask * (1 + np.random.uniform(0, 0.001))
+                price = best_ask * (1 + draws['cross_jitter'][i])
             else:
-                price = best_bid * (1 - np.random.uniform(0, 0.001))
+                price = best_bid * (1 - draws['cross_jitter'][i])
         else:
             # Passive orders: add liquidity
-            tick_size = mid_price * 0.0001  # 1 bps
+            bps_step = mid_price * 0.0001  # 1 bps
+            offset = draws['offsets'][i] * bps_step
             if side == "BUY":
                 # Place below best bid
-                offset = np.random.randint(0, 5) * tick_size
                 price = best_bid - offset
             else:
                 # Place above best ask
-                offset = np.random.randint(0, 5) * tick_size
                 price = best_ask + offset
         
+        # Snap to the tick grid (prices are positive, so +0.5 rounds to nearest)
+        ticks = int(price / self.tick_size + 0.5)
+        
         return {
             'side': side,
-            'price': round(price, 2),
-            'quantity': round(size, 4),
+            'price': ticks * self.tick_size,
+            'quantity': float(size),
             'is_aggressive': is_aggressive
         }
     
-    def simulate_step(self) -> Optional[Dict]:
+    def _draw_arrival_times(self, duration_seconds: float) -> np.ndarray:
         """
-        Simulate one time step
+        Draw Poisson arrival times in [0, duration) from exponential gaps
         
+        Args:
+            duration_seconds: Length of the simulated window
+            
         Returns:
-            dict: Order execution report (if order generated)
+            np.ndarray: Sorted arrival times in seconds from window start
         """
-        # Check if order arrives (Poisson process)
-        dt = 0.1  # Time step in seconds
-        arrival_probability = 1 - np.exp(-self.lambda_arrival * dt)
+        if self.lambda_arrival <= 0 or duration_seconds <= 0:
+            return np.empty(0)
         
-        if np.random.random() < arrival_probability:
-            # Generate and submit order
-            order_params = self.generate_order()
-            
-            self.trader_counter += 1
-            trader_id = f"TRADER_{self.trader_counter}"
+        scale = 1.0 / self.lambda_arrival
+        size = int(self.lambda_arrival * duration_seconds * 1.5 + 50)
+        times = np.cumsum(self.rng.exponential(scale, size))
+        
+        # Rarely the first batch falls short of the window; extend it
+        while times[-1] < duration_seconds:
+            more = times[-1] + np.cumsum(self.rng.exponential(scale, size))
+            times = np.concatenate([times, more])
+        
+        return times[:np.searchsorted(times, duration_seconds)]
+    
+    def _book_state(self) -> tuple:
+        """Current (mid_price, best_bid, best_ask, spread); missing values are NaN"""
+        best_bid, best_ask, mid_price, spread = self.orderbook.tob_snapshot()
+        
+        return (mid_price or self.current_price,
+                np.nan if best_bid is None else best_bid,
+                np.nan if best_ask is None else best_ask,
+                np.nan if spread is None else spread)
+    
+    def _process_arrival(self, i: int, full_report: bool = False) -> Optional[Dict]:
+        """
+        Generate, submit and record the order for pre-drawn sample i
+        
+        Args:
+            i: Index into the pre-drawn random arrays
+            full_report: Build and return the engine's execution report
+                         (otherwise use the report-free fast path)
             
+        Returns:
+            dict: Order execution report (None unless full_report)
+        """
+        order_params = self.generate_order(i)
+        
+        self.trader_counter += 1
+        trader_id = f"TRADER_{self.trader_counter}"
+        
+        if full_report:
             report = self.engine.submit_limit_order(
                 side=order_params['side'],
                 price=order_params['price'],
                 quantity=order_params['quantity'],
                 trader_id=trader_id
             )
-            
-            # Record order
-            self.order_history.append({
-                'time': self.simulation_time,
-                'side': order_params['side'],
-                'price': order_params['price'],
-                'quantity': order_params['quantity'],
-                'is_aggressive': order_params['is_aggressive'],
-                'filled': report['filled_quantity']
-            })
-            
-            # Update price if trade occurred
-            if report['avg_price']:
-                self.current_price = report['avg_price']
-            
-            return report
+            filled, avg_price = report['filled_quantity'], report['avg_price']
+        else:
+            report = None
+            filled, avg_price, _ = self.engine._submit_limit_order_fast(
+                order_params['side'], order_params['price'],
+                order_params['quantity'], trader_id
+            )
+        
+        # Record order
+        self._reserve_history(orders=1, prices=0)
+        n = self._order_count
+        self._orders['time'][n] = self.simulation_time
+        self._orders['is_buy'][n] = order_params['side'] == "BUY"
+        self._orders['price'][n] = order_params['price']
+        self._orders['quantity'][n] = order_params['quantity']
+        self._orders['is_aggressive'][n] = order_params['is_aggressive']
+        self._orders['filled'][n] = filled
+        self._order_count += 1
+        
+        # Update price if trade occurred
+        if avg_price:
+            self.current_price = avg_price
+        
+        return report
+    
+    def simulate_step(self, i: Optional[int] = None) -> Optional[Dict]:
+        """
+        Simulate one fixed time step
+        
+        Args:
+            i: Step index into the pre-drawn random arrays (optional;
+               draws a fresh sample when omitted)
+        
+        Returns:
+            dict: Order execution report (if order generated)
+        """
+        dt = 0.1  # Time step in seconds
+        if i is None:
+            self._random = self._pregen_random(1, dt)
+            i = 0
+        
+        # Check if order arrives (Poisson process)
+        report = None
+        if self._random['arrivals'][i]:
+            report = self._process_arrival(i, full_report=True)
         
         self.simulation_time += dt
-        return None
+        return report
     
-    def simulate(self, duration_seconds: float, verbose: bool = False) -> pd.DataFrame:
+    def simulate(self, duration_seconds: float, verbose: bool = False,
+                 sample_stride: int = 1) -> 'pd.DataFrame':
         """
         Run market simulation
         
+        Orders are processed event by event at exponentially distributed
+        arrival times; the book is sampled every sample_stride * 0.1s for
+        the price history.
+        
         Args:
             duration_seconds: How long to simulate
             verbose: Print progress
+            sample_stride: Record the price history every n-th 0.1s step
             
         Returns:
             pd.DataFrame: Simulation results
         """
-        print(f"\n🚀 Starting simulation for {duration_seconds} seconds...")
+        logger.info("Starting simulation for %s seconds", duration_seconds)
         
-        num_steps = int(duration_seconds / 0.1)
+        dt = 0.1  # Price sampling interval in seconds
+        num_steps = int(duration_seconds / dt)
+        start_time = self.simulation_time
         
-        for step in range(num_steps):
-            report = self.simulate_step()
-            
-            # Record price every step
-            mid_price = self.orderbook.mid_price or self.current_price
-            self.price_history.append({
-                'time': self.simulation_time,
-                'mid_price': mid_price,
-                'best_bid': self.orderbook.best_bid,
-                'best_ask': self.orderbook.best_ask,
-                'spread': self.orderbook.spread
-            })
+        # Arrival times and all random decisions for the run, drawn in batches
+        arrival_times = self._draw_arrival_times(duration_seconds)
+        num_orders = len(arrival_times)
+        self._random = self._pregen_random(num_orders)
+        
+        num_samples = num_steps // sample_stride
+        self._reserve_history(orders=num_orders, prices=num_samples)
+        
+        # Book state before the first arrival and after each one
+        states = np.empty((num_orders + 1, 4))
+        states[0] = self._book_state()
+        
+        for j in range(num_orders):
+            self.simulation_time = start_time + arrival_times[j]
+            self._process_arrival(j)
+            states[j + 1] = self._book_state()
             
-            if verbose and step % 100 == 0:
-                progress = (step / num_steps) * 100
+            if verbose and j % 100 == 0:
+                progress = (arrival_times[j] / duration_seconds) * 100
                 print(f"  Progress: {progress:.1f}% | Time: {self.simulation_time:.1f}s | "
-                      f"Mid: ${mid_price:.2f} | Orders: {len(self.order_history)}")
+                      f"Mid: ${states[j + 1, 0]:.2f} | Orders: {self._order_count}")
+        
+        self.simulation_time = start_time + num_steps * dt
+        
+        # Sample the book on the regular grid: the state after the last
+        # arrival at or before each grid time
+        grid = (np.arange(num_samples) + 1) * (sample_stride * dt)
+        sampled = states[np.searchsorted(arrival_times, grid, side='right')]
+        
+        n = self._price_count
+        prices = self._prices
+        prices['time'][n:n + num_samples] = start_time + grid
+        for col, name in enumerate(['mid_price', 'best_bid', 'best_ask', 'spread']):
+            prices[name][n:n + num_samples] = sampled[:, col]
+        self._price_count += num_samples
         
-        print(f"\n✅ Simulation completed!")
-        print(f"   Total time: {self.simulation_time:.1f}s")
-        print(f"   Orders generated: {len(self.order_history)}")
-        print(f"   Final mid price: ${self.orderbook.mid_price:.2f}")
+        logger.info("Simulation completed: %.1fs, %d orders, final mid %s",
+                    self.simulation_time, self._order_count, self.orderbook.mid_price)
         
-        # Convert to DataFrame
-        price_df = pd.DataFrame(self.price_history)
-        return price_df
+        # Convert to DataFrame (one column per array, built once)
+        return self.price_history
     
     def get_simulation_summary(self) -> Dict:
         """Get summary statistics of simulation"""
-        if not self.price_history:
+        if self._price_count == 0:
             return {}
         
-        price_df = pd.DataFrame(self.price_history)
-        order_df = pd.DataFrame(self.order_history)
+        n = self._price_count
+        mid = self._prices['mid_price'][:n]
+        spread = self._prices['spread'][:n]
+        spread = spread[~np.isnan(spread)]
         
         summary = {
-            'total_orders': len(self.order_history),
+            'total_orders': self._order_count,
             'total_trades': self.engine.total_trades,
             'total_volume': self.engine.total_volume,
-            'avg_spread': price_df['spread'].mean() if 'spread' in price_df else None,
-            'price_volatility': price_df['mid_price'].std(),
-            'final_price': price_df['mid_price'].iloc[-1],
-            'price_change': price_df['mid_price'].iloc[-1] - price_df['mid_price'].iloc[0],
-            'aggressive_orders': order_df['is_aggressive'].sum() if len(order_df) > 0 else 0
+            'avg_spread': float(spread.mean()) if len(spread) else np.nan,
+            'price_volatility': float(mid.std(ddof=1)) if n > 1 else np.nan,
+            'final_price': float(mid[-1]),
+            'price_change': float(mid[-1] - mid[0]),
+            'aggressive_orders': int(self._orders['is_aggressive'][:self._order_count].sum())
         }
         
         return summary
@@ -302,4 +503,5 @@ def test_market_simulator():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     test_market_simulator()
\ No newline at end of file
@@ -3,19 +3,77 @@ Matching Engine Module
 Advanced order matching with market impact and latency simulation
 """
 
+import logging
 import numpy as np
-from typing import List, Dict, Optional
-from datetime import datetime, timedelta
+from typing import List, Dict, Optional, Tuple
 import sys
 from pathlib import Path
 
-# Add project root to path
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+# Add project root to path only when run as a script; package imports
+# already resolve, and re-inserting it can import modules twice
+if not __package__:
+    project_root = Path(__file__).parent.parent.parent
+    sys.path.insert(0, str(project_root))
 
 from src.orderbook.orderbook import OrderBook
 from src.orderbook.order import Order, create_limit_order, create_market_order
 
+# Optional: numba JIT for the depth walk
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+def _walk_levels_py(prices, qtys, quantity):
+    """
+    Fill quantity against price levels, best level first
+    
+    Returns:
+        tuple: (total_cost, levels_consumed, remaining)
+    """
+    remaining = quantity
+    total_cost = 0.0
+    levels_consumed = 0
+    
+    for i in range(len(prices)):
+        if remaining <= 0:
+            break
+        
+        fillable = min(remaining, qtys[i])
+        total_cost += prices[i] * fillable
+        remaining -= fillable
+        levels_consumed += 1
+    
+    return total_cost, levels_consumed, remaining
+
+
+# Compiled eagerly for the float64 depth arrays from get_book_depth_arrays()
+_walk_levels = (njit('Tuple((float64, int64, float64))(float64[:], float64[:], float64)',
+                     cache=True)(_walk_levels_py)
+                if NUMBA_AVAILABLE else None)
+
+
+def _walk_levels_vectorized(prices, qtys, quantity):
+    """NumPy equivalent of _walk_levels_py (used when numba is missing)"""
+    if quantity <= 0:
+        return 0.0, 0, quantity
+    
+    # Cumulative depth: first level whose running total covers the order
+    cum = np.cumsum(qtys)
+    k = int(np.searchsorted(cum, quantity))
+    
+    if k >= len(qtys):
+        return float(np.dot(prices, qtys)), len(qtys), quantity - (cum[-1] if len(cum) else 0.0)
+    
+    # Full levels before k, partial fill at level k
+    filled_at_k = quantity - (cum[k - 1] if k else 0.0)
+    total_cost = float(np.dot(prices[:k], qtys[:k]) + prices[k] * filled_at_k)
+    return total_cost, k + 1, 0.0
+
 
 class MatchingEngine:
     """
@@ -40,9 +98,15 @@ class MatchingEngine:
         # Statistics
         self.total_trades = 0
         self.total_volume = 0.0
-        self.total_slippage = 0.0
         
-        print(f"✅ MatchingEngine initialized (latency={latency_ms}ms)")
+        self.total_slippage = 0.0  # sum of per-order slippage %
+        
+        # Running |slippage| x filled quantity and reference notional, for the
+        # notional-weighted slippage
+        self._slip_notional = 0.0
+        self._ref_notional = 0.0
+        
+        logger.debug("MatchingEngine initialized (latency=%sms)", latency_ms)
     
     def submit_order(self, order: Order) -> Dict:
         """
@@ -54,19 +118,11 @@ class MatchingEngine:
         Returns:
             dict: Execution report
         """
-        # Simulate network latency
-        submission_time = datetime.now()
-        arrival_time = submission_time + timedelta(milliseconds=self.latency_ms)
-        
         # Add to order book and match
         trades = self.orderbook.add_order(order)
         
-        # Calculate execution statistics
-        execution_report = self._create_execution_report(
-            order, trades, submission_time, arrival_time
-        )
-        
-        return execution_report
+        # Calculate execution statistics (latency is reported, not scheduled)
+        return self._create_execution_report(order, trades)
     
     def submit_limit_order(self, side: str, price: float, quantity: float,
                           trader_id: str = "TRADER") -> Dict:
@@ -85,6 +141,63 @@ class MatchingEngine:
         order = create_limit_order(side, price, quantity, trader_id)
         return self.submit_order(order)
     
+    def _submit_limit_order_fast(self, side: str, price: float, quantity: float,
+                                 trader_id: str = "TRADER") -> Tuple[float, Optional[float], int]:
+        """
+        Submit limit order without building an execution report
+        
+        Statistics are updated exactly as for submit_limit_order(). The
+        order is built without validation, so price and quantity must
+        already be positive (internal simulator flow).
+        
+        Args:
+            side: 'BUY' or 'SELL'
+            price: Limit price
+            quantity: Order size
+            trader_id: Trader ID
+            
+        Returns:
+            tuple: (filled_quantity, avg_price or None, num_trades)
+        """
+        order = create_limit_order(side, price, quantity, trader_id, validate=False)
+        trades = self.orderbook.add_order(order)
+        
+        if not trades:
+            return 0.0, None, 0
+        
+        total_filled, weighted_price, _ = self._record_fills(trades)
+        return total_filled, weighted_price, len(trades)
+    
+    def submit_limit_orders_batch(self, sides: List[str], prices: List[float],
+                                  quantities: List[float],
+                                  trader_ids: List[str]) -> Dict:
+        """
+        Submit several limit orders in one call
+        
+        Args:
+            sides: 'BUY' or 'SELL' per order
+            prices: Limit price per order
+            quantities: Order size per order
+            trader_ids: Trader ID per order
+            
+        Returns:
+            dict: Batch execution summary
+        """
+        orders, order_trades = self.orderbook.add_orders_batch(
+            sides, prices, quantities, trader_ids)
+        trades = []
+        for per_order in order_trades:
+            if per_order:
+                self._record_fills(per_order)
+                trades.extend(per_order)
+        
+        return {
+            'order_ids': [order.order_id for order in orders],
+            'num_orders': len(orders),
+            'num_trades': len(trades),
+            'trades': trades
+        }
+    
     def submit_market_order(self, side: str, quantity: float,
                            trader_id: str = "TRADER") -> Dict:
         """
@@ -98,24 +211,20 @@ class MatchingEngine:
         Returns:
             dict: Execution report
         """
-        # For market orders, set price very high (buy) or very low (sell)
-        # to ensure they match
-        price = 1e9 if side.upper() == "BUY" else 0.01
-        order = create_limit_order(side, price, quantity, trader_id)
+        order = create_market_order(side, quantity, trader_id)
         
-        return self.submit_order(order)
+        # Walk the opposite side directly; unfilled remainder is cancelled
+        trades = self.orderbook.match_market(order)
+        
+        return self._create_execution_report(order, trades)
     
-    def _create_execution_report(self, order: Order, trades: List[dict],
-                                submission_time: datetime,
-                                arrival_time: datetime) -> Dict:
+    def _create_execution_report(self, order: Order, trades: List[dict]) -> Dict:
         """
         Create detailed execution report
         
         Args:
             order: Original order
             trades: List of executed trades
-            submission_time: When order was submitted
-            arrival_time: When order arrived at exchange
             
         Returns:
             dict: Execution report with statistics
@@ -124,7 +233,7 @@ class MatchingEngine:
             # Order not executed
             return {
                 'order_id': order.order_id,
-                'status': order.status.value,
+                'status': order.status._value_,
                 'filled_quantity': 0.0,
                 'remaining_quantity': order.quantity,
                 'avg_price': None,
@@ -134,21 +243,12 @@ class MatchingEngine:
                 'trades': []
             }
         
-        # Calculate execution statistics
-        total_filled = sum(t['quantity'] for t in trades)
-        weighted_price = sum(t['price'] * t['quantity'] for t in trades) / total_filled
-        
-        # Calculate slippage (difference from mid price at submission)
-        reference_price = self.orderbook.mid_price or weighted_price
+        _, weighted_price, reference_price = self._record_fills(trades)
         slippage = abs(weighted_price - reference_price) / reference_price * 100
         
-        self.total_slippage += slippage
-        self.total_trades += len(trades)
-        self.total_volume += total_filled
-        
         return {
             'order_id': order.order_id,
-            'status': order.status.value,
+            'status': order.status._value_,
             'filled_quantity': order.filled_quantity,
             'remaining_quantity': order.remaining_quantity,
             'avg_price': weighted_price,
@@ -158,6 +258,37 @@ class MatchingEngine:
             'trades': trades
         }
     
+    def _record_fills(self, trades: List[dict]) -> Tuple[float, float, float]:
+        """
+        Aggregate one order's trades and update engine statistics
+        
+        Args:
+            trades: Non-empty list of trades for a single order
+            
+        Returns:
+            tuple: (total_filled, avg_price, reference_price)
+        """
+        # One pass over the trades
+        total_filled = 0.0
+        notional = 0.0
+        for t in trades:
+            qty = t['quantity']
+            total_filled += qty
+            notional += t['price'] * qty
+        weighted_price = notional / total_filled
+        
+        # Calculate slippage (difference from mid price at submission)
+        reference_price = self.orderbook.mid_price or weighted_price
+        price_diff = abs(weighted_price - reference_price)
+        
+        self.total_slippage += price_diff / reference_price * 100
+        self._slip_notional += price_diff * total_filled
+        self._ref_notional += reference_price * total_filled
+        self.total_trades += len(trades)
+        self.total_volume += total_filled
+        
+        return total_filled, weighted_price, reference_price
+    
     def calculate_market_impact(self, side: str, quantity: float) -> Dict:
         """
         Estimate market impact of a large order
@@ -169,15 +300,15 @@ class MatchingEngine:
         Returns:
             dict: Impact analysis
         """
-        bids, asks = self.orderbook.get_book_depth(levels=20)
+        bid_prices, bid_qtys, ask_prices, ask_qtys = self.orderbook.get_book_depth_arrays(levels=20)
         
         if side.upper() == "BUY":
             # Walk through ask side
-            available_liquidity = asks
+            prices, qtys = ask_prices, ask_qtys
             reference_price = self.orderbook.best_ask
         else:
             # Walk through bid side
-            available_liquidity = bids
+            prices, qtys = bid_prices, bid_qtys
             reference_price = self.orderbook.best_bid
         
         if not reference_price:
@@ -187,19 +318,8 @@ class MatchingEngine:
                 'avg_price': None
             }
         
-        # Calculate how much we can fill and at what price
-        remaining = quantity
-        total_cost = 0.0
-        levels_consumed = 0
-        
-        for price, qty in available_liquidity:
-            if remaining <= 0:
-                break
-            
-            fillable = min(remaining, qty)
-            total_cost += price * fillable
-            remaining -= fillable
-            levels_consumed += 1
+        walk = _walk_levels if _walk_levels is not None else _walk_levels_vectorized
+        total_cost, levels_consumed, remaining = walk(prices, qtys, float(quantity))
         
         if remaining > 0:
             # Not enough liquidity
@@ -226,10 +346,15 @@ class MatchingEngine:
         """Get matching engine statistics"""
         avg_slippage = self.total_slippage / max(self.total_trades, 1)
         
+        # Absolute slippage weighted by each order's traded notional
+        weighted_slippage = (100.0 * self._slip_notional / self._ref_notional
+                             if self._ref_notional else 0.0)
+        
         return {
             'total_trades': self.total_trades,
             'total_volume': self.total_volume,
             'avg_slippage_pct': avg_slippage,
+            'notional_weighted_slippage_pct': weighted_slippage,
             'latency_ms': self.latency_ms
         }
     
@@ -283,7 +408,7 @@ def test_matching_engine():
     report = engine.submit_limit_order("BUY", 50120, 2.5, "TRADER_1")
     
     print(f"\nExecution Report:")
-    print(f"  Order ID: {report['order_id'][:8]}...")
+    print(f"  Order ID: {report['order_id']}")
     print(f"  Status: {report['status']}")
     print(f"  Filled: {report['filled_quantity']:.4f}")
     print(f"  Avg Price: ${report['avg_price']:,.2f}")
@@ -4,9 +4,10 @@ Defines order types and properties for the limit order book
 """
 
 from enum import Enum
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-import uuid
+import itertools
+import time
 
 
 class OrderSide(Enum):
@@ -29,41 +30,72 @@ class OrderStatus(Enum):
     CANCELLED = "CANCELLED"
 
 
-@dataclass
+# Process-wide monotonic order id source (cheaper than uuid4 strings)
+_order_ids = itertools.count(1)
+
+
+@dataclass(slots=True)
 class Order:
     """
     Represents a single order in the order book
     
     Attributes:
-        order_id: Unique order identifier
+        order_id: Unique order identifier (monotonic integer)
         side: BUY or SELL
         order_type: LIMIT or MARKET
         price: Limit price (None for market orders)
         quantity: Order size
-        timestamp: When order was created
+        timestamp: When order was created (ns since epoch)
         trader_id: Who placed the order
         status: Current order status
         filled_quantity: How much has been filled
+        is_buy: True for BUY orders (derived from side at construction)
     """
     
-    order_id: str
+    order_id: int
     side: OrderSide
     order_type: OrderType
     price: float
     quantity: float
-    timestamp: datetime
+    timestamp: int
     trader_id: str = "TRADER_DEFAULT"
     status: OrderStatus = OrderStatus.PENDING
     filled_quantity: float = 0.0
+    is_buy: bool = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate order after initialization"""
+        self.is_buy = self.side is OrderSide.BUY
+        
         if self.quantity <= 0:
             raise ValueError("Order quantity must be positive")
         
         if self.order_type == OrderType.LIMIT and self.price <= 0:
             raise ValueError("Limit order price must be positive")
     
+    @classmethod
+    def new_unchecked(cls, order_id: int, side: OrderSide, order_type: OrderType,
+                      price: float, quantity: float, timestamp: int,
+                      trader_id: str = "TRADER_DEFAULT") -> 'Order':
+        """
+        Build an order without running __post_init__ validation
+        
+        Only for internal callers whose inputs are already known to be valid
+        (e.g. simulator order flow generated and clipped in NumPy).
+        """
+        order = object.__new__(cls)
+        order.order_id = order_id
+        order.side = side
+        order.is_buy = side is OrderSide.BUY
+        order.order_type = order_type
+        order.price = price
+        order.quantity = quantity
+        order.timestamp = timestamp
+        order.trader_id = trader_id
+        order.status = OrderStatus.PENDING
+        order.filled_quantity = 0.0
+        return order
+    
     @property
     def remaining_quantity(self) -> float:
         """Calculate remaining unfilled quantity"""
@@ -75,14 +107,14 @@ class Order:
         return self.filled_quantity >= self.quantity
     
     @property
-    def is_buy(self) -> bool:
-        """Check if this is a buy order"""
-        return self.side == OrderSide.BUY
+    def timestamp_iso(self) -> str:
+        """Creation time as ISO string (formatted only when asked for)"""
+        return datetime.fromtimestamp(self.timestamp / 1e9).isoformat()
     
     @property
     def is_sell(self) -> bool:
         """Check if this is a sell order"""
-        return self.side == OrderSide.SELL
+        return not self.is_buy
     
     def fill(self, quantity: float, price: float = None) -> float:
         """
@@ -119,28 +151,30 @@ class Order:
     
     def __repr__(self) -> str:
         """String representation of order"""
-        return (f"Order(id={self.order_id[:8]}, {self.side.value} "
+        return (f"Order(id={self.order_id}, {self.side.value} "
                 f"{self.quantity:.4f} @ ${self.price:.2f}, "
                 f"filled={self.filled_quantity:.4f}, status={self.status.value})")
     
     def to_dict(self) -> dict:
         """Convert order to dictionary"""
+        # Enum ._value_ is a plain attribute; .value goes through a descriptor
         return {
             'order_id': self.order_id,
-            'side': self.side.value,
-            'order_type': self.order_type.value,
+            'side': self.side._value_,
+            'order_type': self.order_type._value_,
             'price': self.price,
             'quantity': self.quantity,
             'filled_quantity': self.filled_quantity,
             'remaining_quantity': self.remaining_quantity,
-            'timestamp': self.timestamp.isoformat(),
+            'timestamp': self.timestamp_iso,
             'trader_id': self.trader_id,
-            'status': self.status.value
+            'status': self.status._value_
         }
 
 
 def create_limit_order(side: str, price: float, quantity: float, 
-                       trader_id: str = "TRADER_DEFAULT") -> Order:
+                       trader_id: str = "TRADER_DEFAULT",
+                       validate: bool = True) -> Order:
     """
     Helper function to create a limit order
     
@@ -149,19 +183,24 @@ def create_limit_order(side: str, price: float, quantity: float,
         price: Limit price
         quantity: Order size
         trader_id: Trader identifier
+        validate: Check price/quantity (skip only for trusted internal input)
         
     Returns:
         Order: Created limit order
     """
     order_side = OrderSide.BUY if side.upper() == "BUY" else OrderSide.SELL
     
+    if not validate:
+        return Order.new_unchecked(next(_order_ids), order_side, OrderType.LIMIT,
+                                   price, quantity, time.time_ns(), trader_id)
+    
     return Order(
-        order_id=str(uuid.uuid4()),
+        order_id=next(_order_ids),
         side=order_side,
         order_type=OrderType.LIMIT,
         price=price,
         quantity=quantity,
-        timestamp=datetime.now(),
+        timestamp=time.time_ns(),
         trader_id=trader_id
     )
 
@@ -182,12 +221,12 @@ def create_market_order(side: str, quantity: float,
     order_side = OrderSide.BUY if side.upper() == "BUY" else OrderSide.SELL
     
     return Order(
-        order_id=str(uuid.uuid4()),
+        order_id=next(_order_ids),
         side=order_side,
         order_type=OrderType.MARKET,
         price=0.0,  # Market orders don't have price
         quantity=quantity,
-        timestamp=datetime.now(),
+        timestamp=time.time_ns(),
         trader_id=trader_id
     )
 
@@ -3,49 +3,113 @@ Order Book Module
 Implements a limit order book with price-time priority
 """
 
-from collections import defaultdict, deque
+from collections import defaultdict
+import heapq
+import logging
+import math
+from itertools import islice
+import numpy as np
 from typing import List, Dict, Tuple, Optional
 import sys
 from pathlib import Path
 
-# Add project root to path
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+# Add project root to path only when run as a script; package imports
+# already resolve, and re-inserting it can import modules twice
+if not __package__:
+    project_root = Path(__file__).parent.parent.parent
+    sys.path.insert(0, str(project_root))
 
-from src.orderbook.order import Order, OrderSide, OrderType, OrderStatus
+from src.orderbook.order import Order, OrderType, OrderStatus, create_limit_order
+
+# Optional: keep price levels sorted incrementally instead of sorting per query
+try:
+    from sortedcontainers import SortedDict
+    SORTEDCONTAINERS_AVAILABLE = True
+except ImportError:
+    SORTEDCONTAINERS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+# Trade log columns (structure of arrays) and their dtypes
+TRADE_LOG_DTYPES = {
+    'price': np.float64,
+    'quantity': np.float64,
+    'buy_order_id': np.int64,
+    'sell_order_id': np.int64,
+    'buyer': object,
+    'seller': object,
+    'timestamp': np.int64,
+}
+
+# Orders screened per vectorized pass in OrderBook.add_orders_batch
+BATCH_SCREEN_WINDOW = 256
+
+# Spent queue entries a price level keeps before compacting its list
+QUEUE_COMPACT_MIN = 32
+
+# Limit ticks that market orders match with (cross every level)
+MARKET_BUY_LIMIT_TICK = sys.maxsize
+MARKET_SELL_LIMIT_TICK = -sys.maxsize
+
+# Scaled prices this close to a whole tick count as on the grid (absorbs
+# float error such as 50000.01 * 100 = 5000000.999...)
+TICK_SNAP_TOLERANCE = 1e-6
+
+
+def _limit_tick(scaled_price: float, is_buy: bool) -> int:
+    """
+    Tick for a limit price already multiplied by price_scale
+    
+    Off-grid prices move away from the market (bids down, asks up), so
+    an order never rests or trades past its own limit.
+    """
+    tick = round(scaled_price)
+    if abs(scaled_price - tick) <= TICK_SNAP_TOLERANCE:
+        return tick
+    return math.floor(scaled_price) if is_buy else math.ceil(scaled_price)
 
 
 class PriceLevel:
     """
     Represents all orders at a specific price level
     Uses FIFO (first-in-first-out) for price-time priority
+    
+    The queue is a list consumed from `head` (entries before it are
+    spent and compacted away in bulk). Cancelled orders stay in the queue
+    until the matcher reaches them (lazy cancellation); live_orders counts
+    the ones still resting. The price is kept in integer ticks (see
+    OrderBook.price_scale).
     """
     
-    def __init__(self, price: float):
+    __slots__ = ('price', 'orders', 'head', 'total_quantity', 'live_orders')
+    
+    def __init__(self, price: int):
         self.price = price
-        self.orders = deque()  # FIFO queue of orders
+        self.orders = []  # FIFO queue of orders, live from index head
+        self.head = 0
         self.total_quantity = 0.0
+        self.live_orders = 0
     
     def add_order(self, order: Order):
         """Add order to this price level"""
         self.orders.append(order)
         self.total_quantity += order.remaining_quantity
+        self.live_orders += 1
     
     def remove_order(self, order: Order) -> bool:
-        """Remove order from this price level"""
-        try:
-            self.orders.remove(order)
-            self.total_quantity -= order.remaining_quantity
-            return True
-        except ValueError:
-            return False
+        """Cancel a resting order in O(1); its queue entry is reaped on match"""
+        order.cancel()
+        self.total_quantity -= order.remaining_quantity
+        self.live_orders -= 1
+        return True
     
     def is_empty(self) -> bool:
-        """Check if price level has no orders"""
-        return len(self.orders) == 0
+        """Check if price level has no live orders"""
+        return self.live_orders == 0
     
     def __repr__(self) -> str:
-        return f"PriceLevel(${self.price:.2f}, qty={self.total_quantity:.4f}, orders={len(self.orders)})"
+        return f"PriceLevel({self.price} ticks, qty={self.total_quantity:.4f}, orders={self.live_orders})"
 
 
 class OrderBook:
@@ -53,26 +117,37 @@ class OrderBook:
     Limit Order Book with price-time priority matching
     
     Maintains separate bid (buy) and ask (sell) sides
+    
+    Prices are keyed and compared as integer ticks (price * price_scale;
+    off-grid limits round down for bids and up for asks) and converted
+    back to floats only for trades and depth.
     """
     
-    def __init__(self, symbol: str = "BTCUSDT"):
+    def __init__(self, symbol: str = "BTCUSDT", price_scale: int = 100):
         self.symbol = symbol
+        self.price_scale = price_scale  # ticks per unit of price (100 = cents)
         
-        # Price levels: price -> PriceLevel
-        self.bids: Dict[float, PriceLevel] = {}  # Buy orders (descending price)
-        self.asks: Dict[float, PriceLevel] = {}  # Sell orders (ascending price)
+        # Price levels: tick -> PriceLevel, key-sorted when sortedcontainers is installed
+        level_map = SortedDict if SORTEDCONTAINERS_AVAILABLE else dict
+        self.bids: Dict[int, PriceLevel] = level_map()  # Buy orders (descending price)
+        self.asks: Dict[int, PriceLevel] = level_map()  # Sell orders (ascending price)
+        
+        # Cached top of book in ticks, maintained on insert/match/cancel
+        self._best_bid: Optional[int] = None
+        self._best_ask: Optional[int] = None
         
         # Order tracking: order_id -> Order
-        self.orders: Dict[str, Order] = {}
+        self.orders: Dict[int, Order] = {}
         
-        # Trade history
-        self.trades: List[dict] = []
+        # Trade history, one preallocated array per field (num_trades rows used)
+        self._trade_log = {name: np.empty(1024, dtype=dtype)
+                           for name, dtype in TRADE_LOG_DTYPES.items()}
         
         # Statistics
         self.total_volume = 0.0
         self.num_trades = 0
         
-        print(f"✅ OrderBook initialized for {symbol}")
+        logger.debug("OrderBook initialized for %s", symbol)
     
     def add_order(self, order: Order) -> List[dict]:
         """
@@ -94,16 +169,207 @@ class OrderBook:
         
         return trades
     
+    def match_market(self, order: Order) -> List[dict]:
+        """
+        Match a market order against the opposite side without resting it
+        
+        Levels are consumed best-first with no limit-price check; any
+        quantity left once the opposite side is exhausted is cancelled.
+        
+        Args:
+            order: Market order to execute
+            
+        Returns:
+            list: List of trades executed
+        """
+        if order.is_buy:
+            trades = self._match_buy_order(order)
+        else:
+            trades = self._match_sell_order(order)
+        
+        if not order.is_filled:
+            order.cancel()
+        
+        return trades
+    
+    def bulk_add_resting(self, side: str, prices, quantities,
+                         trader_ids: List[str]) -> List[Order]:
+        """
+        Rest limit orders on one side of the book without matching
+        
+        Intended for seeding liquidity: the caller guarantees none of the
+        prices cross the opposite side and that prices and quantities are
+        positive (orders are built unvalidated).
+        
+        Args:
+            side: 'BUY' or 'SELL'
+            prices: Limit price per order
+            quantities: Order size per order
+            trader_ids: Trader ID per order
+            
+        Returns:
+            list: The orders added
+        """
+        orders = [create_limit_order(side, float(price), float(quantity), trader_id,
+                                     validate=False)
+                  for price, quantity, trader_id in zip(prices, quantities, trader_ids)]
+        
+        for order in orders:
+            self._add_to_book(order)
+            self.orders[order.order_id] = order
+        
+        return orders
+    
+    def add_orders_batch(self, sides, prices, quantities,
+                         trader_ids: List[str]) -> Tuple[List[Order], List[List[dict]]]:
+        """
+        Add a batch of limit orders, matching only those that can cross
+        
+        A vectorized screen compares each order's tick with the best
+        opposite price it could meet (current book plus earlier orders in
+        the batch). Runs of orders that cannot cross are rested in bulk,
+        one append per price level; each order that may cross goes
+        through add_order(). The outcome matches adding the orders one
+        by one.
+        
+        Args:
+            sides: 'BUY' or 'SELL' per order
+            prices: Limit price per order
+            quantities: Order size per order
+            trader_ids: Trader ID per order
+            
+        Returns:
+            tuple: (orders, trades per order)
+        """
+        orders = [create_limit_order(side, float(price), float(quantity), trader_id)
+                  for side, price, quantity, trader_id
+                  in zip(sides, prices, quantities, trader_ids)]
+        trades: List[List[dict]] = [[] for _ in orders]
+        
+        n = len(orders)
+        is_buy = np.asarray(sides) == 'BUY'
+        scaled = np.asarray(prices, dtype=np.float64) * self.price_scale
+        nearest = np.rint(scaled)
+        ticks = np.where(np.abs(scaled - nearest) <= TICK_SNAP_TOLERANCE, nearest,
+                         np.where(is_buy, np.floor(scaled), np.ceil(scaled))).astype(np.int64)
+        qtys = np.asarray(quantities, dtype=np.float64)
+        
+        no_bid = np.iinfo(np.int64).min
+        no_ask = np.iinfo(np.int64).max
+        
+        start = 0
+        while start < n:
+            # Screen a bounded window so heavy crossing stays linear overall
+            stop = min(n, start + BATCH_SCREEN_WINDOW)
+            buy = is_buy[start:stop]
+            tick = ticks[start:stop]
+            
+            # Best bid/ask each order would face if everything before it rested
+            best_bid = no_bid if self._best_bid is None else self._best_bid
+            best_ask = no_ask if self._best_ask is None else self._best_ask
+            bid_before = np.maximum.accumulate(
+                np.concatenate(([best_bid], np.where(buy, tick, no_bid))))[:-1]
+            ask_before = np.minimum.accumulate(
+                np.concatenate(([best_ask], np.where(buy, no_ask, tick))))[:-1]
+            crosses = np.where(buy, tick >= ask_before, tick <= bid_before)
+            
+            run_end = start + int(np.argmax(crosses)) if crosses.any() else stop
+            
+            # Rest the non-crossing run in bulk
+            for side_is_buy in (True, False):
+                idx = start + np.flatnonzero(is_buy[start:run_end] == side_is_buy)
+                if len(idx):
+                    self._rest_batch(side_is_buy, [orders[i] for i in idx],
+                                     ticks[idx], qtys[idx])
+            
+            # Match the crossing order on its own
+            if run_end < stop:
+                trades[run_end] = self.add_order(orders[run_end])
+                run_end += 1
+            start = run_end
+        
+        return orders, trades
+    
+    def _rest_batch(self, is_buy: bool, orders: List[Order], ticks: np.ndarray,
+                    quantities: np.ndarray):
+        """Rest non-crossing orders of one side, grouped by price level"""
+        book = self.bids if is_buy else self.asks
+        
+        levels, inverse = np.unique(ticks, return_inverse=True)
+        
+        # Group members per level, keeping arrival order within each level
+        by_level = np.argsort(inverse, kind='stable')
+        bounds = np.searchsorted(inverse[by_level], np.arange(len(levels) + 1)).tolist()
+        member_qtys = quantities[by_level].tolist()
+        
+        for j, tick in enumerate(levels.tolist()):
+            lo, hi = bounds[j], bounds[j + 1]
+            members = [orders[i] for i in by_level[lo:hi]]
+            level = book.get(tick)
+            if level is None:
+                level = book[tick] = PriceLevel(tick)
+            level.orders.extend(members)
+            # Summed one order at a time, in arrival order, exactly as
+            # sequential add_order() calls would
+            total = level.total_quantity
+            for qty in member_qtys[lo:hi]:
+                total += qty
+            level.total_quantity = total
+            level.live_orders += len(members)
+        
+        if is_buy:
+            top = int(levels[-1])
+            if self._best_bid is None or top > self._best_bid:
+                self._best_bid = top
+        else:
+            top = int(levels[0])
+            if self._best_ask is None or top < self._best_ask:
+                self._best_ask = top
+        
+        self.orders.update((order.order_id, order) for order in orders)
+    
     def _add_to_book(self, order: Order):
         """Add unfilled order to the book"""
-        if order.side == OrderSide.BUY:
-            if order.price not in self.bids:
-                self.bids[order.price] = PriceLevel(order.price)
-            self.bids[order.price].add_order(order)
+        tick = _limit_tick(order.price * self.price_scale, order.is_buy)
+        if order.is_buy:
+            level = self.bids.get(tick)
+            if level is None:
+                level = self.bids[tick] = PriceLevel(tick)
+                if self._best_bid is None or tick > self._best_bid:
+                    self._best_bid = tick
         else:
-            if order.price not in self.asks:
-                self.asks[order.price] = PriceLevel(order.price)
-            self.asks[order.price].add_order(order)
+            level = self.asks.get(tick)
+            if level is None:
+                level = self.asks[tick] = PriceLevel(tick)
+                if self._best_ask is None or tick < self._best_ask:
+                    self._best_ask = tick
+        
+        # PriceLevel.add_order, inlined
+        level.orders.append(order)
+        level.total_quantity += order.remaining_quantity
+        level.live_orders += 1
+    
+    def _remove_bid_level(self, tick: int):
+        """Delete a bid price level and refresh the cached best bid"""
+        del self.bids[tick]
+        if tick == self._best_bid:
+            if not self.bids:
+                self._best_bid = None
+            elif SORTEDCONTAINERS_AVAILABLE:
+                self._best_bid = self.bids.peekitem(-1)[0]
+            else:
+                self._best_bid = max(self.bids)
+    
+    def _remove_ask_level(self, tick: int):
+        """Delete an ask price level and refresh the cached best ask"""
+        del self.asks[tick]
+        if tick == self._best_ask:
+            if not self.asks:
+                self._best_ask = None
+            elif SORTEDCONTAINERS_AVAILABLE:
+                self._best_ask = self.asks.peekitem(0)[0]
+            else:
+                self._best_ask = min(self.asks)
     
     def _match_order(self, order: Order) -> List[dict]:
         """
@@ -117,7 +383,7 @@ class OrderBook:
         """
         trades = []
         
-        if order.side == OrderSide.BUY:
+        if order.is_buy:
             # Match against asks (sell orders)
             trades = self._match_buy_order(order)
         else:
@@ -130,41 +396,78 @@ class OrderBook:
         """Match buy order against sell orders"""
         trades = []
         
-        # Get sorted ask prices (lowest first)
-        sorted_ask_prices = sorted(self.asks.keys())
+        # Loop invariants hoisted out of the walk
+        scale = self.price_scale
+        # Market orders get an unreachable limit, so one compare serves both
+        if buy_order.order_type is OrderType.LIMIT:
+            limit_tick = _limit_tick(buy_order.price * scale, True)
+        else:
+            limit_tick = MARKET_BUY_LIMIT_TICK
         
-        for ask_price in sorted_ask_prices:
+        # Nothing to match if the order does not reach the best ask
+        if self._best_ask is None or limit_tick < self._best_ask:
+            return trades
+        
+        buy_rem = buy_order.remaining_quantity  # re-read from the order after each fill
+        asks = self.asks
+        resting = self.orders
+        
+        # Walk asks from the cached best (lowest) price; emptied levels are
+        # removed below, which advances the best ask
+        while self._best_ask is not None:
+            ask_tick = self._best_ask
+            
             # Stop if buy price is lower than ask price (no match possible)
-            if buy_order.order_type == OrderType.LIMIT and buy_order.price < ask_price:
+            if limit_tick < ask_tick:
                 break
             
             # Stop if buy order is filled
-            if buy_order.is_filled:
+            if buy_rem <= 0:
                 break
             
-            price_level = self.asks[ask_price]
+            price_level = asks[ask_tick]
+            ask_price = ask_tick / scale
+            queue = price_level.orders
+            head = price_level.head
+            end = len(queue)
             
             # Match against orders at this price level (FIFO)
-            while price_level.orders and not buy_order.is_filled:
-                sell_order = price_level.orders[0]
+            while head < end and buy_rem > 0:
+                sell_order = queue[head]
+                
+                # Reap lazily cancelled orders
+                if sell_order.status is OrderStatus.CANCELLED:
+                    queue[head] = None
+                    head += 1
+                    continue
                 
                 # Calculate trade quantity
-                trade_qty = min(buy_order.remaining_quantity, 
-                              sell_order.remaining_quantity)
+                resting_rem = sell_order.remaining_quantity
+                trade_qty = buy_rem if buy_rem < resting_rem else resting_rem
                 
                 # Execute trade at the ask price (price of resting order)
                 trade = self._execute_trade(buy_order, sell_order, ask_price, trade_qty)
                 trades.append(trade)
+                buy_rem = buy_order.remaining_quantity
                 
                 # Remove filled sell order
                 if sell_order.is_filled:
-                    price_level.orders.popleft()
+                    queue[head] = None
+                    head += 1
                     price_level.total_quantity -= sell_order.quantity
-                    del self.orders[sell_order.order_id]
+                    price_level.live_orders -= 1
+                    del resting[sell_order.order_id]
             
-            # Remove empty price level
-            if price_level.is_empty():
-                del self.asks[ask_price]
+            # Remove empty price level (otherwise the buy order is filled)
+            if not price_level.live_orders:
+                self._remove_ask_level(ask_tick)
+            else:
+                # Drop the spent prefix once it outgrows the live part
+                if head > QUEUE_COMPACT_MIN and head * 2 > end:
+                    del queue[:head]
+                    head = 0
+                price_level.head = head
+                break
         
         return trades
     
@@ -172,41 +475,78 @@ class OrderBook:
         """Match sell order against buy orders"""
         trades = []
         
-        # Get sorted bid prices (highest first)
-        sorted_bid_prices = sorted(self.bids.keys(), reverse=True)
+        # Loop invariants hoisted out of the walk
+        scale = self.price_scale
+        # Market orders get an unreachable limit, so one compare serves both
+        if sell_order.order_type is OrderType.LIMIT:
+            limit_tick = _limit_tick(sell_order.price * scale, False)
+        else:
+            limit_tick = MARKET_SELL_LIMIT_TICK
+        
+        # Nothing to match if the order does not reach the best bid
+        if self._best_bid is None or limit_tick > self._best_bid:
+            return trades
         
-        for bid_price in sorted_bid_prices:
+        sell_rem = sell_order.remaining_quantity  # re-read from the order after each fill
+        bids = self.bids
+        resting = self.orders
+        
+        # Walk bids from the cached best (highest) price; emptied levels are
+        # removed below, which advances the best bid
+        while self._best_bid is not None:
+            bid_tick = self._best_bid
+            
             # Stop if sell price is higher than bid price
-            if sell_order.order_type == OrderType.LIMIT and sell_order.price > bid_price:
+            if limit_tick > bid_tick:
                 break
             
             # Stop if sell order is filled
-            if sell_order.is_filled:
+            if sell_rem <= 0:
                 break
             
-            price_level = self.bids[bid_price]
+            price_level = bids[bid_tick]
+            bid_price = bid_tick / scale
+            queue = price_level.orders
+            head = price_level.head
+            end = len(queue)
             
             # Match against orders at this price level (FIFO)
-            while price_level.orders and not sell_order.is_filled:
-                buy_order = price_level.orders[0]
+            while head < end and sell_rem > 0:
+                buy_order = queue[head]
+                
+                # Reap lazily cancelled orders
+                if buy_order.status is OrderStatus.CANCELLED:
+                    queue[head] = None
+                    head += 1
+                    continue
                 
                 # Calculate trade quantity
-                trade_qty = min(sell_order.remaining_quantity,
-                              buy_order.remaining_quantity)
+                resting_rem = buy_order.remaining_quantity
+                trade_qty = sell_rem if sell_rem < resting_rem else resting_rem
                 
                 # Execute trade at the bid price
                 trade = self._execute_trade(buy_order, sell_order, bid_price, trade_qty)
                 trades.append(trade)
+                sell_rem = sell_order.remaining_quantity
                 
                 # Remove filled buy order
                 if buy_order.is_filled:
-                    price_level.orders.popleft()
+                    queue[head] = None
+                    head += 1
                     price_level.total_quantity -= buy_order.quantity
-                    del self.orders[buy_order.order_id]
+                    price_level.live_orders -= 1
+                    del resting[buy_order.order_id]
             
-            # Remove empty price level
-            if price_level.is_empty():
-                del self.bids[bid_price]
+            # Remove empty price level (otherwise the sell order is filled)
+            if not price_level.live_orders:
+                self._remove_bid_level(bid_tick)
+            else:
+                # Drop the spent prefix once it outgrows the live part
+                if head > QUEUE_COMPACT_MIN and head * 2 > end:
+                    del queue[:head]
+                    head = 0
+                price_level.head = head
+                break
         
         return trades
     
@@ -239,14 +579,51 @@ class OrderBook:
             'timestamp': buy_order.timestamp
         }
         
+        # Append to the columnar trade log
+        n = self.num_trades
+        log = self._trade_log
+        if n == len(log['price']):
+            log = self._trade_log = {name: np.concatenate([values, np.empty_like(values)])
+                                     for name, values in log.items()}
+        log['price'][n] = price
+        log['quantity'][n] = quantity
+        log['buy_order_id'][n] = buy_order.order_id
+        log['sell_order_id'][n] = sell_order.order_id
+        log['buyer'][n] = buy_order.trader_id
+        log['seller'][n] = sell_order.trader_id
+        log['timestamp'][n] = buy_order.timestamp
+        
         # Update statistics
-        self.trades.append(trade)
         self.total_volume += quantity
-        self.num_trades += 1
+        self.num_trades = n + 1
         
         return trade
     
-    def cancel_order(self, order_id: str) -> bool:
+    def trades_since(self, start: int) -> List[dict]:
+        """
+        Trades from index start onwards, as dicts
+        
+        Args:
+            start: Index into the trade log (e.g. a previous num_trades)
+            
+        Returns:
+            list: Trade dicts in execution order
+        """
+        start = max(start, 0)
+        n = self.num_trades
+        if start >= n:
+            return []
+        
+        names = list(TRADE_LOG_DTYPES)
+        columns = [self._trade_log[name][start:n].tolist() for name in names]
+        return [dict(zip(names, row)) for row in zip(*columns)]
+    
+    @property
+    def trades(self) -> List[dict]:
+        """Full trade history as dicts (built on access; prefer trades_since)"""
+        return self.trades_since(0)
+    
+    def cancel_order(self, order_id: int) -> bool:
         """
         Cancel an order
         
@@ -261,17 +638,18 @@ class OrderBook:
         
         order = self.orders[order_id]
         
-        # Remove from book
-        if order.side == OrderSide.BUY:
-            if order.price in self.bids:
-                self.bids[order.price].remove_order(order)
-                if self.bids[order.price].is_empty():
-                    del self.bids[order.price]
+        # Remove from book (O(1): the queue entry is skipped when matched)
+        tick = _limit_tick(order.price * self.price_scale, order.is_buy)
+        if order.is_buy:
+            if tick in self.bids:
+                self.bids[tick].remove_order(order)
+                if self.bids[tick].is_empty():
+                    self._remove_bid_level(tick)
         else:
-            if order.price in self.asks:
-                self.asks[order.price].remove_order(order)
-                if self.asks[order.price].is_empty():
-                    del self.asks[order.price]
+            if tick in self.asks:
+                self.asks[tick].remove_order(order)
+                if self.asks[tick].is_empty():
+                    self._remove_ask_level(tick)
         
         # Update order status
         order.cancel()
@@ -282,12 +660,16 @@ class OrderBook:
     @property
     def best_bid(self) -> Optional[float]:
         """Get highest bid price"""
-        return max(self.bids.keys()) if self.bids else None
+        if self._best_bid is None:
+            return None
+        return self._best_bid / self.price_scale
     
     @property
     def best_ask(self) -> Optional[float]:
         """Get lowest ask price"""
-        return min(self.asks.keys()) if self.asks else None
+        if self._best_ask is None:
+            return None
+        return self._best_ask / self.price_scale
     
     @property
     def spread(self) -> Optional[float]:
@@ -303,6 +685,32 @@ class OrderBook:
             return (self.best_bid + self.best_ask) / 2
         return None
     
+    def tob_snapshot(self) -> Tuple[Optional[float], Optional[float],
+                                    Optional[float], Optional[float]]:
+        """
+        Get the whole top of book in one call
+        
+        Returns:
+            tuple: (best_bid, best_ask, mid_price, spread)
+        """
+        best_bid = self.best_bid
+        best_ask = self.best_ask
+        if best_bid and best_ask:
+            return best_bid, best_ask, (best_bid + best_ask) / 2, best_ask - best_bid
+        return best_bid, best_ask, None, None
+    
+    def _top_bid_ticks(self, levels: int) -> List[int]:
+        """Best `levels` bid prices in ticks, highest first"""
+        if SORTEDCONTAINERS_AVAILABLE:
+            return list(islice(reversed(self.bids), levels))
+        return heapq.nlargest(levels, self.bids.keys())
+    
+    def _top_ask_ticks(self, levels: int) -> List[int]:
+        """Best `levels` ask prices in ticks, lowest first"""
+        if SORTEDCONTAINERS_AVAILABLE:
+            return list(islice(self.asks, levels))
+        return heapq.nsmallest(levels, self.asks.keys())
+    
     def get_book_depth(self, levels: int = 10) -> Tuple[List[tuple], List[tuple]]:
         """
         Get order book depth
@@ -313,44 +721,93 @@ class OrderBook:
         Returns:
             tuple: (bids, asks) where each is [(price, quantity), ...]
         """
+        scale = self.price_scale
+        
         # Bids (descending price)
-        bid_prices = sorted(self.bids.keys(), reverse=True)[:levels]
-        bids = [(price, self.bids[price].total_quantity) for price in bid_prices]
+        bids = [(tick / scale, self.bids[tick].total_quantity)
+                for tick in self._top_bid_ticks(levels)]
         
         # Asks (ascending price)
-        ask_prices = sorted(self.asks.keys())[:levels]
-        asks = [(price, self.asks[price].total_quantity) for price in ask_prices]
+        asks = [(tick / scale, self.asks[tick].total_quantity)
+                for tick in self._top_ask_ticks(levels)]
         
         return bids, asks
     
-    def print_book(self, levels: int = 5):
-        """Print order book state"""
+    def get_book_depth_arrays(self, levels: int = 10) -> Tuple[np.ndarray, np.ndarray,
+                                                               np.ndarray, np.ndarray]:
+        """
+        Get order book depth as NumPy arrays
+        
+        Args:
+            levels: Number of price levels to return
+            
+        Returns:
+            tuple: (bid_prices, bid_qtys, ask_prices, ask_qtys), best level first
+        """
+        bid_ticks = self._top_bid_ticks(levels)
+        bid_qtys = [self.bids[tick].total_quantity for tick in bid_ticks]
+        
+        ask_ticks = self._top_ask_ticks(levels)
+        ask_qtys = [self.asks[tick].total_quantity for tick in ask_ticks]
+        
+        scale = self.price_scale
+        return (np.array(bid_ticks, dtype=np.float64) / scale,
+                np.array(bid_qtys, dtype=np.float64),
+                np.array(ask_ticks, dtype=np.float64) / scale,
+                np.array(ask_qtys, dtype=np.float64))
+    
+    def snapshot(self, levels: int = 5) -> Dict:
+        """
+        Get the order book state as structured data
+        
+        Args:
+            levels: Number of price levels per side
+            
+        Returns:
+            dict: Symbol, depth, top of book and trade totals
+        """
         bids, asks = self.get_book_depth(levels)
+        best_bid, best_ask, mid_price, spread = self.tob_snapshot()
+        
+        return {
+            'symbol': self.symbol,
+            'bids': bids,
+            'asks': asks,
+            'best_bid': best_bid,
+            'best_ask': best_ask,
+            'mid_price': mid_price,
+            'spread': spread,
+            'num_trades': self.num_trades,
+            'total_volume': self.total_volume
+        }
+    
+    def print_book(self, levels: int = 5):
+        """Print order book state (use snapshot() for programmatic access)"""
+        snap = self.snapshot(levels)
         
         print("\n" + "="*70)
-        print(f"ORDER BOOK: {self.symbol}")
+        print(f"ORDER BOOK: {snap['symbol']}")
         print("="*70)
         
         print("\n📕 ASKS (Sell Orders)")
         print("-" * 50)
-        for price, qty in reversed(asks):
+        for price, qty in reversed(snap['asks']):
             print(f"  ${price:>10,.2f}  |  {qty:>10.4f}")
         
         print("-" * 50)
-        if self.spread:
-            print(f"  SPREAD: ${self.spread:.2f} | MID: ${self.mid_price:.2f}")
+        if snap['spread']:
+            print(f"  SPREAD: ${snap['spread']:.2f} | MID: ${snap['mid_price']:.2f}")
         print("-" * 50)
         
         print("\n📗 BIDS (Buy Orders)")
         print("-" * 50)
-        for price, qty in bids:
+        for price, qty in snap['bids']:
             print(f"  ${price:>10,.2f}  |  {qty:>10.4f}")
         print("-" * 50)
         
-        print(f"\nTrades: {self.num_trades} | Volume: {self.total_volume:.4f}")
+        print(f"\nTrades: {snap['num_trades']} | Volume: {snap['total_volume']:.4f}")
         print("="*70)
 
-
 # Test the order book
 if __name__ == "__main__":
     from src.orderbook.order import create_limit_order
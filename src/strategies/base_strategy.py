@@ -4,19 +4,53 @@ Abstract base class for all trading strategies
 """
 
 from abc import ABC, abstractmethod
+from collections import namedtuple
+from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 from datetime import datetime
+import logging
+from time import monotonic_ns, time_ns
 import sys
 from pathlib import Path
 
-# Add project root to path
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+# Add project root to path only when run as a script; package imports
+# already resolve, and re-inserting it can import modules twice
+if not __package__:
+    project_root = Path(__file__).parent.parent.parent
+    sys.path.insert(0, str(project_root))
 
 from src.orderbook.orderbook import OrderBook
 from src.orderbook.matching_engine import MatchingEngine
 from src.orderbook.order import Order
 
+# Offset that maps monotonic_ns() readings onto wall-clock epoch nanoseconds
+_MONOTONIC_EPOCH_OFFSET_NS = time_ns() - monotonic_ns()
+
+logger = logging.getLogger(__name__)
+
+
+def ns_to_datetime(ts: int) -> datetime:
+    """Convert a monotonic_ns() timestamp to a wall-clock datetime for reporting"""
+    return datetime.fromtimestamp((ts + _MONOTONIC_EPOCH_OFFSET_NS) / 1e9)
+
+
+OrderHistoryEntry = namedtuple('OrderHistoryEntry', 'ts side price quantity report')
+
+
+@dataclass(slots=True)
+class MarketState:
+    """
+    Market snapshot passed to on_tick()
+    A single instance is reused and updated in place every tick
+    """
+    mid_price: Optional[float] = None
+    best_bid: Optional[float] = None
+    best_ask: Optional[float] = None
+    spread: Optional[float] = None
+    bids: List[tuple] = field(default_factory=list)
+    asks: List[tuple] = field(default_factory=list)
+    timestamp: Optional[int] = None  # monotonic_ns(); see ns_to_datetime
+
 
 class BaseStrategy(ABC):
     """
@@ -42,7 +76,7 @@ class BaseStrategy(ABC):
         
         # Strategy state
         self.is_running = False
-        self.active_orders: Dict[str, Order] = {}  # order_id -> Order
+        self.active_orders: Dict[int, Order] = {}  # order_id -> Order
         
         # Performance tracking
         self.total_pnl = 0.0
@@ -52,12 +86,18 @@ class BaseStrategy(ABC):
         
         # Event history
         self.trade_history: List[dict] = []
-        self.order_history: List[dict] = []
+        self.order_history: List[OrderHistoryEntry] = []
+        
+        # Reused market snapshot (see get_market_state)
+        self.market_state = MarketState()
         
-        print(f"✅ {strategy_name} initialized")
+        # Index of the first order book trade not yet dispatched to on_trade()
+        self._last_trade_idx = orderbook.num_trades
+        
+        logger.debug("%s initialized", strategy_name)
     
     @abstractmethod
-    def on_tick(self, market_data: Dict) -> List[Order]:
+    def on_tick(self, market_data: MarketState) -> List[Order]:
         """
         Called on every market tick
         Strategy should decide what orders to place
@@ -95,13 +135,13 @@ class BaseStrategy(ABC):
     def start(self):
         """Start the strategy"""
         self.is_running = True
-        print(f"🚀 {self.strategy_name} started")
+        logger.info("%s started", self.strategy_name)
     
     def stop(self):
         """Stop the strategy"""
         self.is_running = False
         self.cancel_all_orders()
-        print(f"🛑 {self.strategy_name} stopped")
+        logger.info("%s stopped", self.strategy_name)
     
     def submit_order(self, side: str, price: float, quantity: float) -> Optional[Dict]:
         """
@@ -124,17 +164,13 @@ class BaseStrategy(ABC):
         )
         
         # Track order
-        self.order_history.append({
-            'timestamp': datetime.now(),
-            'side': side,
-            'price': price,
-            'quantity': quantity,
-            'report': report
-        })
+        self.order_history.append(
+            OrderHistoryEntry(monotonic_ns(), side, price, quantity, report)
+        )
         
         return report
     
-    def cancel_order(self, order_id: str) -> bool:
+    def cancel_order(self, order_id: int) -> bool:
         """
         Cancel an active order
         
@@ -158,26 +194,57 @@ class BaseStrategy(ABC):
         for order_id in order_ids:
             self.cancel_order(order_id)
         
-        print(f"  Cancelled {len(order_ids)} orders")
+        logger.debug("Cancelled %d orders", len(order_ids))
     
-    def get_market_state(self) -> Dict:
+    def process_new_trades(self) -> int:
+        """
+        Dispatch new order book trades involving this strategy to on_trade()
+        
+        Each trade is seen once: a cursor into the trade log advances past
+        everything examined.
+        
+        Returns:
+            int: Number of trades dispatched
+        """
+        orderbook = self.orderbook
+        name = self.strategy_name
+        trades = orderbook.trades_since(self._last_trade_idx)
+        self._last_trade_idx = orderbook.num_trades
+        
+        dispatched = 0
+        for trade in trades:
+            if trade['buyer'] == name or trade['seller'] == name:
+                self.on_trade(trade)
+                dispatched += 1
+        
+        return dispatched
+    
+    def get_market_state(self, depth_levels: int = 1) -> MarketState:
         """
         Get current market state
         
+        Updates and returns the strategy's reused MarketState instance,
+        so callers should not hold on to it across ticks.
+        
+        Args:
+            depth_levels: Price levels per side to copy into bids/asks
+                (0 skips the depth snapshot; top of book is always set)
+        
         Returns:
-            dict: Market information
+            MarketState: Market information
         """
-        bids, asks = self.orderbook.get_book_depth(levels=10)
+        state = self.market_state
+        state.best_bid, state.best_ask, state.mid_price, state.spread = \
+            self.orderbook.tob_snapshot()
         
-        return {
-            'best_bid': self.orderbook.best_bid,
-            'best_ask': self.orderbook.best_ask,
-            'mid_price': self.orderbook.mid_price,
-            'spread': self.orderbook.spread,
-            'bids': bids,
-            'asks': asks,
-            'timestamp': datetime.now()
-        }
+        if depth_levels > 0:
+            state.bids, state.asks = self.orderbook.get_book_depth(levels=depth_levels)
+        else:
+            state.bids = []
+            state.asks = []
+        state.timestamp = monotonic_ns()
+        
+        return state
     
     def update_pnl(self, realized: float = 0.0, unrealized: float = 0.0):
         """
@@ -3,8 +3,67 @@ Inventory Manager Module
 Manages inventory risk for market making strategies
 """
 
+import logging
+from types import MappingProxyType
 import numpy as np
-from typing import Dict, Optional
+from typing import Dict, Mapping, Optional, Tuple
+
+# Optional: numba JIT for the per-tick quote arithmetic
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+def _optimal_quotes_py(inventory, target_inventory, risk_aversion, mid_price, base_spread):
+    """
+    Inventory-skewed bid/ask around the mid price
+    
+    Returns:
+        tuple: (bid_price, ask_price, skew)
+    """
+    skew = (inventory - target_inventory) * risk_aversion
+    half_spread = base_spread * 0.5
+    return mid_price - half_spread - skew, mid_price + half_spread + skew, skew
+
+
+def _quote_size_py(is_buy, inventory, target_inventory, max_inventory, base_size):
+    """
+    Quote size shrunk by inventory utilization (0.0 when at the limit)
+    
+    Returns:
+        float: Adjusted order size
+    """
+    if is_buy and inventory >= max_inventory:
+        return 0.0
+    if not is_buy and inventory <= -max_inventory:
+        return 0.0
+    
+    # Reduce size as inventory increases
+    size_multiplier = max(0.1, 1.0 - abs(inventory) / max_inventory * 0.5)
+    
+    # Further reduce if quoting in direction that increases inventory
+    if is_buy and inventory > target_inventory:
+        size_multiplier *= 0.5
+    elif not is_buy and inventory < target_inventory:
+        size_multiplier *= 0.5
+    
+    return base_size * size_multiplier
+
+
+# Compiled eagerly for float arguments (and cached on disk) so the first
+# tick does not pay the compile; the pure-Python versions are the fallback
+if NUMBA_AVAILABLE:
+    _optimal_quotes = njit('UniTuple(float64, 3)(float64, float64, float64, float64, float64)',
+                           cache=True)(_optimal_quotes_py)
+    _quote_size = njit('float64(boolean, float64, float64, float64, float64)',
+                       cache=True)(_quote_size_py)
+else:
+    _optimal_quotes = _optimal_quotes_py
+    _quote_size = _quote_size_py
 
 
 class InventoryManager:
@@ -37,10 +96,12 @@ class InventoryManager:
         self.max_inventory_reached = 0.0
         self.inventory_breaches = 0
         
-        print(f"✅ InventoryManager initialized")
-        print(f"   Target Inventory: {target_inventory:.4f}")
-        print(f"   Max Inventory: ±{max_inventory:.4f}")
-        print(f"   Risk Aversion: {inventory_risk_aversion}")
+        # get_inventory_metrics() snapshot, rebuilt after inventory changes
+        self._metrics_cache: Optional[Mapping] = None
+        self._metrics_dirty = True
+        
+        logger.debug("InventoryManager initialized: target=%.4f, max=±%.4f, risk aversion=%s",
+                     target_inventory, max_inventory, inventory_risk_aversion)
     
     def update_inventory(self, quantity: float, price: float):
         """
@@ -52,6 +113,7 @@ class InventoryManager:
         """
         self.current_inventory += quantity
         self.inventory_value = self.current_inventory * price
+        self._metrics_dirty = True
         
         # Track max inventory
         abs_inventory = abs(self.current_inventory)
@@ -116,19 +178,17 @@ class InventoryManager:
         Returns:
             dict: Optimal bid and ask prices
         """
-        adjustments = self.calculate_quote_adjustment(base_spread)
-        
-        half_spread = base_spread / 2
-        
-        # Apply inventory adjustments
-        bid_price = mid_price - half_spread + adjustments['bid_adjustment']
-        ask_price = mid_price + half_spread + adjustments['ask_adjustment']
+        # Apply inventory adjustments (long -> tighten bid, widen ask)
+        bid_price, ask_price, skew = _optimal_quotes(
+            self.current_inventory, self.target_inventory,
+            self.inventory_risk_aversion, mid_price, base_spread
+        )
         
         return {
             'bid_price': bid_price,
             'ask_price': ask_price,
             'spread': ask_price - bid_price,
-            'skew': adjustments['skew']
+            'skew': skew
         }
     
     def should_quote(self, side: str) -> bool:
@@ -162,22 +222,27 @@ class InventoryManager:
         Returns:
             float: Adjusted order size
         """
-        if not self.should_quote(side):
-            return 0.0
-        
-        # Calculate inventory utilization
-        inventory_pct = abs(self.current_inventory) / self.max_inventory
-        
-        # Reduce size as inventory increases
-        size_multiplier = max(0.1, 1.0 - inventory_pct * 0.5)
+        return _quote_size(side.upper() == "BUY", self.current_inventory,
+                           self.target_inventory, self.max_inventory, base_size)
+    
+    def get_quote_plan(self, base_size: float) -> Tuple[float, float, bool, bool]:
+        """
+        Quote sizes and quoting decisions for both sides in one call
         
-        # Further reduce if quoting in direction that increases inventory
-        if side.upper() == "BUY" and self.current_inventory > self.target_inventory:
-            size_multiplier *= 0.5
-        elif side.upper() == "SELL" and self.current_inventory < self.target_inventory:
-            size_multiplier *= 0.5
+        Equivalent to get_quote_size() and should_quote() for each side.
         
-        return base_size * size_multiplier
+        Args:
+            base_size: Base order size
+            
+        Returns:
+            tuple: (bid_size, ask_size, quote_bid, quote_ask)
+        """
+        inventory = self.current_inventory
+        bid_size = _quote_size(True, inventory, self.target_inventory,
+                               self.max_inventory, base_size)
+        ask_size = _quote_size(False, inventory, self.target_inventory,
+                               self.max_inventory, base_size)
+        return bid_size, ask_size, bid_size > 0, ask_size > 0
     
     def is_inventory_neutral(self, threshold: float = 0.1) -> bool:
         """
@@ -192,16 +257,22 @@ class InventoryManager:
         deviation = abs(self.current_inventory - self.target_inventory)
         return deviation < threshold
     
-    def get_inventory_metrics(self) -> Dict:
+    def get_inventory_metrics(self) -> Mapping:
         """
         Get inventory metrics
         
+        Cached until the next update_inventory() call; the result is a
+        read-only view, so copy it with dict() to keep or modify it.
+        
         Returns:
-            dict: Inventory statistics
+            Mapping: Inventory statistics
         """
+        if not self._metrics_dirty:
+            return self._metrics_cache
+        
         inventory_pct = (self.current_inventory / self.max_inventory * 100) if self.max_inventory > 0 else 0
         
-        return {
+        self._metrics_cache = MappingProxyType({
             'current_inventory': self.current_inventory,
             'target_inventory': self.target_inventory,
             'max_inventory': self.max_inventory,
@@ -211,7 +282,10 @@ class InventoryManager:
             'skew': self.get_inventory_skew(),
             'max_inventory_reached': self.max_inventory_reached,
             'inventory_breaches': self.inventory_breaches
-        }
+        })
+        self._metrics_dirty = False
+        
+        return self._metrics_cache
     
     def print_metrics(self):
         """Print inventory metrics"""
@@ -3,23 +3,67 @@ Market Maker Strategy
 Complete market making strategy with inventory management and PnL tracking
 """
 
+import logging
+import math
 import numpy as np
-from typing import Dict, List
+from typing import Dict, List, NamedTuple, Optional
 from datetime import datetime
 import sys
 from pathlib import Path
 
-# Add project root to path
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+# Add project root to path only when run as a script; package imports
+# already resolve, and re-inserting it can import modules twice
+if not __package__:
+    project_root = Path(__file__).parent.parent.parent
+    sys.path.insert(0, str(project_root))
 
-from src.strategies.base_strategy import BaseStrategy
+from src.strategies.base_strategy import BaseStrategy, MarketState
 from src.strategies.inventory_manager import InventoryManager
 from src.strategies.pnl_tracker import PnLTracker
 from src.orderbook.orderbook import OrderBook
 from src.orderbook.matching_engine import MatchingEngine
 from src.orderbook.order import Order, create_limit_order
 
+logger = logging.getLogger(__name__)
+
+# print_comprehensive_statistics() report, filled in with a single format() call
+_STATS_TEMPLATE = (
+    "\n" + "="*70 + "\n"
+    "MARKET MAKER STRATEGY - COMPREHENSIVE STATISTICS\n"
+    + "="*70 + "\n"
+    "\n💼 Strategy Status:\n"
+    "   Status: {status}\n"
+    "   Quote Updates: {quote_updates}\n"
+    "   Trades Executed: {trades_executed}\n"
+    "\n📊 Portfolio:\n"
+    "   Cash: ${cash:,.2f}\n"
+    "   Inventory: {inventory[current_inventory]:.4f} BTC\n"
+    "   Inventory %: {inventory[inventory_pct]:.1f}%\n"
+    "   Portfolio Value: ${portfolio_value:,.2f}\n"
+    "\n💰 PnL:\n"
+    "   Total: ${total_pnl:,.2f} ({total_return_pct:+.2f}%)\n"
+    "   Realized: ${realized_pnl:,.2f}\n"
+    "   Unrealized: ${unrealized_pnl:,.2f}\n"
+    "\n📈 Trading Activity:\n"
+    "   Total Trades: {num_trades}\n"
+    "   Buys: {num_buys} ({total_buy_volume:.4f} BTC)\n"
+    "   Sells: {num_sells} ({total_sell_volume:.4f} BTC)\n"
+    "   Win Rate: {win_rate_pct:.1f}%\n"
+    "\n⚖️ Risk Management:\n"
+    "   Inventory Skew: {inventory[skew]:.4f}\n"
+    "   Neutral: {neutral}\n"
+    "   Max Inventory: {inventory[max_inventory_reached]:.4f}\n"
+    "   Breaches: {inventory[inventory_breaches]}\n"
+    + "="*70
+)
+
+
+class ActiveOrder(NamedTuple):
+    """A quote resting in the order book on behalf of the strategy"""
+    order_id: int
+    price: float
+    size: float
+
 
 class MarketMakerStrategy(BaseStrategy):
     """
@@ -36,7 +80,9 @@ class MarketMakerStrategy(BaseStrategy):
                  base_spread_bps: float = 10.0,
                  order_size: float = 0.1,
                  max_inventory: float = 5.0,
-                 initial_cash: float = 100000.0):
+                 initial_cash: float = 100000.0,
+                 requote_threshold: float = 0.0,
+                 min_requote_ms: float = 0.0):
         """
         Initialize market maker strategy
         
@@ -47,12 +93,21 @@ class MarketMakerStrategy(BaseStrategy):
             order_size: Order size for quotes
             max_inventory: Maximum inventory limit
             initial_cash: Initial cash balance
+            requote_threshold: Leave a resting quote in place when the new
+                price is within this distance and its size is unchanged
+                (never less than half a tick)
+            min_requote_ms: Minimum market time (tick/bar timestamps)
+                between cancel/replaces of resting quotes (0 disables the
+                limit)
         """
         super().__init__("MarketMaker", orderbook, matching_engine)
         
         # Strategy parameters
         self.base_spread_bps = base_spread_bps
         self.base_order_size = order_size
+        self.requote_threshold = requote_threshold
+        self.min_requote_ms = min_requote_ms
+        self.tick_size = 1.0 / orderbook.price_scale
         
         # Initialize inventory manager
         self.inventory_manager = InventoryManager(
@@ -71,16 +126,71 @@ class MarketMakerStrategy(BaseStrategy):
         self.active_bid_order = None
         self.active_ask_order = None
         
+        # (mid_price, inventory, order book trade count) the active quotes
+        # were computed from
+        self._last_quote_inputs = None
+        
+        # Market timestamp (ns) of the last cancel/replace (for min_requote_ms)
+        self._last_requote = None
+        
         # Performance metrics
         self.quote_updates = 0
+        self.quotes_skipped = 0
         self.trades_executed = 0
         
-        print(f"\n📊 Market Maker Parameters:")
-        print(f"   Base Spread: {base_spread_bps} bps")
-        print(f"   Order Size: {order_size} BTC")
-        print(f"   Max Inventory: ±{max_inventory} BTC")
+        logger.debug("Market maker parameters: spread=%s bps, size=%s BTC, max inventory=±%s BTC",
+                     base_spread_bps, order_size, max_inventory)
     
-    def on_tick(self, market_data: Dict) -> List[Order]:
+    def start(self):
+        """Start the strategy with a quote function specialized to its parameters"""
+        self._quote_fn = self._build_quote_fn()
+        self._last_quote_inputs = None
+        super().start()
+    
+    def _build_quote_fn(self):
+        """
+        Build a quote function with the strategy parameters bound as constants
+        
+        Mirrors InventoryManager.calculate_optimal_quotes() and
+        get_quote_size() without the per-tick attribute lookups.
+        
+        Returns:
+            callable: f(mid_price, inventory) -> (bid_price, ask_price, bid_size, ask_size)
+        """
+        spread_frac = self.base_spread_bps / 10000
+        base_size = self.base_order_size
+        target_inventory = self.inventory_manager.target_inventory
+        max_inventory = self.inventory_manager.max_inventory
+        risk_aversion = self.inventory_manager.inventory_risk_aversion
+        
+        def quote(mid_price, inventory):
+            half_spread = mid_price * spread_frac / 2
+            skew = (inventory - target_inventory) * risk_aversion
+            
+            bid_price = mid_price - half_spread - skew
+            ask_price = mid_price + half_spread + skew
+            
+            size_multiplier = max(0.1, 1.0 - abs(inventory) / max_inventory * 0.5)
+            
+            if inventory >= max_inventory:
+                bid_size = 0.0
+            elif inventory > target_inventory:
+                bid_size = base_size * (size_multiplier * 0.5)
+            else:
+                bid_size = base_size * size_multiplier
+            
+            if inventory <= -max_inventory:
+                ask_size = 0.0
+            elif inventory < target_inventory:
+                ask_size = base_size * (size_multiplier * 0.5)
+            else:
+                ask_size = base_size * size_multiplier
+            
+            return bid_price, ask_price, bid_size, ask_size
+        
+        return quote
+    
+    def on_tick(self, market_data: MarketState) -> List[Order]:
         """
         Called on every market tick
         Updates quotes based on current market state
@@ -95,67 +205,132 @@ class MarketMakerStrategy(BaseStrategy):
             return []
         
         # Get current market state
-        mid_price = market_data.get('mid_price')
-        if not mid_price:
+        mid_price = market_data.mid_price
+        if not mid_price or not np.isfinite(mid_price):
             return []
         
-        # Calculate base spread in dollars
-        base_spread = mid_price * (self.base_spread_bps / 10000)
+        # Same mid and inventory give the same quotes (and PnL): nothing to do,
+        # unless a trade since then may have filled a resting quote (fills on
+        # both sides can leave inventory unchanged with no quotes left)
+        inventory = self.inventory_manager.current_inventory
+        quote_inputs = (mid_price, inventory, self.orderbook.num_trades)
+        if quote_inputs == self._last_quote_inputs:
+            return []
+        self._last_quote_inputs = quote_inputs
         
-        # Get optimal quotes from inventory manager
-        optimal_quotes = self.inventory_manager.calculate_optimal_quotes(
-            mid_price, base_spread
-        )
+        # Compute quotes with the specialized quote function
+        bid_price, ask_price, bid_size, ask_size = self._quote_fn(mid_price, inventory)
         
-        # Calculate quote sizes
-        bid_size = self.inventory_manager.get_quote_size("BUY", self.base_order_size)
-        ask_size = self.inventory_manager.get_quote_size("SELL", self.base_order_size)
+        self.apply_quotes(bid_price, ask_price, bid_size, ask_size, mid_price,
+                          market_data.timestamp)
         
-        # Cancel existing quotes
-        self._cancel_active_quotes()
+        return []
+    
+    def quote_batch(self, mid_prices: np.ndarray) -> tuple:
+        """
+        Compute quotes for a run of ticks at the current inventory
         
-        # Place new quotes
-        if bid_size > 0 and self.inventory_manager.should_quote("BUY"):
-            self._place_bid(optimal_quotes['bid_price'], bid_size)
+        Args:
+            mid_prices: Array of mid prices
+            
+        Returns:
+            tuple: (bid_prices, ask_prices, bid_size, ask_size) with
+                   price arrays aligned to mid_prices
+        """
+        return self._quote_fn(mid_prices, self.inventory_manager.current_inventory)
+    
+    def apply_quotes(self, bid_price: float, ask_price: float,
+                     bid_size: float, ask_size: float, mid_price: float,
+                     timestamp: Optional[int] = None):
+        """
+        Replace the active quotes and update PnL
         
-        if ask_size > 0 and self.inventory_manager.should_quote("SELL"):
-            self._place_ask(optimal_quotes['ask_price'], ask_size)
+        Args:
+            bid_price: New bid price
+            ask_price: New ask price
+            bid_size: Bid size (0 to skip the bid side)
+            ask_size: Ask size (0 to skip the ask side)
+            mid_price: Current mid price for PnL
+            timestamp: Tick/bar timestamp in ns (min_requote_ms is only
+                enforced when given)
+        """
+        # Within min_requote_ms of the last replace, resting quotes stay put
+        # (a side going to zero size is still pulled) and the next tick
+        # re-evaluates even if its inputs are unchanged. Measured on market
+        # time so backtests do not depend on machine speed
+        throttled = (self.min_requote_ms > 0
+                     and timestamp is not None
+                     and self._last_requote is not None
+                     and timestamp - self._last_requote < self.min_requote_ms * 1_000_000)
+        if throttled:
+            self._last_quote_inputs = None
+        replaced = False
+        
+        # Replace each side unless its resting quote already matches
+        # (size is zero when a side is at its inventory limit)
+        if (self._quote_unchanged(self.active_bid_order, bid_price, bid_size)
+                or (throttled and self.active_bid_order and bid_size > 0)):
+            self.quotes_skipped += 1
+        else:
+            self._cancel_bid()
+            if bid_size > 0:
+                self._place_bid(bid_price, bid_size)
+            replaced = True
+        
+        if (self._quote_unchanged(self.active_ask_order, ask_price, ask_size)
+                or (throttled and self.active_ask_order and ask_size > 0)):
+            self.quotes_skipped += 1
+        else:
+            self._cancel_ask()
+            if ask_size > 0:
+                self._place_ask(ask_price, ask_size)
+            replaced = True
+        
+        if replaced and self.min_requote_ms > 0:
+            self._last_requote = timestamp
         
         self.quote_updates += 1
         
         # Update PnL
-        self.pnl_tracker.calculate_pnl(mid_price)
-        
-        return []
+        self.pnl_tracker.calculate_pnl_fast(mid_price)
     
     def _place_bid(self, price: float, size: float):
         """Place bid order"""
         report = self.submit_order("BUY", price, size)
         if report:
-            self.active_bid_order = {
-                'order_id': report['order_id'],
-                'price': price,
-                'size': size
-            }
+            self.active_bid_order = ActiveOrder(report['order_id'], price, size)
     
     def _place_ask(self, price: float, size: float):
         """Place ask order"""
         report = self.submit_order("SELL", price, size)
         if report:
-            self.active_ask_order = {
-                'order_id': report['order_id'],
-                'price': price,
-                'size': size
-            }
+            self.active_ask_order = ActiveOrder(report['order_id'], price, size)
+    
+    def _quote_unchanged(self, active: Optional[ActiveOrder], price: float, size: float) -> bool:
+        """Check if an active quote is still resting in full at (about) price
+        
+        Half a tick is the smallest price tolerance, so float noise well
+        below the book's tick size never forces a replace.
+        """
+        if not active or size <= 0:
+            return False
+        
+        order = self.orderbook.orders.get(active.order_id)
+        return (order is not None
+                and order.remaining_quantity == size
+                and math.isclose(price, active.price,
+                                 abs_tol=max(self.requote_threshold, self.tick_size / 2)))
     
-    def _cancel_active_quotes(self):
-        """Cancel existing active quotes"""
+    def _cancel_bid(self):
+        """Cancel the active bid quote"""
         if self.active_bid_order:
-            self.cancel_order(self.active_bid_order['order_id'])
+            self.cancel_order(self.active_bid_order.order_id)
             self.active_bid_order = None
-        
+    
+    def _cancel_ask(self):
+        """Cancel the active ask quote"""
         if self.active_ask_order:
-            self.cancel_order(self.active_ask_order['order_id'])
+            self.cancel_order(self.active_ask_order.order_id)
             self.active_ask_order = None
     
     def on_trade(self, trade: Dict):
@@ -166,6 +341,9 @@ class MarketMakerStrategy(BaseStrategy):
         Args:
             trade: Trade information
         """
+        # Realized PnL changes even if inventory ends up where it was
+        self._last_quote_inputs = None
+        
         # Record trade in PnL tracker
         if trade['buyer'] == self.strategy_name:
             self.pnl_tracker.record_buy(
@@ -214,13 +392,14 @@ class MarketMakerStrategy(BaseStrategy):
         """
         base_stats = self.get_statistics()
         pnl_stats = self.pnl_tracker.get_statistics(current_price)
-        inventory_metrics = self.inventory_manager.get_inventory_metrics()
+        inventory_metrics = dict(self.inventory_manager.get_inventory_metrics())
         
         return {
             **base_stats,
             **pnl_stats,
             'inventory': inventory_metrics,
             'quote_updates': self.quote_updates,
+            'quotes_skipped': self.quotes_skipped,
             'trades_executed': self.trades_executed
         }
     
@@ -228,39 +407,11 @@ class MarketMakerStrategy(BaseStrategy):
         """Print detailed strategy statistics"""
         stats = self.get_comprehensive_statistics(current_price)
         
-        print("\n" + "="*70)
-        print("MARKET MAKER STRATEGY - COMPREHENSIVE STATISTICS")
-        print("="*70)
-        
-        print(f"\n💼 Strategy Status:")
-        print(f"   Status: {'🟢 Running' if stats['is_running'] else '🔴 Stopped'}")
-        print(f"   Quote Updates: {stats['quote_updates']}")
-        print(f"   Trades Executed: {stats['trades_executed']}")
-        
-        print(f"\n📊 Portfolio:")
-        print(f"   Cash: ${stats['cash']:,.2f}")
-        print(f"   Inventory: {stats['inventory']['current_inventory']:.4f} BTC")
-        print(f"   Inventory %: {stats['inventory']['inventory_pct']:.1f}%")
-        print(f"   Portfolio Value: ${stats['portfolio_value']:,.2f}")
-        
-        print(f"\n💰 PnL:")
-        print(f"   Total: ${stats['total_pnl']:,.2f} ({stats['total_return_pct']:+.2f}%)")
-        print(f"   Realized: ${stats['realized_pnl']:,.2f}")
-        print(f"   Unrealized: ${stats['unrealized_pnl']:,.2f}")
-        
-        print(f"\n📈 Trading Activity:")
-        print(f"   Total Trades: {stats['num_trades']}")
-        print(f"   Buys: {stats['num_buys']} ({stats['total_buy_volume']:.4f} BTC)")
-        print(f"   Sells: {stats['num_sells']} ({stats['total_sell_volume']:.4f} BTC)")
-        print(f"   Win Rate: {stats['win_rate_pct']:.1f}%")
-        
-        print(f"\n⚖️ Risk Management:")
-        print(f"   Inventory Skew: {stats['inventory']['skew']:.4f}")
-        print(f"   Neutral: {'✅' if stats['inventory']['is_neutral'] else '❌'}")
-        print(f"   Max Inventory: {stats['inventory']['max_inventory_reached']:.4f}")
-        print(f"   Breaches: {stats['inventory']['inventory_breaches']}")
-        
-        print("="*70)
+        print(_STATS_TEMPLATE.format(
+            status='🟢 Running' if stats['is_running'] else '🔴 Stopped',
+            neutral='✅' if stats['inventory']['is_neutral'] else '❌',
+            **stats
+        ))
 
 
 def test_market_maker():
@@ -311,19 +462,14 @@ def test_market_maker():
         simulator.simulate_step()
         
         # Check for trades involving our strategy
-        recent_trades = simulator.orderbook.trades[-10:]  # Last 10 trades
-        for trade in recent_trades:
-            if (trade.get('buyer') == 'MarketMaker' or 
-                trade.get('seller') == 'MarketMaker'):
-                mm_strategy.on_trade(trade)
-        
-        # Print progress
-        if tick % 100 == 0 and tick > 0:
+        mm_strategy.process_new_trades()
+        
+        # Log progress
+        if tick % 100 == 0 and tick > 0 and logger.isEnabledFor(logging.INFO):
             progress = (tick / num_ticks) * 100
-            mid_price = market_state.get('mid_price', 50000)
-            print(f"  Progress: {progress:.0f}% | "
-                  f"Mid: ${mid_price:.2f} | "
-                  f"MM Trades: {mm_strategy.trades_executed}")
+            mid_price = market_state.mid_price or 50000
+            logger.info("  Progress: %.0f%% | Mid: $%.2f | MM Trades: %d",
+                        progress, mid_price, mm_strategy.trades_executed)
     
     # Stop strategy
     mm_strategy.stop()
@@ -339,4 +485,5 @@ def test_market_maker():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     test_market_maker()
\ No newline at end of file
@@ -3,10 +3,79 @@ PnL Tracker Module
 Tracks profit and loss for trading strategies
 """
 
-from typing import Dict, List
-from datetime import datetime
+from typing import Dict, List, TYPE_CHECKING
+import logging
+import time
 import numpy as np
 
+# Optional: numba JIT for the per-tick PnL arithmetic
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# pandas is only needed to hand the PnL history back as a DataFrame
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Trade record layout (side: 0 = BUY, 1 = SELL; timestamp in UTC)
+TRADE_DTYPE = np.dtype([
+    ('timestamp', 'datetime64[us]'),
+    ('side', 'u1'),
+    ('price', 'f8'),
+    ('quantity', 'f8'),
+    ('fee', 'f8'),
+    ('cash', 'f8'),
+    ('inventory', 'f8')
+])
+
+SIDE_BUY = 0
+SIDE_SELL = 1
+
+# PnL history columns (structure of arrays) and their dtypes
+PNL_HISTORY_DTYPES = {
+    'timestamp': np.int64,
+    'current_price': np.float64,
+    'cash': np.float64,
+    'inventory': np.float64,
+    'portfolio_value': np.float64,
+    'total_pnl': np.float64,
+    'realized_pnl': np.float64,
+    'unrealized_pnl': np.float64,
+}
+
+
+def _pnl_core_py(cash, inventory, initial_cash, initial_inventory, current_price,
+                 total_buy_cost, total_buy_volume):
+    """
+    Mark the portfolio to market against the average buy cost
+    
+    Returns:
+        tuple: (portfolio_value, total_pnl, unrealized_pnl, realized_pnl)
+    """
+    portfolio_value = cash + inventory * current_price
+    total_pnl = portfolio_value - (initial_cash + initial_inventory * current_price)
+    
+    # Unrealized PnL on a long position, against the average buy price
+    if total_buy_volume > 0 and inventory > 0:
+        unrealized_pnl = (current_price - total_buy_cost / total_buy_volume) * inventory
+    else:
+        unrealized_pnl = 0.0
+    
+    return portfolio_value, total_pnl, unrealized_pnl, total_pnl - unrealized_pnl
+
+
+# Compiled eagerly for float arguments (and cached on disk); the
+# pure-Python version is the fallback
+if NUMBA_AVAILABLE:
+    _pnl_core = njit('UniTuple(float64, 4)(float64, float64, float64, float64, '
+                     'float64, float64, float64)', cache=True)(_pnl_core_py)
+else:
+    _pnl_core = _pnl_core_py
+
 
 class PnLTracker:
     """
@@ -14,13 +83,23 @@ class PnLTracker:
     Calculates realized and unrealized PnL
     """
     
-    def __init__(self, initial_cash: float = 100000.0, initial_inventory: float = 0.0):
+    __slots__ = ('initial_cash', 'initial_inventory', 'cash', 'inventory',
+                 'realized_pnl', 'unrealized_pnl', 'total_pnl',
+                 '_trades', '_n_trades', '_profitable_trades',
+                 'record_history', '_history', '_hist_idx',
+                 'total_buy_volume', 'total_sell_volume', 'total_fees',
+                 'num_buys', 'num_sells', 'total_buy_cost', '_stats_cache')
+    
+    def __init__(self, initial_cash: float = 100000.0, initial_inventory: float = 0.0,
+                 record_history: bool = False, history_capacity: int = 10_000):
         """
         Initialize PnL tracker
         
         Args:
             initial_cash: Starting cash balance (USD)
             initial_inventory: Starting inventory (BTC)
+            record_history: Keep every calculate_pnl() snapshot in the PnL history
+            history_capacity: Snapshots kept (oldest are overwritten beyond this)
         """
         self.initial_cash = initial_cash
         self.initial_inventory = initial_inventory
@@ -34,9 +113,18 @@ class PnLTracker:
         self.unrealized_pnl = 0.0
         self.total_pnl = 0.0
         
-        # Trade history
-        self.trades: List[Dict] = []
-        self.pnl_history: List[Dict] = []
+        # Trade history (structured array, grown geometrically)
+        self._trades = np.empty(1024, dtype=TRADE_DTYPE)
+        self._n_trades = 0
+        
+        # Sells made directly after a lower-priced buy (win-rate numerator)
+        self._profitable_trades = 0
+        # PnL history ring buffer, one array per field (allocated only if recording)
+        self.record_history = record_history
+        self._history = ({name: np.empty(history_capacity, dtype=dtype)
+                          for name, dtype in PNL_HISTORY_DTYPES.items()}
+                         if record_history else None)
+        self._hist_idx = 0  # snapshots written so far
         
         # Statistics
         self.total_buy_volume = 0.0
@@ -44,10 +132,57 @@ class PnLTracker:
         self.total_fees = 0.0
         self.num_buys = 0
         self.num_sells = 0
+        self.total_buy_cost = 0.0
         
-        print(f"✅ PnLTracker initialized")
-        print(f"   Initial Cash: ${initial_cash:,.2f}")
-        print(f"   Initial Inventory: {initial_inventory:.4f} BTC")
+        # Last get_statistics() result, keyed by (current_price, trade count)
+        self._stats_cache = None
+        
+        logger.debug("PnLTracker initialized: cash=%.2f, inventory=%.4f BTC",
+                     initial_cash, initial_inventory)
+    
+    def _append_trade(self, side: int, price: float, quantity: float, fee: float):
+        """Append a trade record, doubling storage when full"""
+        if self._n_trades == len(self._trades):
+            grown = np.empty(2 * len(self._trades), dtype=TRADE_DTYPE)
+            grown[:self._n_trades] = self._trades
+            self._trades = grown
+        
+        if side == SIDE_SELL and self._n_trades > 0:
+            prev = self._trades[self._n_trades - 1]
+            if prev['side'] == SIDE_BUY and price > prev['price']:
+                self._profitable_trades += 1
+        
+        self._trades[self._n_trades] = (
+            time.time_ns() // 1000, side, price, quantity,
+            fee, self.cash, self.inventory
+        )
+        self._n_trades += 1
+    
+    @property
+    def trade_array(self) -> np.ndarray:
+        """Recorded trades as a structured array (view, no copy)"""
+        return self._trades[:self._n_trades]
+    
+    @property
+    def trades(self) -> List[Dict]:
+        """Recorded trades as a list of dicts"""
+        records = []
+        for timestamp, side, price, quantity, fee, cash, inventory in self.trade_array.tolist():
+            trade = {
+                'timestamp': timestamp,
+                'side': 'BUY' if side == SIDE_BUY else 'SELL',
+                'price': price,
+                'quantity': quantity
+            }
+            if side == SIDE_BUY:
+                trade['cost'] = price * quantity + fee
+            else:
+                trade['proceeds'] = price * quantity - fee
+            trade['fee'] = fee
+            trade['cash'] = cash
+            trade['inventory'] = inventory
+            records.append(trade)
+        return records
     
     def record_buy(self, price: float, quantity: float, fee: float = 0.0):
         """
@@ -65,20 +200,11 @@ class PnLTracker:
         self.inventory += quantity
         
         # Record trade
-        trade = {
-            'timestamp': datetime.now(),
-            'side': 'BUY',
-            'price': price,
-            'quantity': quantity,
-            'cost': cost,
-            'fee': fee,
-            'cash': self.cash,
-            'inventory': self.inventory
-        }
-        self.trades.append(trade)
+        self._append_trade(SIDE_BUY, price, quantity, fee)
         
         # Update statistics
         self.total_buy_volume += quantity
+        self.total_buy_cost += price * quantity
         self.total_fees += fee
         self.num_buys += 1
     
@@ -98,17 +224,7 @@ class PnLTracker:
         self.inventory -= quantity
         
         # Record trade
-        trade = {
-            'timestamp': datetime.now(),
-            'side': 'SELL',
-            'price': price,
-            'quantity': quantity,
-            'proceeds': proceeds,
-            'fee': fee,
-            'cash': self.cash,
-            'inventory': self.inventory
-        }
-        self.trades.append(trade)
+        self._append_trade(SIDE_SELL, price, quantity, fee)
         
         # Update statistics
         self.total_sell_volume += quantity
@@ -123,37 +239,12 @@ class PnLTracker:
             current_price: Current market price
             
         Returns:
-            dict: PnL breakdown
+            dict: PnL breakdown (also kept in pnl_history if record_history)
         """
-        # Calculate portfolio value
-        portfolio_value = self.cash + (self.inventory * current_price)
-        initial_value = self.initial_cash + (self.initial_inventory * current_price)
+        portfolio_value = self._update_pnl(current_price)
         
-        # Total PnL
-        self.total_pnl = portfolio_value - initial_value
-        
-        # Unrealized PnL (from current inventory)
-        if len(self.trades) > 0:
-            # Calculate average cost basis
-            buy_trades = [t for t in self.trades if t['side'] == 'BUY']
-            if buy_trades and self.inventory > 0:
-                total_cost = sum(t['price'] * t['quantity'] for t in buy_trades)
-                total_qty = sum(t['quantity'] for t in buy_trades)
-                avg_cost = total_cost / total_qty if total_qty > 0 else current_price
-                
-                self.unrealized_pnl = (current_price - avg_cost) * self.inventory
-            else:
-                self.unrealized_pnl = 0.0
-            
-            # Realized PnL
-            self.realized_pnl = self.total_pnl - self.unrealized_pnl
-        else:
-            self.unrealized_pnl = 0.0
-            self.realized_pnl = self.total_pnl
-        
-        # Record PnL snapshot
         pnl_snapshot = {
-            'timestamp': datetime.now(),
+            'timestamp': time.time_ns(),
             'current_price': current_price,
             'cash': self.cash,
             'inventory': self.inventory,
@@ -162,38 +253,127 @@ class PnLTracker:
             'realized_pnl': self.realized_pnl,
             'unrealized_pnl': self.unrealized_pnl
         }
-        self.pnl_history.append(pnl_snapshot)
+        if self.record_history:
+            history = self._history
+            i = self._hist_idx % len(history['timestamp'])
+            for name, value in pnl_snapshot.items():
+                history[name][i] = value
+            self._hist_idx += 1
         
         return pnl_snapshot
     
+    def _history_columns(self) -> Dict[str, np.ndarray]:
+        """Recorded history columns in chronological order"""
+        if self._history is None:
+            return {name: np.empty(0, dtype=dtype) for name, dtype in PNL_HISTORY_DTYPES.items()}
+        
+        capacity = len(self._history['timestamp'])
+        n = self._hist_idx
+        if n <= capacity:
+            return {name: values[:n] for name, values in self._history.items()}
+        
+        # Wrapped: the oldest snapshot sits at the write cursor
+        start = n % capacity
+        return {name: np.concatenate([values[start:], values[:start]])
+                for name, values in self._history.items()}
+    
+    @property
+    def pnl_history(self) -> List[Dict]:
+        """Recorded PnL snapshots as a list of dicts, oldest first"""
+        columns = self._history_columns()
+        names = list(columns)
+        return [dict(zip(names, row))
+                for row in zip(*(values.tolist() for values in columns.values()))]
+    
+    def get_history_df(self) -> 'pd.DataFrame':
+        """Recorded PnL snapshots as a DataFrame, oldest first"""
+        import pandas as pd
+        
+        return pd.DataFrame(self._history_columns())
+    
+    def get_drawdown_series(self) -> np.ndarray:
+        """
+        Drawdown of total PnL from its running peak at every recorded snapshot
+        
+        Returns:
+            np.ndarray: Dollar drawdown (>= 0), oldest first
+        """
+        total_pnl = self._history_columns()['total_pnl']
+        return np.maximum.accumulate(total_pnl) - total_pnl
+    
+    def get_sharpe(self, periods_per_year: int = 1) -> float:
+        """
+        Sharpe ratio of the snapshot-to-snapshot portfolio returns
+        
+        Args:
+            periods_per_year: Snapshots per year to annualize (1 = per snapshot)
+        
+        Returns:
+            float: Sharpe ratio (0.0 with fewer than two returns or no variance)
+        """
+        portfolio_value = self._history_columns()['portfolio_value']
+        if len(portfolio_value) < 3:
+            return 0.0
+        
+        returns = np.diff(portfolio_value) / portfolio_value[:-1]
+        std = returns.std(ddof=1)
+        if std == 0:
+            return 0.0
+        
+        return float(np.sqrt(periods_per_year) * returns.mean() / std)
+    
+    def calculate_pnl_fast(self, current_price: float) -> float:
+        """
+        Update PnL without building or recording a snapshot
+        
+        Args:
+            current_price: Current market price
+            
+        Returns:
+            float: Total PnL
+        """
+        self._update_pnl(current_price)
+        return self.total_pnl
+    
+    def _update_pnl(self, current_price: float) -> float:
+        """Refresh total/unrealized/realized PnL and return the portfolio value"""
+        portfolio_value, self.total_pnl, self.unrealized_pnl, self.realized_pnl = _pnl_core(
+            self.cash, self.inventory, self.initial_cash, self.initial_inventory,
+            current_price, self.total_buy_cost, self.total_buy_volume
+        )
+        
+        return portfolio_value
+    
     def get_statistics(self, current_price: float) -> Dict:
         """
         Get comprehensive statistics
         
+        Repeated calls at the same price with no trades in between reuse the
+        previous result (and record no new PnL history snapshot).
+        
         Args:
             current_price: Current market price
             
         Returns:
             dict: Statistics
         """
+        cache_key = (current_price, self._n_trades)
+        if self._stats_cache is not None and self._stats_cache[0] == cache_key:
+            # Re-mark the PnL attributes, which other calls may have moved
+            self._update_pnl(current_price)
+            return dict(self._stats_cache[1])
+        
         pnl = self.calculate_pnl(current_price)
         
         # Calculate returns
         initial_value = self.initial_cash + (self.initial_inventory * current_price)
         total_return_pct = (self.total_pnl / initial_value * 100) if initial_value > 0 else 0
         
-        # Calculate win rate
-        profitable_trades = 0
-        if len(self.trades) >= 2:
-            for i in range(1, len(self.trades)):
-                if self.trades[i]['side'] == 'SELL' and self.trades[i-1]['side'] == 'BUY':
-                    if self.trades[i]['price'] > self.trades[i-1]['price']:
-                        profitable_trades += 1
-        
+        # Win rate: sells directly after a buy at a lower price, counted as recorded
         num_round_trips = min(self.num_buys, self.num_sells)
-        win_rate = (profitable_trades / num_round_trips * 100) if num_round_trips > 0 else 0
+        win_rate = (self._profitable_trades / num_round_trips * 100) if num_round_trips > 0 else 0
         
-        return {
+        stats = {
             'current_price': current_price,
             'portfolio_value': pnl['portfolio_value'],
             'cash': self.cash,
@@ -202,7 +382,7 @@ class PnLTracker:
             'realized_pnl': self.realized_pnl,
             'unrealized_pnl': self.unrealized_pnl,
             'total_return_pct': total_return_pct,
-            'num_trades': len(self.trades),
+            'num_trades': self._n_trades,
             'num_buys': self.num_buys,
             'num_sells': self.num_sells,
             'total_buy_volume': self.total_buy_volume,
@@ -210,6 +390,9 @@ class PnLTracker:
             'total_fees': self.total_fees,
             'win_rate_pct': win_rate
         }
+        self._stats_cache = (cache_key, stats)
+        
+        return dict(stats)
     
     def print_statistics(self, current_price: float):
         """Print PnL statistics"""
@@ -0,0 +1,54 @@
+"""
+Data Processor Dtype Test
+Checks that optimize_dtypes never leaves OHLC prices with mixed precision
+"""
+
+import numpy as np
+import pandas as pd
+
+from config.data_config import FLOAT32_MAX_PRICE
+from src.data.data_processor import DataProcessor, optimize_dtypes
+
+
+def _straddling_frame():
+    """Two 1m bars: the first high is past FLOAT32_MAX_PRICE, the rest are not"""
+    return pd.DataFrame({
+        'open_time': pd.date_range('2024-01-01', periods=2, freq='1min'),
+        'open': [100000.004, 100000.004],
+        'high': [FLOAT32_MAX_PRICE + 10_000.0, 100000.004],
+        'low': [100000.0, 100000.0],
+        'close': [100000.004, 100000.004],
+        'volume': [1.5, 2.5],
+    })
+
+
+def test_straddling_prices_share_one_dtype():
+    """One column past the threshold keeps all OHLC columns float64"""
+    df = optimize_dtypes(_straddling_frame())
+
+    assert {df[col].dtype for col in ['open', 'high', 'low', 'close']} == {np.dtype(np.float64)}
+    assert df['volume'].dtype == np.float32
+
+
+def test_straddling_prices_validate_cleanly():
+    """No spurious open/close outside high/low rows after downcasting"""
+    df = optimize_dtypes(_straddling_frame())
+
+    is_valid, issues = DataProcessor().validate_data(df)
+    assert is_valid, issues
+
+
+def test_prices_below_threshold_downcast():
+    """Frames fully below the threshold still get float32 prices"""
+    df = _straddling_frame()
+    df.loc[0, 'high'] = 100000.004
+    df = optimize_dtypes(df)
+
+    assert {df[col].dtype for col in ['open', 'high', 'low', 'close']} == {np.dtype(np.float32)}
+
+
+if __name__ == "__main__":
+    test_straddling_prices_share_one_dtype()
+    test_straddling_prices_validate_cleanly()
+    test_prices_below_threshold_downcast()
+    print("✅ Data processor dtype tests passed!")
@@ -3,20 +3,19 @@ Comprehensive Market Maker Test
 Tests market maker with balanced order flow
 """
 
-import sys
-from pathlib import Path
+import logging
 import time
 
-# Add project root to path
-project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
-
+# The script's directory (the project root) is on sys.path when run
+# directly, so the src package imports without path manipulation
 from src.orderbook.orderbook import OrderBook
 from src.orderbook.matching_engine import MatchingEngine
 from src.strategies.market_maker import MarketMakerStrategy
 from src.orderbook.order import create_limit_order
 import numpy as np
 
+logger = logging.getLogger(__name__)
+
 
 def run_balanced_test():
     """Run market maker with balanced simulated order flow"""
@@ -60,6 +59,11 @@ def run_balanced_test():
     print("   (Simulating aggressive traders hitting both sides)")
     
     num_ticks = 300  # 30 seconds
+    rng = np.random.default_rng()
+    
+    # Draw every aggressor's side and size up front (only every 10th tick is used)
+    aggressor_is_buy = rng.random(num_ticks) < 0.5
+    aggressor_qty = rng.uniform(0.05, 0.15, num_ticks)
     start_time = time.time()
     
     for tick in range(num_ticks):
@@ -70,46 +74,41 @@ def run_balanced_test():
         # Simulate random aggressive orders (balanced)
         if tick % 10 == 0:  # Every 1 second
             # 50/50 chance of buy or sell aggressor
-            is_buy = np.random.random() < 0.5
+            is_buy = aggressor_is_buy[tick]
             
             if is_buy:
                 # Aggressive buyer - will hit market maker's ask
                 best_ask = orderbook.best_ask
                 if best_ask:
-                    qty = np.random.uniform(0.05, 0.15)
+                    qty = float(aggressor_qty[tick])
                     aggressive_price = best_ask * 1.001  # Cross spread
                     report = engine.submit_limit_order(
                         "BUY", aggressive_price, qty, f"AGGRESSOR_BUY_{tick}"
                     )
                     
                     # Process trades
-                    for trade in orderbook.trades[-5:]:
-                        if trade.get('seller') == 'MarketMaker':
-                            mm_strategy.on_trade(trade)
+                    mm_strategy.process_new_trades()
             else:
                 # Aggressive seller - will hit market maker's bid
                 best_bid = orderbook.best_bid
                 if best_bid:
-                    qty = np.random.uniform(0.05, 0.15)
+                    qty = float(aggressor_qty[tick])
                     aggressive_price = best_bid * 0.999  # Cross spread
                     report = engine.submit_limit_order(
                         "SELL", aggressive_price, qty, f"AGGRESSOR_SELL_{tick}"
                     )
                     
                     # Process trades
-                    for trade in orderbook.trades[-5:]:
-                        if trade.get('buyer') == 'MarketMaker':
-                            mm_strategy.on_trade(trade)
+                    mm_strategy.process_new_trades()
         
-        # Progress update
-        if tick % 50 == 0 and tick > 0:
+        # Progress update (skipped entirely unless INFO logging is enabled)
+        if tick % 50 == 0 and tick > 0 and logger.isEnabledFor(logging.INFO):
             elapsed = time.time() - start_time
             progress = (tick / num_ticks) * 100
             mid = orderbook.mid_price or initial_price
-            print(f"  [{elapsed:.1f}s] Progress: {progress:.0f}% | "
-                  f"Mid: ${mid:.2f} | "
-                  f"Trades: {mm_strategy.trades_executed} | "
-                  f"Inventory: {mm_strategy.inventory_manager.current_inventory:.2f}")
+            logger.info("  [%.1fs] Progress: %.0f%% | Mid: $%.2f | Trades: %d | Inventory: %.2f",
+                        elapsed, progress, mid, mm_strategy.trades_executed,
+                        mm_strategy.inventory_manager.current_inventory)
     
     # Stop strategy
     mm_strategy.stop()
@@ -147,4 +146,5 @@ def run_balanced_test():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     run_balanced_test()
\ No newline at end of file
@@ -0,0 +1,61 @@
+"""
+Matching Engine Depth Walk Test
+Checks that every depth-walk backend reports the same market impact
+"""
+
+import numpy as np
+
+from src.orderbook.matching_engine import (
+    _walk_levels,
+    _walk_levels_py,
+    _walk_levels_vectorized,
+)
+
+
+PRICES = np.array([50000.01, 50000.02, 50000.05], dtype=np.float64)
+QTYS = np.array([0.5, 1.0, 2.0], dtype=np.float64)
+
+# Zero and negative sizes, a partial level, an exact level boundary,
+# and an order larger than the whole book
+QUANTITIES = [0.0, -1.0, 0.2, 1.5, 2.0, 5.0]
+
+
+def _backends():
+    backends = [_walk_levels_py, _walk_levels_vectorized]
+    if _walk_levels is not None:
+        backends.append(_walk_levels)
+    return backends
+
+
+def test_walk_backends_agree():
+    """Python, NumPy and numba walkers return the same cost, levels and remainder"""
+    for quantity in QUANTITIES:
+        expected = _walk_levels_py(PRICES, QTYS, quantity)
+        for walk in _backends():
+            cost, levels, remaining = walk(PRICES, QTYS, quantity)
+            assert levels == expected[1], (walk.__name__, quantity, levels)
+            assert np.isclose(cost, expected[0]), (walk.__name__, quantity, cost)
+            assert np.isclose(remaining, expected[2]), (walk.__name__, quantity, remaining)
+
+
+def test_non_positive_quantity_consumes_no_levels():
+    """An empty or negative order walks zero levels on every backend"""
+    for walk in _backends():
+        for quantity in (0.0, -1.0):
+            cost, levels, remaining = walk(PRICES, QTYS, quantity)
+            assert (cost, levels, remaining) == (0.0, 0, quantity)
+
+
+def test_empty_book():
+    """Walking an empty side leaves the whole order unfilled"""
+    empty = np.array([], dtype=np.float64)
+    for walk in _backends():
+        cost, levels, remaining = walk(empty, empty, 1.0)
+        assert (cost, levels, remaining) == (0.0, 0, 1.0)
+
+
+if __name__ == "__main__":
+    test_walk_backends_agree()
+    test_non_positive_quantity_consumes_no_levels()
+    test_empty_book()
+    print("✅ Matching engine depth walk tests passed!")
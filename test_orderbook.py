@@ -0,0 +1,72 @@
+"""
+Order Book Tick Rounding Test
+Checks that off-grid limit prices never rest or trade past their limit
+"""
+
+from src.orderbook.orderbook import OrderBook
+from src.orderbook.order import create_limit_order
+
+
+def test_off_grid_sell_does_not_trade_below_limit():
+    """A sell at 50000.004 must not fill a buy at 50000.001"""
+    book = OrderBook("BTCUSDT")
+    book.add_order(create_limit_order("SELL", 50000.004, 1.0, "SELLER"))
+
+    # The ask rests on the next whole cent, never below its limit
+    assert book.best_ask == 50000.01
+
+    trades = book.add_order(create_limit_order("BUY", 50000.001, 1.0, "BUYER"))
+    assert trades == []
+    assert book.best_bid == 50000.00
+
+
+def test_off_grid_buy_does_not_trade_above_limit():
+    """A buy at 49999.996 must not fill a sell at 49999.999"""
+    book = OrderBook("BTCUSDT")
+    book.add_order(create_limit_order("BUY", 49999.996, 1.0, "BUYER"))
+
+    # The bid rests on the previous whole cent, never above its limit
+    assert book.best_bid == 49999.99
+
+    trades = book.add_order(create_limit_order("SELL", 49999.999, 1.0, "SELLER"))
+    assert trades == []
+    assert book.best_ask == 50000.00
+
+
+def test_off_grid_batch_matches_sequential():
+    """add_orders_batch rounds off-grid limits the same way as add_order"""
+    sides = ["SELL", "BUY", "BUY", "SELL"]
+    prices = [50000.004, 50000.001, 49999.996, 50000.002]
+    quantities = [1.0, 1.0, 1.0, 1.0]
+    trader_ids = ["S1", "B1", "B2", "S2"]
+
+    sequential = OrderBook("BTCUSDT")
+    for side, price, quantity, trader_id in zip(sides, prices, quantities, trader_ids):
+        assert sequential.add_order(create_limit_order(side, price, quantity, trader_id)) == []
+
+    batched = OrderBook("BTCUSDT")
+    _, trades = batched.add_orders_batch(sides, prices, quantities, trader_ids)
+    assert all(not order_trades for order_trades in trades)
+    assert batched.snapshot() == sequential.snapshot()
+
+
+def test_on_grid_price_keeps_its_tick():
+    """Float noise on an on-grid price does not move it off its tick"""
+    book = OrderBook("BTCUSDT")
+    book.add_order(create_limit_order("BUY", 50000.01, 1.0, "BUYER"))
+    book.add_order(create_limit_order("SELL", 50000.03, 1.0, "SELLER"))
+
+    assert book.best_bid == 50000.01
+    assert book.best_ask == 50000.03
+
+    trades = book.add_order(create_limit_order("BUY", 50000.03, 0.5, "TAKER"))
+    assert len(trades) == 1
+    assert trades[0]['price'] == 50000.03
+
+
+if __name__ == "__main__":
+    test_off_grid_sell_does_not_trade_below_limit()
+    test_off_grid_buy_does_not_trade_above_limit()
+    test_off_grid_batch_matches_sequential()
+    test_on_grid_price_keeps_its_tick()
+    print("✅ Order book tick rounding tests passed!")
@@ -11,15 +11,15 @@ def view_latest_data():
     
     data_dir = Path("data/raw")
     
-    # Get all CSV files
-    csv_files = list(data_dir.glob("*.csv"))
+    # Get all data files
+    data_files = [*data_dir.glob("*.csv"), *data_dir.glob("*.parquet")]
     
-    if not csv_files:
+    if not data_files:
         print("❌ No data files found in data/raw/")
         return
     
     # Get most recent file
-    latest_file = max(csv_files, key=os.path.getctime)
+    latest_file = max(data_files, key=os.path.getctime)
     
     print("="*70)
     print("DATA VIEWER - LATEST DOWNLOADED DATA")
@@ -28,9 +28,12 @@ def view_latest_data():
     print(f"📅 Modified: {pd.to_datetime(os.path.getmtime(latest_file), unit='s')}")
     
     # Load data
-    df = pd.read_csv(latest_file)
-    df['open_time'] = pd.to_datetime(df['open_time'])
-    df['close_time'] = pd.to_datetime(df['close_time'])
+    if latest_file.suffix == '.parquet':
+        df = pd.read_parquet(latest_file)
+    else:
+        df = pd.read_csv(latest_file)
+        df['open_time'] = pd.to_datetime(df['open_time'])
+        df['close_time'] = pd.to_datetime(df['close_time'])
     
     print(f"\n📊 Data Shape: {df.shape[0]} rows × {df.shape[1]} columns")
     print(f"📅 Date Range: {df['open_time'].min()} to {df['open_time'].max()}")